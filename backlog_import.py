@@ -0,0 +1,251 @@
+"""Streaming import of backlog and task exports (CSV, JSONL, Parquet) into the project store.
+
+    python backlog_import.py jira_export.csv --kind backlog --map "Issue key=Story ID" --map "Summary=Description"
+"""
+import argparse
+import itertools
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import IO, Callable, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from context_builder import PRIORITY_ORDER, STATUS_ORDER
+from project_store import ProjectStore, get_project_store
+
+DEFAULT_CHUNK_ROWS = 50_000
+
+# Target columns per kind, as shown in the app, with the export headers commonly used for each
+SCHEMAS: Dict[str, Dict[str, List[str]]] = {
+    "backlog": {
+        "Story ID": ["story id", "story_id", "issue key", "key", "id"],
+        "Description": ["description", "summary", "title"],
+        "Priority": ["priority"],
+        "Story Points": ["story points", "story_points", "points", "estimate", "story point estimate"],
+    },
+    "tasks": {
+        "Task ID": ["task id", "task_id", "issue key", "key", "id"],
+        "Description": ["description", "summary", "title"],
+        "Status": ["status", "state"],
+        "Assignee": ["assignee", "owner", "assigned to"],
+        "Story Points": ["story points", "story_points", "points", "estimate", "story point estimate"],
+    },
+}
+_TABLES = {"backlog": "backlog", "tasks": "tasks"}
+# The primary key of each kind; rows without one cannot be stored
+_KEYS = {list(schema)[0] for schema in SCHEMAS.values()}
+# Categorical columns and the canonical values their spellings are folded onto, so ranking by
+# PRIORITY_ORDER/STATUS_ORDER works for imported rows; unrecognized values are kept as they are
+_CATEGORIES: Dict[str, Dict[str, str]] = {
+    "Priority": {
+        **{value.lower(): value for value in PRIORITY_ORDER},
+        "highest": "High", "critical": "High", "blocker": "High", "lowest": "Low", "trivial": "Low", "minor": "Low",
+    },
+    "Status": {
+        **{value.lower(): value for value in STATUS_ORDER},
+        "open": "To Do", "new": "To Do", "backlog": "To Do", "selected for development": "To Do",
+        "code review": "In Review", "review": "In Review", "closed": "Done", "resolved": "Done",
+    },
+}
+
+Source = Union[str, IO]
+
+
+@dataclass
+class ImportReport:
+    kind: str
+    rows: int
+    chunks: int
+    seconds: float
+    # Peak resident set size of the process; None where the resource module is unavailable
+    peak_rss_mb: Optional[float]
+    # Rows dropped because their key column was empty
+    skipped_rows: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        rss = f", peak RSS {self.peak_rss_mb:.0f} MB" if self.peak_rss_mb is not None else ""
+        skipped = f"; skipped {self.skipped_rows:,} rows without an ID" if self.skipped_rows else ""
+        return (f"Imported {self.rows:,} {self.kind} rows in {self.chunks} chunks, {self.seconds:.1f}s "
+                f"({self.rows_per_second:,.0f} rows/s{rss}){skipped}")
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def detect_format(name: str) -> str:
+    lowered = name.lower()
+    for suffix in (".gz", ".bz2", ".zip", ".xz"):
+        if lowered.endswith(suffix):
+            lowered = lowered[:-len(suffix)]
+    if lowered.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    if lowered.endswith((".parquet", ".pq")):
+        return "parquet"
+    return "csv"
+
+
+def resolve_columns(headers: List[str], kind: str, column_map: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Source header -> target column. Explicit mappings win over the built-in aliases."""
+    schema = SCHEMAS[kind]
+    resolved = {source: target for source, target in (column_map or {}).items() if source in headers and target in schema}
+    by_name = {header.strip().lower(): header for header in headers}
+    for target, aliases in schema.items():
+        if target in resolved.values():
+            continue
+        for alias in [target.lower(), *aliases]:
+            header = by_name.get(alias)
+            if header is not None and header not in resolved:
+                resolved[header] = target
+                break
+    if list(schema)[0] not in resolved.values():
+        raise ValueError(f"No column found for '{list(schema)[0]}' in {headers}. Pass a mapping such as --map 'Key={list(schema)[0]}'.")
+    return resolved
+
+
+def compact_chunk(chunk: pd.DataFrame, columns: Dict[str, str]) -> pd.DataFrame:
+    """Rename a raw chunk onto the target schema with categorical and small-integer dtypes.
+
+    Rows with an empty key column are dropped; their count is in frame.attrs["skipped_rows"].
+    """
+    frame = chunk[list(columns)].rename(columns=columns)
+    key = next(column for column in frame.columns if column in _KEYS)
+    keys = frame[key].astype("string").str.strip()
+    has_key = (keys.notna() & (keys != "")).to_numpy(dtype=bool)
+    frame = frame[has_key].assign(**{key: keys[has_key]})
+    for column in frame.columns:
+        if column in _CATEGORIES:
+            values = frame[column].astype("string").str.strip()
+            frame[column] = values.str.lower().map(_CATEGORIES[column]).fillna(values).astype("category")
+        elif column == "Story Points":
+            points = pd.to_numeric(frame[column], errors="coerce").round()
+            largest = points.abs().max()
+            frame[column] = points.astype("Int8" if pd.isna(largest) or largest <= 127 else "Int16" if largest <= 32767 else "Int32")
+        else:
+            frame[column] = frame[column].astype("string")
+    frame.attrs["skipped_rows"] = int((~has_key).sum())
+    return frame
+
+
+def _csv_chunks(source: Source, chunk_rows: int, wanted: Callable[[str], bool]) -> Iterator[pd.DataFrame]:
+    # usecols projects at parse time, so unmapped columns are never materialized
+    yield from pd.read_csv(source, chunksize=chunk_rows, usecols=wanted, dtype=str, keep_default_na=False, na_values=[""])
+
+
+def _jsonl_chunks(source: Source, chunk_rows: int, wanted: Callable[[str], bool]) -> Iterator[pd.DataFrame]:
+    for chunk in pd.read_json(source, lines=True, chunksize=chunk_rows, dtype=False):
+        yield chunk[[c for c in chunk.columns if wanted(c)]]
+
+
+def _parquet_chunks(source: Source, chunk_rows: int, wanted: Callable[[str], bool]) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet imports need pyarrow: `pip install pyarrow`") from e
+    parquet = pq.ParquetFile(source)
+    columns = [name for name in parquet.schema_arrow.names if wanted(name)]
+    for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns):
+        yield batch.to_pandas()
+
+
+def _headers(source: Source, file_format: str) -> List[str]:
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        return list(pq.ParquetFile(source).schema_arrow.names)
+    if file_format == "jsonl":
+        if isinstance(source, str):
+            with pd.read_json(source, lines=True, chunksize=100, dtype=False) as reader:
+                return list(next(iter(reader)).columns)
+        # pandas closes buffers it reads JSON from, so peek at the first record directly
+        headers = list(json.loads(source.readline()))
+    else:
+        headers = list(pd.read_csv(source, nrows=0).columns)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return headers
+
+
+def iter_chunks(source: Source, kind: str, file_format: Optional[str] = None, column_map: Optional[Dict[str, str]] = None,
+                chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Compact DataFrame chunks of the export; at most chunk_rows rows are in memory at once."""
+    if kind not in SCHEMAS:
+        raise ValueError(f"Unknown import kind '{kind}'. Expected one of {sorted(SCHEMAS)}.")
+    file_format = file_format or detect_format(source if isinstance(source, str) else getattr(source, "name", ""))
+    columns = resolve_columns(_headers(source, file_format), kind, column_map)
+    readers = {"csv": _csv_chunks, "jsonl": _jsonl_chunks, "parquet": _parquet_chunks}
+    for chunk in readers[file_format](source, chunk_rows, lambda name: name in columns):
+        yield compact_chunk(chunk, columns)
+
+
+def import_file(source: Source, kind: str, store: Optional[ProjectStore] = None, file_format: Optional[str] = None,
+                column_map: Optional[Dict[str, str]] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                replace: bool = False, on_progress: Optional[Callable[[int], None]] = None) -> ImportReport:
+    """Stream an export into the project store chunk by chunk."""
+    store = store or get_project_store()
+    started = time.perf_counter()
+    chunk_iter = iter_chunks(source, kind, file_format, column_map, chunk_rows)
+    # Resolving the columns and parsing the first chunk happen before the clear,
+    # so a file with the wrong headers raises without wiping the table
+    first = next(chunk_iter, None)
+    if replace:
+        store.clear(_TABLES[kind])
+    rows = chunks = skipped = 0
+    for chunk in itertools.chain([first] if first is not None else [], chunk_iter):
+        rows += store.bulk_insert(_TABLES[kind], chunk)
+        skipped += chunk.attrs.get("skipped_rows", 0)
+        chunks += 1
+        if on_progress is not None:
+            on_progress(rows)
+    return ImportReport(kind=kind, rows=rows, chunks=chunks, seconds=time.perf_counter() - started,
+                        peak_rss_mb=peak_rss_mb(), skipped_rows=skipped)
+
+
+def _parse_mapping(pairs: List[str]) -> Dict[str, str]:
+    mapping = {}
+    for pair in pairs:
+        source, sep, target = pair.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Expected SOURCE=TARGET, got '{pair}'")
+        mapping[source.strip()] = target.strip()
+    return mapping
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Stream a backlog or task export into the project store.")
+    parser.add_argument("path", help="CSV, JSONL or Parquet file (CSV and JSONL may be compressed)")
+    parser.add_argument("--kind", choices=sorted(SCHEMAS), default="backlog")
+    parser.add_argument("--format", choices=["csv", "jsonl", "parquet"], help="defaults to the file extension")
+    parser.add_argument("--map", action="append", default=[], metavar="SOURCE=TARGET",
+                        help="map an export column onto a target column, e.g. 'Issue key=Story ID'")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--replace", action="store_true", help="delete the existing rows first")
+    parser.add_argument("--db", help="project database (defaults to SCRUM_AGENT_PROJECT_PATH or ~/.scrum_agent/project.sqlite3)")
+    args = parser.parse_args(argv)
+
+    store = ProjectStore(args.db) if args.db else get_project_store()
+    if args.db and not store.persistent:
+        print(f"Cannot open {args.db}", file=sys.stderr)
+        return 1
+    report = import_file(args.path, args.kind, store=store, file_format=args.format, column_map=_parse_mapping(args.map),
+                         chunk_rows=args.chunk_rows, replace=args.replace,
+                         on_progress=lambda rows: print(f"\r{rows:,} rows", end="", file=sys.stderr, flush=True))
+    print(file=sys.stderr)
+    print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
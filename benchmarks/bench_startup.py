@@ -0,0 +1,92 @@
+"""Cold-start benchmark for the Streamlit app.
+
+Measures, each in a fresh interpreter so nothing is warm:
+
+* import: importing scrum_agent_v1 (what every new server process pays)
+* first_run: the first full script run of a session, via Streamlit's AppTest
+* rerun: a second full run in the same session (shared agent, warm caches)
+
+Runs against the stub backend by default so no API key or network is
+needed. --backend gemini exercises the Gemini startup path; any
+GEMINI_API_KEY works since startup sends no request. Pass
+--max-import-ms / --max-first-run-ms to fail (exit 1) when a median
+exceeds the budget, e.g. in CI.
+
+    python benchmarks/bench_startup.py --runs 5 --max-import-ms 2500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import scrum_agent_v1
+print((time.perf_counter() - started) * 1000)
+"""
+
+_APP_SNIPPET = """
+import time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("scrum_agent_v1.py", default_timeout=120)
+started = time.perf_counter()
+app.run()
+first_run = (time.perf_counter() - started) * 1000
+started = time.perf_counter()
+app.run()
+rerun = (time.perf_counter() - started) * 1000
+if app.exception:
+    raise SystemExit(f"app raised: {app.exception[0].value}")
+print(first_run, rerun)
+"""
+
+
+def _run_snippet(snippet: str, backend: str) -> list:
+    # Empty paths keep every store in memory, so runs never touch the user's data
+    env = dict(os.environ, LLM_BACKEND=backend, SCRUM_AGENT_CACHE_PATH="", SCRUM_AGENT_IMPEDIMENT_INDEX_PATH="",
+               SCRUM_AGENT_PROJECT_PATH="")
+    result = subprocess.run([sys.executable, "-c", snippet], cwd=REPO_ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    # Streamlit logs to stderr, so stdout holds only the timings
+    return [float(value) for value in result.stdout.split()]
+
+
+def measure(runs: int, backend: str = "stub") -> dict:
+    imports, first_runs, reruns = [], [], []
+    for _ in range(runs):
+        imports.extend(_run_snippet(_IMPORT_SNIPPET, backend))
+        first_run, rerun = _run_snippet(_APP_SNIPPET, backend)
+        first_runs.append(first_run)
+        reruns.append(rerun)
+    return {name: {"median_ms": round(statistics.median(samples), 1), "min_ms": round(min(samples), 1), "runs": len(samples)}
+            for name, samples in (("import", imports), ("first_run", first_runs), ("rerun", reruns))}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--backend", default="stub", choices=["stub", "gemini", "openai"], help="LLM_BACKEND to start the app with")
+    parser.add_argument("--max-import-ms", type=float, help="fail when the median import time exceeds this")
+    parser.add_argument("--max-first-run-ms", type=float, help="fail when the median first run exceeds this")
+    args = parser.parse_args(argv)
+
+    results = measure(args.runs, args.backend)
+    print(json.dumps(results, indent=2))
+
+    failures = []
+    if args.max_import_ms is not None and results["import"]["median_ms"] > args.max_import_ms:
+        failures.append(f"import {results['import']['median_ms']} ms > {args.max_import_ms} ms")
+    if args.max_first_run_ms is not None and results["first_run"]["median_ms"] > args.max_first_run_ms:
+        failures.append(f"first run {results['first_run']['median_ms']} ms > {args.max_first_run_ms} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+"""Offline benchmark suite for the agent, context assembly and charts.
+
+Groups (--only picks a comma-separated subset):
+
+* prompts: the prompt builder behind each ScrumMasterAgent method
+* context: the Tracker tab's recommendation context over a large synthetic
+  project store (build_tracker_context)
+* charts: every chart builder plus the figure's JSON serialization, which
+  is what st.plotly_chart pays on a cache miss, and the size of that JSON
+  (payload_bytes)
+* agent: uncached end-to-end agent calls against the stub backend at
+  several concurrency levels (throughput and latency percentiles)
+* team: whole-team standup fan-out for growing team sizes
+
+Everything runs against the stub backend with fixed seeds, so no API key
+or network is needed. Timings depend on the machine: record a baseline on
+the machine that will run the comparison, then compare later runs with it.
+
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --baseline benchmarks/baseline.json --threshold 0.2
+
+A comparison exits 1 when a time, p95 latency or chart payload rises, or a
+throughput falls, by more than the threshold. Timing benchmarks are compared on their
+fastest sample (min_ms), which other load on the machine disturbs least;
+on small shared VMs expect 30-50% swings and raise --threshold to match.
+"""
+import argparse
+import dataclasses
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+GROUPS = ("prompts", "context", "charts", "agent", "team")
+# Result fields compared against a baseline, and whether larger is better
+COMPARED_FIELDS = {"min_ms": False, "p95_ms": False, "throughput_rps": True, "payload_bytes": False}
+# Differences smaller than this are timer noise, whatever the ratio
+MIN_DELTA_MS = 0.001
+
+
+def _sizes(quick: bool) -> Dict[str, int]:
+    scale = 10 if quick else 1
+    return {
+        "backlog_rows": 100_000 // scale,
+        "task_rows": 50_000 // scale,
+        "update_rows": 10_000 // scale,
+        "feedback_items": 500 // scale,
+        "velocity_sprints": 1_000 // scale,
+        "burndown_days": 5_000 // scale,
+        "workload_tasks": 100_000 // scale,
+        "agent_requests": 256 // scale,
+    }
+
+
+def time_call(fn: Callable[[], object], repeat: int, min_sample_seconds: float = 0.05) -> Dict[str, float]:
+    """Per-call time like timeit: each sample loops fn until it takes min_sample_seconds."""
+    fn()
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_sample_seconds or number >= 1 << 20:
+            break
+        number *= 2
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number)
+    return {"median_ms": round(statistics.median(samples) * 1000, 6), "min_ms": round(min(samples) * 1000, 6),
+            "runs": len(samples), "loops": number}
+
+
+def _percentile_ms(samples: List[float], q: float) -> float:
+    return round(float(np.percentile(samples, q)) * 1000, 2)
+
+
+def _sample_sprint(team_size: int = 5, impediments: int = 3):
+    from scrum_master_agent import SprintData
+    now = datetime(2025, 1, 13, 12)
+    return SprintData(
+        sprint_number=7,
+        start_date=now - timedelta(days=7),
+        end_date=now + timedelta(days=7),
+        total_story_points=50,
+        completed_story_points=30,
+        team_members=[f"Member {i}" for i in range(team_size)],
+        impediments=[f"Impediment {i}: test environment unavailable" for i in range(impediments)],
+        risks=["Key developer on vacation next week", "Unclear requirements for user story #23"],
+    )
+
+
+def _forecasts(sprint_data, velocities):
+    from forecasting import forecast_backlog, forecast_sprint
+    return (forecast_sprint(velocities, sprint_data.total_story_points, sprint_data.completed_story_points, 7, 14),
+            forecast_backlog(velocities, 400, sprint_data.end_date, 14))
+
+
+def _stub_agent(latency_ms: float):
+    from impediment_index import ImpedimentIndex
+    from llm_backends import StubBackend
+    from response_cache import ResponseCache
+    from scrum_master_agent import ScrumMasterAgent
+    from single_flight import SingleFlight
+    # Memory-only cache and index, so runs neither read nor pollute the app's files
+    return ScrumMasterAgent(backend=StubBackend(latency=latency_ms / 1000, seed=0), cache=ResponseCache(path=None),
+                            single_flight=SingleFlight(), impediment_index=ImpedimentIndex(path=None))
+
+
+def _synthetic_store(sizes: Dict[str, int]):
+    from project_store import ProjectStore
+    rng = np.random.default_rng(0)
+    store = ProjectStore(None)
+    n = sizes["backlog_rows"]
+    store.bulk_insert("backlog", pd.DataFrame({
+        "Story ID": [f"ST-{i}" for i in range(n)],
+        "Description": [f"As a user, I want capability {i} so that workflow {i % 97} is faster" for i in range(n)],
+        "Priority": rng.choice(["High", "Medium", "Low"], n),
+        "Story Points": rng.choice([1, 2, 3, 5, 8, 13], n),
+    }))
+    n = sizes["task_rows"]
+    store.bulk_insert("tasks", pd.DataFrame({
+        "Task ID": [f"TASK-{i}" for i in range(n)],
+        "Description": [f"Implement part {i} of feature {i % 211}" for i in range(n)],
+        "Status": rng.choice(["To Do", "In Progress", "In Review", "Blocked", "Done"], n),
+        "Assignee": rng.choice([f"Member {i}" for i in range(20)], n),
+        "Story Points": rng.choice([1, 2, 3, 5, 8], n),
+    }))
+    n = sizes["update_rows"]
+    store.bulk_insert("updates", pd.DataFrame({
+        "Team Member": rng.choice([f"Member {i}" for i in range(20)], n),
+        "Update": [f"Worked on TASK-{i}; next up review of TASK-{i + 1}" for i in range(n)],
+        "Timestamp": pd.Timestamp("2025-01-01") + pd.to_timedelta(np.arange(n), unit="min"),
+    }))
+    return store
+
+
+# Groups: each returns benchmark name -> result
+
+def bench_prompts(sizes: Dict[str, int], repeat: int, latency_ms: float) -> Dict[str, Dict]:
+    from context_builder import format_sprint_summary
+    agent = _stub_agent(0)
+    sprint_data = _sample_sprint()
+    forecast, backlog_forecast = _forecasts(sprint_data, [42, 47, 45, 50, 48])
+    feedback = [f"Code reviews take too long ({i % 40})" if i % 3 else f"Standups run over time, item {i % 25}"
+                for i in range(sizes["feedback_items"])]
+    context = format_sprint_summary(sprint_data)
+    sections = ["sprint_health", "recommendations"] + [f"impediment:{i}" for i in sprint_data.impediments]
+    return {
+        "prompt.standup_questions": time_call(lambda: agent._standup_prompt("Alice", "Finished feature X"), repeat),
+        "prompt.sprint_health": time_call(lambda: agent._sprint_health_prompt(sprint_data, forecast, backlog_forecast), repeat),
+        "prompt.retrospective_insights": time_call(lambda: agent._retrospective_prompt(feedback), repeat),
+        "prompt.impediment_resolution": time_call(lambda: agent._impediment_prompt(sprint_data.impediments[0], "Blocking QA"), repeat),
+        "prompt.recommendations": time_call(lambda: agent._recommendations_prompt(context), repeat),
+        "prompt.sprint_briefing": time_call(lambda: agent._briefing_prompt(sprint_data, context, sections, sprint_data.impediments,
+                                                                           forecast, backlog_forecast), repeat),
+    }
+
+
+def bench_context(sizes: Dict[str, int], repeat: int, latency_ms: float) -> Dict[str, Dict]:
+    from context_builder import build_tracker_context
+    store = _synthetic_store(sizes)
+    sprint_data = _sample_sprint()
+    return {f"context.tracker_{budget}": time_call(lambda: build_tracker_context(store, sprint_data, budget), repeat)
+            for budget in (1000, 3000, 12000)}
+
+
+def bench_charts(sizes: Dict[str, int], repeat: int, latency_ms: float) -> Dict[str, Dict]:
+    import logging
+    # The app module is imported outside `streamlit run`; its bare-mode warnings are expected
+    logging.disable(logging.WARNING)
+    try:
+        import scrum_agent_v1 as app
+    finally:
+        logging.disable(logging.NOTSET)
+    from burndown import BurndownEngine, sample_burndown_events
+    from chart_data import payload_bytes
+    from workload import WorkloadEngine
+    sprint_data = _sample_sprint()
+    burndown = BurndownEngine()
+    burndown.append(sample_burndown_events(sprint_data))
+    history = pd.DataFrame({"Sprint": ["Sprint 1", "Sprint 2", "Sprint 3", "Sprint 4", "Sprint 5"],
+                            "Planned": [45, 50, 48, 52, 50], "Completed": [42, 47, 45, 50, 48]})
+    forecast, backlog_forecast = _forecasts(sprint_data, history["Completed"].to_numpy())
+    rng = np.random.default_rng(0)
+    n = sizes["velocity_sprints"]
+    long_history = pd.DataFrame({"Sprint": [f"Sprint {i + 1}" for i in range(n)],
+                                 "Planned": rng.integers(40, 60, n), "Completed": rng.integers(30, 60, n)})
+    # A story created every morning and the previous day's story completed every evening
+    n = sizes["burndown_days"]
+    long_sprint = dataclasses.replace(sprint_data, start_date=sprint_data.end_date - timedelta(days=n - 1))
+    mornings = pd.Timestamp(long_sprint.start_date).normalize() + pd.to_timedelta(np.arange(n), unit="D") + pd.Timedelta(hours=9)
+    long_burndown = BurndownEngine()
+    long_burndown.append(pd.concat([
+        pd.DataFrame({"timestamp": mornings, "sprint": long_sprint.sprint_number, "story_id": [f"LS-{i}" for i in range(n)],
+                      "event": "created", "points": rng.choice([1, 2, 3, 5, 8], n).astype("float64")}),
+        pd.DataFrame({"timestamp": mornings[1:] + pd.Timedelta(hours=8), "sprint": long_sprint.sprint_number,
+                      "story_id": [f"LS-{i}" for i in range(n - 1)], "event": "completed", "points": np.nan}),
+    ]))
+    n = sizes["workload_tasks"]
+    engine = WorkloadEngine()
+    engine.upsert_tasks(pd.DataFrame({
+        "task_id": [f"T-{i}" for i in range(n)],
+        "assignee": rng.choice(sprint_data.team_members, n),
+        "status": rng.choice(["To Do", "In Progress", "In Review", "Done"], n),
+        "story_points": rng.integers(1, 9, n),
+    }))
+    engine.add_time_logs(pd.DataFrame({"member": sprint_data.team_members, "hours": [8, 6, 9, 7, 5],
+                                       "logged_at": [sprint_data.start_date + timedelta(days=1)] * 5}))
+    workload = engine.summary(sprint_data.team_members, sprint_data.start_date, sprint_data.start_date + timedelta(days=5))
+
+    builders = {
+        "chart.burndown": lambda: app.create_burndown_chart(sprint_data, burndown),
+        "chart.burndown_long_history": lambda: app.create_burndown_chart(long_sprint, long_burndown),
+        "chart.velocity": lambda: app.create_velocity_chart(history, forecast, backlog_forecast),
+        "chart.velocity_long_history": lambda: app.create_velocity_chart(long_history, forecast, backlog_forecast),
+        "chart.team_workload": lambda: app.create_team_workload_chart(workload),
+        "chart.story_points": lambda: app.create_story_points_chart(30, 50),
+        "chart.risk_assessment": app.create_risk_assessment_chart,
+        "chart.team_satisfaction": app.create_team_satisfaction_chart,
+    }
+    return {name: {**time_call(lambda build=build: build().to_json(), repeat), "payload_bytes": payload_bytes(build())}
+            for name, build in builders.items()}
+
+
+def _run_concurrent(calls: List[Callable[[], str]], concurrency: int) -> Dict:
+    latencies = []
+
+    def timed(call):
+        started = time.perf_counter()
+        result = call()
+        latencies.append(time.perf_counter() - started)
+        return result
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed, calls))
+    elapsed = time.perf_counter() - started
+    errors = sum(result.startswith("Error ") for result in results)
+    return {"requests": len(calls), "errors": errors, "throughput_rps": round(len(calls) / elapsed, 1),
+            "p50_ms": _percentile_ms(latencies, 50), "p95_ms": _percentile_ms(latencies, 95)}
+
+
+def bench_agent(sizes: Dict[str, int], repeat: int, latency_ms: float) -> Dict[str, Dict]:
+    results = {}
+    requests = sizes["agent_requests"]
+    for concurrency in (1, 8, 32):
+        # Fewer requests at low concurrency keep the serial case short
+        count = min(requests, max(16, concurrency * 8))
+        agent = _stub_agent(latency_ms)
+        # Unique members so every call misses the cache and reaches the backend
+        calls = [lambda i=i: agent.generate_daily_standup_questions(f"Member {i}", "Finished feature X")
+                 for i in range(count)]
+        results[f"agent.standup_c{concurrency}"] = _run_concurrent(calls, concurrency)
+    agent = _stub_agent(latency_ms)
+    agent.generate_daily_standup_questions("Alice", "Finished feature X")
+    results["agent.standup_cached"] = time_call(lambda: agent.generate_daily_standup_questions("Alice", "Finished feature X"), repeat)
+    return results
+
+
+def bench_team(sizes: Dict[str, int], repeat: int, latency_ms: float) -> Dict[str, Dict]:
+    results = {}
+    for team_size in (5, 20, 50):
+        for max_concurrency in (4, 8):
+            agent = _stub_agent(latency_ms)
+            members = [f"Member {i}" for i in range(team_size)]
+            started = time.perf_counter()
+            answered = sum(1 for _ in agent.generate_team_standup_questions(members, "Finished feature X",
+                                                                            max_concurrency=max_concurrency))
+            elapsed = time.perf_counter() - started
+            results[f"team.standup_{team_size}_members_c{max_concurrency}"] = {
+                "median_ms": round(elapsed * 1000, 2), "throughput_rps": round(answered / elapsed, 1), "runs": 1}
+    return results
+
+
+BENCHMARKS = {"prompts": bench_prompts, "context": bench_context, "charts": bench_charts, "agent": bench_agent, "team": bench_team}
+
+
+def run(groups: List[str], quick: bool, repeat: int, latency_ms: float) -> Dict:
+    # The shared rate limiter would otherwise cap the agent benchmarks at 60 requests per minute
+    os.environ.setdefault("LLM_REQUESTS_PER_MINUTE", "1000000")
+    os.environ.setdefault("LLM_TOKENS_PER_MINUTE", "1000000000")
+    sizes = _sizes(quick)
+    results = {}
+    for group in groups:
+        started = time.perf_counter()
+        results.update(BENCHMARKS[group](sizes, repeat, latency_ms))
+        print(f"{group}: {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} CPUs)",
+            "quick": quick,
+            "stub_latency_ms": latency_ms,
+            "sizes": sizes,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Regressions beyond threshold (a fraction) for every benchmark present in both runs."""
+    for setting in ("quick", "stub_latency_ms"):
+        if current["meta"].get(setting) != baseline["meta"].get(setting):
+            raise ValueError(f"Baseline was recorded with {setting}={baseline['meta'].get(setting)!r}, "
+                             f"this run uses {current['meta'].get(setting)!r}")
+    regressions = []
+    for name, result in sorted(current["results"].items()):
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for field, higher_is_better in COMPARED_FIELDS.items():
+            if field not in result or field not in previous or not previous[field]:
+                continue
+            change = (result[field] - previous[field]) / previous[field]
+            worse = -change if higher_is_better else change
+            if field.endswith("_ms") and abs(result[field] - previous[field]) < MIN_DELTA_MS:
+                continue
+            print(f"{name:45s} {field:15s} {previous[field]:>12g} -> {result[field]:>12g} ({change:+.1%})", file=sys.stderr)
+            if worse > threshold:
+                regressions.append(f"{name} {field}: {previous[field]:g} -> {result[field]:g} ({change:+.1%})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", default=",".join(GROUPS), help=f"comma-separated groups ({', '.join(GROUPS)})")
+    parser.add_argument("--quick", action="store_true", help="10x smaller datasets, for a fast smoke run")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per timing benchmark")
+    parser.add_argument("--stub-latency-ms", type=float, default=50.0, help="simulated model latency for agent benchmarks")
+    parser.add_argument("--output", help="also write the results JSON here")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results as the new baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with this baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    groups = [group.strip() for group in args.only.split(",") if group.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+    baseline: Optional[Dict] = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = run(groups, args.quick, args.repeat, args.stub_latency_ms)
+    text = json.dumps(results, indent=2)
+    print(text)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if baseline is None:
+        return 0
+    try:
+        regressions = compare(results, baseline, args.threshold)
+    except ValueError as e:
+        print(f"FAIL: {e}", file=sys.stderr)
+        return 1
+    for regression in regressions:
+        print(f"FAIL: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
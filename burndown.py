@@ -0,0 +1,165 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+EVENT_COLUMNS = ["timestamp", "sprint", "story_id", "event", "points"]
+EVENT_TYPES = ("created", "re-estimated", "completed", "removed")
+
+
+class BurndownEngine:
+    """Event-sourced burndown built from an append-only log of story-point events.
+
+    Events are (timestamp, sprint, story_id, event, points) rows where event
+    is one of created, re-estimated, completed or removed; points is the
+    story's estimate for created/re-estimated and ignored otherwise.
+
+    Each appended batch is turned into per-event scope and remaining deltas
+    with vectorized groupby operations, then folded into per-sprint daily
+    totals. Only the days touched by the batch change, so appending today's
+    events never replays the history.
+    """
+
+    def __init__(self):
+        self._batches: List[pd.DataFrame] = []
+        # Latest known state per story, carried between batches
+        self._estimates: Dict[str, float] = {}
+        self._done: Dict[str, bool] = {}
+        self._removed: Dict[str, bool] = {}
+        # Summed deltas per (sprint, day); None until the first append
+        self._daily: Optional[pd.DataFrame] = None
+        # Running content hash of the log, extended with every appended batch
+        self._digest = hashlib.blake2b(digest_size=16)
+
+    def fingerprint(self) -> str:
+        return self._digest.hexdigest()
+
+    @property
+    def events(self) -> pd.DataFrame:
+        if not self._batches:
+            return pd.DataFrame(columns=EVENT_COLUMNS)
+        return pd.concat(self._batches, ignore_index=True)
+
+    def append(self, events: pd.DataFrame):
+        if events.empty:
+            return
+        unknown = set(events["event"]) - set(EVENT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown burndown event types: {sorted(unknown)}")
+
+        batch = events[EVENT_COLUMNS].copy()
+        batch["timestamp"] = pd.to_datetime(batch["timestamp"])
+        batch["story_id"] = batch["story_id"].astype(str)
+        batch["points"] = pd.to_numeric(batch["points"], errors="coerce").astype("float64")
+        batch = batch.sort_values("timestamp", kind="stable").reset_index(drop=True)
+        self._batches.append(batch)
+        self._digest.update(pd.util.hash_pandas_object(batch, index=False).to_numpy().tobytes())
+
+        deltas = self._event_deltas(batch)
+        daily = (
+            deltas.assign(day=batch["timestamp"].dt.normalize(), sprint=batch["sprint"].astype("int64"))
+            .groupby(["sprint", "day"])[["scope_delta", "remaining_delta"]]
+            .sum()
+        )
+        self._daily = daily if self._daily is None else daily.add(self._daily, fill_value=0.0).sort_index()
+
+    def _event_deltas(self, batch: pd.DataFrame) -> pd.DataFrame:
+        event = batch["event"]
+        story = batch["story_id"]
+        estimates = batch["points"].where(event.isin(["created", "re-estimated"]))
+
+        # Estimate before each event: previous estimate in this batch, else the carried state
+        carried_estimate = story.map(self._estimates).astype("float64")
+        previous_estimate = estimates.groupby(story).ffill().groupby(story).shift()
+        previous_estimate = previous_estimate.fillna(carried_estimate).fillna(0.0)
+
+        def flag_before(kind: str, carried: Dict[str, bool]) -> pd.Series:
+            happened = (event == kind).astype("int64").groupby(story).cumsum()
+            before = happened.groupby(story).shift(fill_value=0) > 0
+            return before | story.map(carried).fillna(False).astype(bool)
+
+        done_before = flag_before("completed", self._done)
+        removed_before = flag_before("removed", self._removed)
+        active = ~removed_before
+        open_work = active & ~done_before
+
+        created = (event == "created").to_numpy()
+        reestimated = (event == "re-estimated").to_numpy()
+        completed = (event == "completed").to_numpy()
+        removed = (event == "removed").to_numpy()
+        points = batch["points"].fillna(0.0).to_numpy()
+        previous = previous_estimate.to_numpy()
+        change = points - previous
+
+        scope_delta = np.select(
+            [created, reestimated & active.to_numpy(), removed & active.to_numpy()],
+            [points, change, -previous],
+            default=0.0,
+        )
+        remaining_delta = np.select(
+            [created, reestimated & open_work.to_numpy(), (completed | removed) & open_work.to_numpy()],
+            [points, change, -previous],
+            default=0.0,
+        )
+
+        # Carry the final state of every story touched by this batch into the next append
+        last_estimates = estimates.groupby(story).last().dropna()
+        self._estimates.update(last_estimates.to_dict())
+        self._done.update({s: True for s in story[completed].unique()})
+        self._removed.update({s: True for s in story[removed].unique()})
+        return pd.DataFrame({"scope_delta": scope_delta, "remaining_delta": remaining_delta}, index=batch.index)
+
+    def daily_series(self, sprint: int, start: datetime, end: datetime) -> pd.DataFrame:
+        """Scope and remaining points at the end of each day from start to end (inclusive)."""
+        days = pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), freq="D")
+        if self._daily is None or sprint not in self._daily.index.get_level_values("sprint"):
+            return pd.DataFrame({"scope": 0.0, "remaining": 0.0}, index=days)
+        sprint_daily = self._daily.xs(sprint, level="sprint")
+        # Events before the first plotted day still count towards the opening balance
+        totals = sprint_daily.cumsum()
+        series = totals.reindex(totals.index.union(days)).ffill().fillna(0.0).reindex(days)
+        return series.rename(columns={"scope_delta": "scope", "remaining_delta": "remaining"})
+
+
+def ideal_burndown_line(scope: float, days: int) -> np.ndarray:
+    return np.linspace(scope, 0.0, num=days)
+
+
+def sample_burndown_events(sprint_data, seed: int = 7) -> pd.DataFrame:
+    """Plausible event log for the sample sprint: stories created on day one, completed over the elapsed days."""
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp(sprint_data.start_date).normalize()
+    elapsed = max(1, (pd.Timestamp(datetime.now()).normalize() - start).days)
+
+    points = []
+    while sum(points) < sprint_data.total_story_points:
+        points.append(int(rng.choice([1, 2, 3, 5, 8])))
+    points[-1] -= sum(points) - sprint_data.total_story_points
+    points = [p for p in points if p > 0]
+    story_ids = [f"ST-{sprint_data.sprint_number}-{i + 1:03d}" for i in range(len(points))]
+
+    rows = [(start + timedelta(hours=9), sprint_data.sprint_number, s, "created", p) for s, p in zip(story_ids, points)]
+    completed_points = 0
+    open_stories = []
+    for i in rng.permutation(len(story_ids)):
+        if completed_points + points[i] > sprint_data.completed_story_points:
+            open_stories.append(story_ids[i])
+            continue
+        completed_points += points[i]
+        day = int(rng.integers(1, elapsed + 1))
+        rows.append((start + timedelta(days=day, hours=17), sprint_data.sprint_number, story_ids[i], "completed", np.nan))
+
+    # One mid-sprint re-estimate of unfinished work to show scope change
+    open_story = open_stories[0] if open_stories else None
+    if open_story is not None and elapsed > 2:
+        rows.append((start + timedelta(days=elapsed // 2, hours=11), sprint_data.sprint_number, open_story,
+                     "re-estimated", points[story_ids.index(open_story)] + 2))
+    return pd.DataFrame(rows, columns=EVENT_COLUMNS)
+
+
+def make_event(sprint: int, story_id: str, event: str, points: Optional[float] = None,
+               timestamp: Optional[datetime] = None) -> pd.DataFrame:
+    return pd.DataFrame([(timestamp or datetime.now(), sprint, story_id, event, np.nan if points is None else points)],
+                        columns=EVENT_COLUMNS)
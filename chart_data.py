@@ -0,0 +1,117 @@
+"""Server-side reduction of chart series before they are sent to the browser.
+
+Every point of a Plotly trace is serialized into the page and drawn by the
+browser, so long histories cost payload and render time linearly. Line
+series are reduced here to at most max_points with Largest-Triangle-Three-
+Buckets (LTTB), which keeps peaks, dips and the overall shape, and traces
+that still carry many points are drawn with WebGL (Scattergl).
+"""
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+
+# Points per line trace after downsampling; about one per pixel of a wide chart
+DEFAULT_MAX_POINTS = 1000
+# Traces with at least this many points use WebGL instead of SVG
+WEBGL_THRESHOLD = 1000
+# Categories above which grouped bars are drawn as lines instead
+MAX_BARS = 60
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Indices of the points LTTB keeps; the first and last point are always kept.
+
+    The interior is split into max_points - 2 equal buckets and from each
+    bucket the point forming the largest triangle with the previously kept
+    point and the mean of the next bucket is kept. The global minimum and
+    maximum are always among the kept points (when max_points > 3).
+    """
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # edges[i]:edges[i + 1] is interior bucket i; edges[-1] is n - 1, so the
+    # final bucket edges[-1]:n is the last point, the last bucket's "next bucket"
+    edges = (np.arange(max_points - 1) * (n - 2) // (max_points - 2)) + 1
+    counts = np.diff(np.append(edges, n))
+    mean_x = np.add.reduceat(x, edges) / counts
+    mean_y = np.add.reduceat(y, edges) / counts
+
+    kept = np.empty(max_points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((x[previous] - mean_x[bucket + 1]) * (y[lo:hi] - y[previous])
+                      - (x[previous] - x[lo:hi]) * (mean_y[bucket + 1] - y[previous]))
+        previous = lo + int(area.argmax())
+        kept[bucket + 1] = previous
+    # The global extremes replace the pick of their bucket, so spikes always
+    # survive; two extremes in one bucket also take a neighbouring slot
+    extremes = sorted({int(y.argmin()), int(y.argmax())} - {0, n - 1})
+    slots = [int(np.searchsorted(edges, extreme, side="right")) for extreme in extremes]
+    if len(slots) == 2 and slots[0] == slots[1]:
+        if slots[1] < max_points - 2:
+            slots[1] += 1
+        elif slots[0] > 1:
+            slots[0] -= 1
+        else:
+            extremes, slots = extremes[1:], slots[1:]
+    kept[slots] = extremes
+    return kept
+
+
+def step_indices(y: np.ndarray) -> np.ndarray:
+    """Indices that draw a step ('hv') line exactly: the first and last point and every change."""
+    y = np.asarray(y)
+    if len(y) < 3:
+        return np.arange(len(y))
+    changes = np.flatnonzero(y[1:] != y[:-1]) + 1
+    return np.unique(np.concatenate(([0], changes, [len(y) - 1])))
+
+
+def _positions(x: np.ndarray) -> np.ndarray:
+    # LTTB needs numeric x; dates become nanoseconds, labels their positions
+    if np.issubdtype(x.dtype, np.number):
+        return x.astype(np.float64)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return np.arange(len(x), dtype=np.float64)
+
+
+def reduce_series(x: Sequence, y: Sequence, max_points: int = DEFAULT_MAX_POINTS,
+                  step: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """x and y with at most max_points points; non-finite y values are dropped.
+
+    Step series are first reduced losslessly to their change points. y keeps
+    its dtype, so integer series still serialize as compact integer arrays.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    values = y.astype(np.float64)
+    finite = np.isfinite(values)
+    if not finite.all():
+        x, y, values = x[finite], y[finite], values[finite]
+    if step:
+        keep = step_indices(values)
+        x, y, values = x[keep], y[keep], values[keep]
+    keep = lttb_indices(_positions(x), values, max_points)
+    return x[keep], y[keep]
+
+
+def line_trace(x: Sequence, y: Sequence, max_points: int = DEFAULT_MAX_POINTS,
+               webgl_threshold: int = WEBGL_THRESHOLD, **trace_kwargs):
+    """A Scatter trace of the reduced series, or Scattergl when it still has webgl_threshold points."""
+    import plotly.graph_objects as go
+    step = trace_kwargs.get("line", {}).get("shape") == "hv"
+    x, y = reduce_series(x, y, max_points, step=step)
+    trace_type = go.Scattergl if len(y) >= webgl_threshold else go.Scatter
+    return trace_type(x=x, y=y, **trace_kwargs)
+
+
+def payload_bytes(figure: Any) -> int:
+    """Size of the figure JSON that st.plotly_chart sends to the browser."""
+    import plotly.io as pio
+    return len(pio.to_json(figure, validate=False).encode("utf-8"))
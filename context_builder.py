@@ -0,0 +1,205 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from llm_resilience import estimate_tokens
+
+PRIORITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
+STATUS_ORDER = {"Blocked": 0, "In Progress": 1, "In Review": 2, "To Do": 3, "Done": 4}
+
+
+@dataclass
+class SectionUsage:
+    title: str
+    tokens: int
+    rows_included: int = 0
+    rows_total: int = 0
+    summarized: bool = False
+
+
+@dataclass
+class _Section:
+    title: str
+    text: Optional[str] = None
+    frame: Optional[pd.DataFrame] = None
+    priority_column: Optional[str] = None
+    priority_order: Dict[str, int] = field(default_factory=dict)
+    recency_column: Optional[str] = None
+    summary_columns: List[str] = field(default_factory=list)
+    weight: float = 1.0
+    # Rows in the full table when frame holds only its highest-ranked slice
+    rows_total: Optional[int] = None
+
+
+def format_sprint_summary(sprint_data) -> str:
+    # Compact replacement for the dataclass repr
+    return (
+        f"Sprint {sprint_data.sprint_number} ({sprint_data.start_date:%Y-%m-%d} to {sprint_data.end_date:%Y-%m-%d}): "
+        f"{sprint_data.completed_story_points}/{sprint_data.total_story_points} SP completed\n"
+        f"Team: {', '.join(sprint_data.team_members)}\n"
+        f"Impediments: {'; '.join(sprint_data.impediments) or 'none'}\n"
+        f"Risks: {'; '.join(sprint_data.risks) or 'none'}"
+    )
+
+
+def build_tracker_context(store, sprint_data, token_budget: int = 3000) -> Tuple[str, List[SectionUsage]]:
+    """Recommendation context from the project store's tracker tables and the sprint summary."""
+    # Every row costs at least one token, so no table needs more rows than the budget
+    row_limit = int(token_budget)
+    builder = ContextBuilder(token_budget=token_budget)
+    builder.add_table("Team Updates", store.query("updates", order_by="created_at", descending=True, limit=row_limit),
+                      recency_column="Timestamp", rows_total=store.count("updates"))
+    builder.add_table("Current Implementations", store.top_rows("tasks", "status", STATUS_ORDER, row_limit),
+                      priority_column="Status", priority_order=STATUS_ORDER, summary_columns=["Status"],
+                      rows_total=store.count("tasks"))
+    builder.add_table("Product Backlog", store.top_rows("backlog", "priority", PRIORITY_ORDER, row_limit),
+                      priority_column="Priority", priority_order=PRIORITY_ORDER, summary_columns=["Priority"],
+                      rows_total=store.count("backlog"))
+    builder.add_text("Sprint Data", format_sprint_summary(sprint_data))
+    return builder.build()
+
+
+class ContextBuilder:
+    """Assembles prompt context from text and tables within a token budget.
+
+    Tables are encoded as CSV rather than padded to_string output. When a
+    table does not fit its share of the budget its rows are ranked by
+    priority and recency, the top rows are kept and the overflow is
+    replaced by a one-line summary (row counts per category and totals of
+    numeric columns).
+    """
+
+    def __init__(self, token_budget: int = 3000):
+        self.token_budget = token_budget
+        self._sections: List[_Section] = []
+
+    def add_text(self, title: str, text: str) -> "ContextBuilder":
+        self._sections.append(_Section(title=title, text=text))
+        return self
+
+    def add_table(self, title: str, frame: pd.DataFrame, priority_column: Optional[str] = None,
+                  priority_order: Optional[Dict[str, int]] = None, recency_column: Optional[str] = None,
+                  summary_columns: Optional[List[str]] = None, weight: float = 1.0,
+                  rows_total: Optional[int] = None) -> "ContextBuilder":
+        self._sections.append(_Section(
+            title=title,
+            frame=frame,
+            priority_column=priority_column,
+            priority_order=priority_order or {},
+            recency_column=recency_column,
+            summary_columns=summary_columns or [],
+            weight=weight,
+            rows_total=rows_total,
+        ))
+        return self
+
+    def build(self) -> Tuple[str, List[SectionUsage]]:
+        rendered: Dict[int, str] = {}
+        usage: Dict[int, SectionUsage] = {}
+        remaining = self.token_budget
+
+        # Free-text sections are small and always included, truncated if necessary
+        for i, section in enumerate(self._sections):
+            if section.text is None:
+                continue
+            text = section.text
+            max_chars = max(0, remaining) * 4
+            if len(text) > max_chars:
+                text = text[:max(0, max_chars - 3)] + "..."
+            rendered[i] = f"{section.title}:\n{text}"
+            usage[i] = SectionUsage(section.title, estimate_tokens(rendered[i]))
+            remaining -= usage[i].tokens
+
+        tables = [i for i, section in enumerate(self._sections) if section.frame is not None]
+        encoded = {i: self._encode_rows(self._rank(self._sections[i].frame, self._sections[i])) for i in tables}
+        budgets = self._allocate(tables, encoded, max(0, remaining))
+        for i in tables:
+            rendered[i], usage[i] = self._render_table(self._sections[i], *encoded[i], budgets[i])
+
+        context = "\n\n".join(rendered[i] for i in range(len(self._sections)))
+        return context, [usage[i] for i in range(len(self._sections))]
+
+    def _allocate(self, tables: List[int], encoded: Dict[int, Tuple], budget: int) -> Dict[int, int]:
+        # Water-filling: tables that fit in their weighted share get exactly what they need,
+        # the leftover is shared among the tables that are still too big
+        needs = {i: self._full_cost(encoded[i][1]) for i in tables}
+        budgets: Dict[int, int] = {}
+        open_tables = list(tables)
+        while open_tables:
+            total_weight = sum(self._sections[i].weight for i in open_tables)
+            shares = {i: budget * self._sections[i].weight / total_weight for i in open_tables}
+            fitting = [i for i in open_tables if needs[i] <= shares[i]]
+            if not fitting:
+                budgets.update({i: int(shares[i]) for i in open_tables})
+                break
+            for i in fitting:
+                budgets[i] = needs[i]
+                budget -= needs[i]
+                open_tables.remove(i)
+        return budgets
+
+    @staticmethod
+    def _rank(frame: pd.DataFrame, section: _Section) -> pd.DataFrame:
+        keys, ascending = [], []
+        ranked = frame
+        if section.priority_column and section.priority_column in frame.columns:
+            rank = frame[section.priority_column].astype("object").map(section.priority_order)
+            ranked = ranked.assign(_priority_rank=rank.fillna(len(section.priority_order)).to_numpy())
+            keys.append("_priority_rank")
+            ascending.append(True)
+        if section.recency_column and section.recency_column in frame.columns:
+            keys.append(section.recency_column)
+            ascending.append(False)
+        if not keys:
+            return frame
+        ranked = ranked.sort_values(keys, ascending=ascending, kind="stable")
+        return ranked.drop(columns="_priority_rank", errors="ignore")
+
+    @staticmethod
+    def _encode_rows(frame: pd.DataFrame) -> Tuple[pd.DataFrame, str, np.ndarray]:
+        # Embedded newlines would break the one-row-per-line CSV encoding
+        compact = frame.replace(r"[\r\n]+", " ", regex=True)
+        header = ",".join(str(c) for c in compact.columns)
+        body = compact.to_csv(index=False, header=False, lineterminator="\n")
+        lines = body.split("\n")[:len(compact)]
+        costs = np.fromiter((len(line) + 1 for line in lines), dtype=np.int64, count=len(lines)) // 4 + 1
+        return compact, header + "\n" + body, costs
+
+    @staticmethod
+    def _full_cost(csv_text: str) -> int:
+        # CSV plus the section title line
+        return estimate_tokens(csv_text) + 10
+
+    def _render_table(self, section: _Section, compact: pd.DataFrame, csv_text: str,
+                      costs: np.ndarray, budget: int) -> Tuple[str, SectionUsage]:
+        total_rows = max(len(compact), section.rows_total or 0)
+        if total_rows == len(compact) and self._full_cost(csv_text) <= budget:
+            text = f"{section.title} ({total_rows} rows, CSV):\n{csv_text.rstrip()}"
+            return text, SectionUsage(section.title, estimate_tokens(text), total_rows, total_rows)
+
+        header = csv_text.split("\n", 1)[0]
+        title = f"{section.title} (top rows of {total_rows}, CSV):"
+        # Reserve room for the title, header and overflow summary line
+        reserved = estimate_tokens(title) + estimate_tokens(header) + 40
+        keep = int(np.searchsorted(np.cumsum(costs), budget - reserved, side="right"))
+        lines = csv_text.split("\n")[1:1 + keep]
+        summary = self._summarize(section, compact.iloc[keep:], total_rows - keep)
+        text = "\n".join([title, header, *lines, summary])
+        return text, SectionUsage(section.title, estimate_tokens(text), keep, total_rows, summarized=True)
+
+    @staticmethod
+    def _summarize(section: _Section, overflow: pd.DataFrame, omitted: int) -> str:
+        parts = [f"... {omitted} more rows omitted"]
+        if omitted > len(overflow):
+            # Only a slice of the table was loaded, so the breakdown covers the rows that follow the kept ones
+            parts[0] += f" (breakdown of the next {len(overflow)})"
+        for column in section.summary_columns:
+            if column in overflow.columns:
+                counts = overflow[column].value_counts()
+                parts.append(f"{column}: " + ", ".join(f"{value} {count}" for value, count in counts.items()))
+        numeric = overflow.select_dtypes(include="number")
+        for column in numeric.columns:
+            parts.append(f"{column} total {numeric[column].sum():g}")
+        return "; ".join(parts)
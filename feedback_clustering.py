@@ -0,0 +1,137 @@
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have", "i", "in", "is",
+    "it", "its", "of", "on", "or", "our", "so", "that", "the", "this", "to", "was", "we", "were", "with",
+}
+
+
+@dataclass
+class FeedbackTheme:
+    representative: str
+    count: int
+    examples: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FeedbackSummary:
+    themes: List[FeedbackTheme]
+    total_items: int
+    unique_items: int
+
+    def to_prompt_lines(self, max_themes: int = 40, max_examples: int = 2) -> str:
+        lines = []
+        for theme in self.themes[:max_themes]:
+            line = f"- {theme.representative}"
+            if theme.count > 1:
+                line += f" (mentioned {theme.count}x)"
+            if theme.examples[:max_examples]:
+                line += f"; related: {'; '.join(theme.examples[:max_examples])}"
+            lines.append(line)
+        omitted = self.themes[max_themes:]
+        if omitted:
+            lines.append(f"- ... {len(omitted)} smaller themes covering {sum(t.count for t in omitted)} comments omitted")
+        return "\n".join(lines)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_TOKEN_RE.findall(text.lower()))
+
+
+def _features(normalized: str) -> List[str]:
+    words = [w for w in normalized.split() if w not in _STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def tfidf_vectors(texts: Sequence[str], dims: int = 1024) -> np.ndarray:
+    """L2-normalized TF-IDF rows using unigram and bigram features hashed into dims columns."""
+    rows, cols = [], []
+    for i, text in enumerate(texts):
+        for feature in _features(text):
+            rows.append(i)
+            # crc32 keeps the hashing stable across processes, unlike hash()
+            cols.append(zlib.crc32(feature.encode("utf-8")) % dims)
+    matrix = np.zeros((len(texts), dims), dtype=np.float32)
+    if rows:
+        np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), 1.0)
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)).astype(np.float32) + 1.0
+    matrix *= idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def cluster_feedback(feedback: Sequence[str], threshold: float = 0.5, block_size: int = 1024,
+                     max_examples: int = 3) -> FeedbackSummary:
+    """Dedupe feedback and group near-duplicates into themes.
+
+    Exact duplicates (after normalizing case and punctuation) are folded
+    first. The unique comments are then clustered greedily, most frequent
+    first: each comment joins the most similar existing theme when the
+    cosine similarity of their TF-IDF vectors reaches threshold, otherwise
+    it starts a new theme. Similarities are computed a block at a time so
+    memory stays bounded for large inputs.
+    """
+    texts = [str(item).strip() for item in feedback if str(item).strip()]
+    if not texts:
+        return FeedbackSummary(themes=[], total_items=0, unique_items=0)
+
+    normalized = np.array([_normalize(t) for t in texts], dtype=object)
+    keys, first_index, counts = np.unique(normalized, return_index=True, return_counts=True)
+    # Most frequent comments become theme representatives first
+    order = np.lexsort((first_index, -counts))
+    unique_texts = [texts[first_index[i]] for i in order]
+    unique_counts = counts[order]
+    vectors = tfidf_vectors([keys[i] for i in order])
+
+    n = len(unique_texts)
+    assignment = np.full(n, -1, dtype=np.int64)
+    representatives = np.empty((0, vectors.shape[1]), dtype=np.float32)
+    representative_rows: List[int] = []
+
+    for start in range(0, n, block_size):
+        block = vectors[start:start + block_size]
+        block_assignment = np.full(len(block), -1, dtype=np.int64)
+        if len(representatives):
+            similarity = block @ representatives.T
+            best = similarity.argmax(axis=1)
+            matched = similarity[np.arange(len(block)), best] >= threshold
+            block_assignment[matched] = best[matched]
+
+        open_rows = np.flatnonzero(block_assignment < 0)
+        if len(open_rows):
+            local_similarity = block[open_rows] @ block[open_rows].T
+            claimed = np.zeros(len(open_rows), dtype=bool)
+            new_representatives = []
+            for j in range(len(open_rows)):
+                if claimed[j]:
+                    continue
+                theme_id = len(representative_rows) + len(new_representatives)
+                members = (~claimed) & (local_similarity[j] >= threshold)
+                members[j] = True
+                block_assignment[open_rows[members]] = theme_id
+                claimed |= members
+                new_representatives.append(open_rows[j])
+            representative_rows.extend(start + r for r in new_representatives)
+            representatives = np.vstack([representatives, block[new_representatives]])
+
+        assignment[start:start + len(block)] = block_assignment
+
+    theme_counts = np.bincount(assignment, weights=unique_counts, minlength=len(representative_rows)).astype(np.int64)
+    # Group member rows per theme with one stable sort instead of a scan per theme
+    by_theme = np.argsort(assignment, kind="stable")
+    boundaries = np.cumsum(np.bincount(assignment, minlength=len(representative_rows)))[:-1]
+    themes = []
+    for theme_id, members in enumerate(np.split(by_theme, boundaries)):
+        row = representative_rows[theme_id]
+        examples = [unique_texts[m] for m in members[:max_examples + 1] if m != row][:max_examples]
+        themes.append(FeedbackTheme(unique_texts[row], int(theme_counts[theme_id]), examples))
+    themes.sort(key=lambda theme: -theme.count)
+    return FeedbackSummary(themes=themes, total_items=len(texts), unique_items=n)
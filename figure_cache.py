@@ -0,0 +1,133 @@
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from chart_data import payload_bytes
+from metrics import get_metrics
+
+
+def _update(digest, obj: Any):
+    if isinstance(obj, pd.DataFrame):
+        digest.update(b"df")
+        digest.update(repr(list(obj.columns)).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        digest.update(b"series")
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        digest.update(f"nd{obj.dtype}{obj.shape}".encode("utf-8"))
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif hasattr(obj, "fingerprint") and callable(obj.fingerprint):
+        digest.update(str(obj.fingerprint()).encode("utf-8"))
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        digest.update(type(obj).__name__.encode("utf-8"))
+        for f in dataclasses.fields(obj):
+            _update(digest, getattr(obj, f.name))
+    elif isinstance(obj, dict):
+        digest.update(b"{")
+        for key in sorted(obj, key=repr):
+            _update(digest, key)
+            _update(digest, obj[key])
+        digest.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b"[")
+        for item in obj:
+            _update(digest, item)
+        digest.update(b"]")
+    elif obj is None or isinstance(obj, (str, int, float, bool, datetime, date)):
+        digest.update(repr(obj).encode("utf-8"))
+    else:
+        raise TypeError(f"Cannot fingerprint objects of type {type(obj).__name__}")
+    digest.update(b"|")
+
+
+def data_fingerprint(*parts: Any) -> str:
+    """Cheap content hash of the data a chart is built from."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _update(digest, part)
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Bounded LRU of built Plotly figures keyed by chart name and data fingerprint.
+
+    With a sizer, stats() reports the size of each chart's latest figure as
+    payload_bytes, so the diagnostics show what a chart costs the browser.
+    Sizing serializes the figure, so it happens when stats() is read, once
+    per new figure, not on the build path.
+    """
+
+    def __init__(self, max_entries: int = 64, sizer: Optional[Callable[[Any], int]] = None):
+        self.max_entries = max_entries
+        self.sizer = sizer
+        self._figures: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        # Latest figure per chart whose payload_bytes is not measured yet
+        self._unsized: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, chart: str, counter: str):
+        self._counters.setdefault(chart, {"hits": 0, "builds": 0, "payload_bytes": 0})[counter] += 1
+
+    def get_or_build(self, chart: str, fingerprint: str, builder: Callable[[], Any]):
+        key = (chart, fingerprint)
+        with self._lock:
+            figure = self._figures.get(key)
+            if figure is not None:
+                self._figures.move_to_end(key)
+                self._count(chart, "hits")
+                return figure
+        # Build outside the lock; a concurrent duplicate build is harmless
+        figure = builder()
+        with self._lock:
+            self._count(chart, "builds")
+            if self.sizer is not None:
+                self._unsized[chart] = figure
+            self._figures[key] = figure
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+        return figure
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            unsized = dict(self._unsized)
+        # Serialize outside the lock so builds and cache hits never wait on it
+        sizes = {chart: self.sizer(figure) for chart, figure in unsized.items()}
+        with self._lock:
+            for chart, size in sizes.items():
+                # A newer build since the copy above is measured on the next read
+                if self._unsized.get(chart) is unsized[chart]:
+                    del self._unsized[chart]
+                    self._counters[chart]["payload_bytes"] = size
+            return {chart: dict(counters) for chart, counters in self._counters.items()}
+
+    def flat_stats(self) -> Dict[str, int]:
+        """stats() as <chart>_<counter> keys, for MetricsRegistry.register_stats."""
+        return {f"{chart}_{counter}": value for chart, counters in self.stats().items() for counter, value in counters.items()}
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self._unsized.clear()
+
+
+_shared_cache: Optional[FigureCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_figure_cache() -> FigureCache:
+    """Process-wide figure cache; identical data in different sessions shares figures."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = FigureCache(sizer=payload_bytes)
+            get_metrics().register_stats("scrum_agent_chart", _shared_cache.flat_stats, "Figure cache")
+        return _shared_cache
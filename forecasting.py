@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_SIMULATIONS = 100_000
+# Rows simulated at once when forecasting the backlog, to bound memory
+_CHUNK_SIZE = 25_000
+
+
+@dataclass
+class SprintForecast:
+    simulations: int
+    completion_probability: float
+    # Story points completed by the end of the sprint, keyed by percentile
+    points_percentiles: Dict[int, float]
+
+
+@dataclass
+class BacklogForecast:
+    simulations: int
+    backlog_points: float
+    # Sprints needed to finish the backlog and the matching completion dates, keyed by percentile
+    sprints_percentiles: Dict[int, int]
+    date_percentiles: Dict[int, datetime]
+
+
+def forecast_sprint(velocities: Sequence[float], total_points: float, completed_points: float,
+                    days_remaining: int, sprint_length_days: int = 14, simulations: int = DEFAULT_SIMULATIONS,
+                    percentiles: Sequence[int] = (10, 50, 90), seed: Optional[int] = 0) -> SprintForecast:
+    """Probability of finishing the sprint, from bootstrapped daily throughput.
+
+    Each simulated future draws one historical sprint velocity per remaining
+    day and converts it to a daily rate, so the spread reflects how much the
+    team's pace has varied between sprints.
+    """
+    rng = np.random.default_rng(seed)
+    daily_rates = np.asarray(velocities, dtype=np.float64) / max(1, sprint_length_days)
+    remaining = max(0.0, total_points - completed_points)
+    days = max(0, days_remaining)
+    if len(daily_rates) == 0 or days == 0:
+        delivered = np.zeros(simulations)
+    else:
+        delivered = rng.choice(daily_rates, size=(simulations, days)).sum(axis=1)
+    finished = np.minimum(total_points, completed_points + delivered)
+    return SprintForecast(
+        simulations=simulations,
+        completion_probability=float(np.mean(delivered >= remaining)) if remaining else 1.0,
+        points_percentiles={p: float(v) for p, v in zip(percentiles, np.percentile(finished, percentiles))},
+    )
+
+
+def forecast_backlog(velocities: Sequence[float], backlog_points: float, start: datetime,
+                     sprint_length_days: int = 14, simulations: int = DEFAULT_SIMULATIONS,
+                     percentiles: Sequence[int] = (50, 85, 95), max_sprints: int = 520,
+                     seed: Optional[int] = 0) -> BacklogForecast:
+    """Sprints (and dates) needed to burn through the backlog, from bootstrapped sprint velocities."""
+    rng = np.random.default_rng(seed)
+    samples = np.asarray([v for v in velocities if v > 0], dtype=np.float64)
+    if backlog_points <= 0 or len(samples) == 0:
+        sprints = {p: 0 for p in percentiles}
+    else:
+        # First pass covers a pessimistic 1.5x the mean pace; the few futures that
+        # are still short of the backlog are extended in further passes
+        horizon = int(min(max_sprints, np.ceil(1.5 * backlog_points / samples.mean()) + 2))
+        needed = np.full(simulations, max_sprints, dtype=np.int64)
+        for start_row in range(0, simulations, _CHUNK_SIZE):
+            rows = np.arange(start_row, min(start_row + _CHUNK_SIZE, simulations))
+            done_points = np.zeros(len(rows))
+            offset = 0
+            while len(rows) and offset < max_sprints:
+                steps = min(horizon, max_sprints - offset)
+                cumulative = done_points[:, None] + rng.choice(samples, size=(len(rows), steps)).cumsum(axis=1)
+                reached = cumulative >= backlog_points
+                hit = reached.any(axis=1)
+                # argmax finds the first sprint at which the backlog is done
+                needed[rows[hit]] = offset + reached[hit].argmax(axis=1) + 1
+                done_points = cumulative[~hit, -1]
+                rows = rows[~hit]
+                offset += steps
+        sprints = {p: int(v) for p, v in zip(percentiles, np.ceil(np.percentile(needed, percentiles)))}
+    return BacklogForecast(
+        simulations=simulations,
+        backlog_points=float(backlog_points),
+        sprints_percentiles=sprints,
+        date_percentiles={p: start + timedelta(days=n * sprint_length_days) for p, n in sprints.items()},
+    )
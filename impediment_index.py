@@ -0,0 +1,201 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".scrum_agent", "impediments.sqlite3")
+EMBEDDING_DIMS = 256
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+
+def embed(text: str, dims: int = EMBEDDING_DIMS) -> np.ndarray:
+    """Unit-length sketch of character trigrams and words hashed into dims buckets."""
+    normalized = f" {_NON_WORD_RE.sub(' ', text.lower()).strip()} "
+    features = [normalized[i:i + 3] for i in range(len(normalized) - 2)] + normalized.split()
+    vector = np.zeros(dims, dtype=np.float32)
+    if features:
+        buckets = np.fromiter((zlib.crc32(f.encode("utf-8")) % dims for f in features), dtype=np.int64, count=len(features))
+        np.add.at(vector, buckets, 1.0)
+        # Sublinear term frequency so long texts are not dominated by repeated grams
+        np.log1p(vector, out=vector)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+    return vector
+
+
+@dataclass
+class ImpedimentMatch:
+    impediment: str
+    context: str
+    resolution: str
+    similarity: float
+    created_at: float
+
+
+class ImpedimentIndex:
+    """Persistent index of past impediments and the resolutions generated for them.
+
+    Embeddings are kept in one contiguous float32 matrix, so a lookup is a
+    single matrix-vector product plus a partial sort. That is an exact
+    search, and it stays in the low milliseconds for tens of thousands of
+    entries. There is one entry per impediment and context (compared
+    case- and punctuation-insensitively); adding a resolution for a known
+    pair replaces the old one.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_INDEX_PATH, dims: int = EMBEDDING_DIMS):
+        self.dims = dims
+        self._lock = threading.Lock()
+        self._vectors = np.zeros((0, dims), dtype=np.float32)
+        self._size = 0
+        self._ids: List[int] = []
+        # Normalized (impediment, context) -> row of the matrix
+        self._positions: Dict[Tuple[str, str], int] = {}
+        self._memory_rows = {}
+        self._conn = self._connect(path) if path else None
+        if self._conn is not None:
+            self._load()
+
+    def _connect(self, path: str) -> Optional[sqlite3.Connection]:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS impediment_resolutions ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, impediment TEXT NOT NULL, context TEXT NOT NULL, "
+                "resolution TEXT NOT NULL, created_at REAL NOT NULL, embedding BLOB NOT NULL)"
+            )
+            conn.commit()
+            return conn
+        except (sqlite3.Error, OSError):
+            return None
+
+    def _load(self):
+        rows = self._conn.execute(
+            "SELECT id, impediment, context, embedding FROM impediment_resolutions ORDER BY id").fetchall()
+        # Latest row per key; older duplicates were written before adds became upserts
+        latest = {}
+        for row_id, impediment, context, blob in rows:
+            latest[self._normalized_key(impediment, context)] = (row_id, blob)
+        kept = {row_id for row_id, _ in latest.values()}
+        stale = [(row_id,) for row_id, *_ in rows if row_id not in kept]
+        if stale:
+            try:
+                self._conn.executemany("DELETE FROM impediment_resolutions WHERE id = ?", stale)
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+        # Skip rows embedded with a different dimensionality
+        entries = [(key, row_id, blob) for key, (row_id, blob) in latest.items() if len(blob) == self.dims * 4]
+        if entries:
+            self._vectors = np.vstack([np.frombuffer(blob, dtype=np.float32) for _, _, blob in entries])
+            self._ids = [row_id for _, row_id, _ in entries]
+            self._positions = {key: position for position, (key, _, _) in enumerate(entries)}
+            self._size = len(entries)
+
+    def _append_vector(self, vector: np.ndarray):
+        # Grow the matrix geometrically so appends are amortized O(1)
+        if self._size == len(self._vectors):
+            grown = np.zeros((max(64, 2 * len(self._vectors)), self.dims), dtype=np.float32)
+            grown[:self._size] = self._vectors[:self._size]
+            self._vectors = grown
+        self._vectors[self._size] = vector
+        self._size += 1
+
+    @staticmethod
+    def _key_text(impediment: str, context: str) -> str:
+        return f"{impediment} | {context}"
+
+    @staticmethod
+    def _normalized_key(impediment: str, context: str) -> Tuple[str, str]:
+        return (_NON_WORD_RE.sub(" ", impediment.lower()).strip(), _NON_WORD_RE.sub(" ", context.lower()).strip())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, impediment: str, context: str, resolution: str):
+        """Store a resolution; one already stored for the same impediment and context is replaced."""
+        vector = embed(self._key_text(impediment, context), self.dims)
+        key = self._normalized_key(impediment, context)
+        created_at = time.time()
+        values = (impediment, context, resolution, created_at, vector.tobytes())
+        with self._lock:
+            position = self._positions.get(key)
+            row_id = self._ids[position] if position is not None else None
+            stored = False
+            if self._conn is not None and (row_id is None or row_id >= 0):
+                try:
+                    if row_id is None:
+                        row_id = self._conn.execute(
+                            "INSERT INTO impediment_resolutions (impediment, context, resolution, created_at, embedding) "
+                            "VALUES (?, ?, ?, ?, ?)", values).lastrowid
+                    else:
+                        self._conn.execute(
+                            "UPDATE impediment_resolutions SET impediment = ?, context = ?, resolution = ?, created_at = ?, "
+                            "embedding = ? WHERE id = ?", (*values, row_id))
+                    self._conn.commit()
+                    stored = True
+                except sqlite3.Error:
+                    pass
+            if not stored:
+                # Memory-only fallback keeps the index usable without the store
+                if row_id is None or row_id >= 0:
+                    row_id = -(len(self._memory_rows) + 1)
+                self._memory_rows[row_id] = (impediment, context, resolution, created_at)
+            if position is None:
+                self._positions[key] = self._size
+                self._ids.append(row_id)
+                self._append_vector(vector)
+            else:
+                self._ids[position] = row_id
+                self._vectors[position] = vector
+
+    def search(self, impediment: str, context: str = "", k: int = 3, min_similarity: float = 0.0) -> List[ImpedimentMatch]:
+        query = embed(self._key_text(impediment, context), self.dims)
+        with self._lock:
+            if not self._size or k <= 0:
+                return []
+            similarities = self._vectors[:self._size] @ query
+            k = min(k, self._size)
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top])]
+            hits = [(self._ids[i], float(similarities[i])) for i in top if similarities[i] >= min_similarity]
+            return [match for match in (self._fetch(row_id, similarity) for row_id, similarity in hits) if match]
+
+    def _fetch(self, row_id: int, similarity: float) -> Optional[ImpedimentMatch]:
+        if row_id < 0:
+            row = self._memory_rows.get(row_id)
+        else:
+            try:
+                row = self._conn.execute(
+                    "SELECT impediment, context, resolution, created_at FROM impediment_resolutions WHERE id = ?",
+                    (row_id,),
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+        if row is None:
+            return None
+        return ImpedimentMatch(row[0], row[1], row[2], similarity, row[3])
+
+
+_shared_index: Optional[ImpedimentIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_impediment_index() -> ImpedimentIndex:
+    """Process-wide index shared by every Streamlit session."""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            path = os.getenv("SCRUM_AGENT_IMPEDIMENT_INDEX_PATH", DEFAULT_INDEX_PATH)
+            _shared_index = ImpedimentIndex(path=path or None)
+        return _shared_index
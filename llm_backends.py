@@ -0,0 +1,349 @@
+import hashlib
+import http.client
+import json
+import os
+import queue
+import random
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class LLMBackendError(Exception):
+    """Raised by backends for failed requests; status carries the HTTP status when known."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class LLMBackend:
+    """Minimal text-in/text-out interface the ScrumMasterAgent talks to."""
+
+    name = "base"
+    ready_message = "LLM backend configured"
+    missing_config_message = "LLM backend is not configured"
+    setup_hint = "Set LLM_BACKEND to gemini, openai or stub"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    @property
+    def configured(self) -> bool:
+        return True
+
+    @property
+    def cache_namespace(self) -> str:
+        return f"{self.name}:{self.model_name}"
+
+    def generate(self, prompt: str) -> str:
+        raise NotImplementedError
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        # Backends without native streaming emit the whole response as one chunk
+        yield self.generate(prompt)
+
+    def generate_json(self, prompt: str, schema: Dict) -> str:
+        # The prompt describes the schema; backends with a JSON mode also constrain the output to JSON
+        return self.generate(prompt)
+
+
+class GeminiBackend(LLMBackend):
+    name = "gemini"
+    ready_message = "Gemini API Key loaded from environment"
+    missing_config_message = "GEMINI_API_KEY environment variable not found"
+    setup_hint = "Set your API key: `export GEMINI_API_KEY=your_key_here`"
+
+    def __init__(self, model_name: str = "gemini-2.0-flash-exp", api_key: Optional[str] = None):
+        super().__init__(model_name)
+        self.api_key = api_key if api_key is not None else os.getenv("GEMINI_API_KEY")
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    @property
+    def model(self):
+        # The SDK is slow to import, so it is loaded on the first request rather than at startup
+        with self._model_lock:
+            if self._model is None:
+                # Imported here so the other backends work without the Gemini SDK installed
+                import google.generativeai as genai
+
+                genai.configure(api_key=self.api_key)
+                self._model = genai.GenerativeModel(self.model_name)
+            return self._model
+
+    def generate(self, prompt: str) -> str:
+        return self.model.generate_content(prompt).text
+
+    def generate_json(self, prompt: str, schema: Dict) -> str:
+        return self.model.generate_content(prompt, generation_config={"response_mime_type": "application/json"}).text
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        for chunk in self.model.generate_content(prompt, stream=True):
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. the final finish_reason chunk)
+                continue
+            yield text
+
+
+class HTTPConnectionPool:
+    """Keep-alive HTTP(S) connections to one host, reused across requests and threads.
+
+    Each request takes an idle connection (or opens one) and returns it once
+    the response has been read completely, so TCP and TLS handshakes are
+    paid once per connection instead of once per model call. At most
+    max_idle connections are kept; extra ones are closed when released.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 60.0, max_idle: int = 8):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.scheme = parsed.scheme or "http"
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port
+        self.path_prefix = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=max_idle)
+        self.stats = {"opened": 0, "reused": 0}
+        self._stats_lock = threading.Lock()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        with self._stats_lock:
+            self.stats["opened"] += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection(), False
+        with self._stats_lock:
+            self.stats["reused"] += 1
+        return conn, True
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool = True):
+        if not reusable:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(self, method: str, path: str, body: bytes, headers: Dict[str, str]):
+        """Send a request and return (connection, response); release the connection after reading the response."""
+        conn, reused = self.acquire()
+        try:
+            conn.request(method, self.path_prefix + path, body=body, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; retry once on a fresh one
+            conn = self._new_connection()
+            try:
+                conn.request(method, self.path_prefix + path, body=body, headers=headers)
+                return conn, conn.getresponse()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    """Chat-completions client for OpenAI and compatible servers (vLLM, Ollama, LM Studio...)."""
+
+    name = "openai"
+    ready_message = "OpenAI-compatible endpoint configured"
+    missing_config_message = "OPENAI_BASE_URL environment variable not found"
+    setup_hint = "Point the app at a server: `export OPENAI_BASE_URL=http://localhost:8000/v1`"
+
+    def __init__(self, model_name: str = "gpt-4o-mini", base_url: Optional[str] = None,
+                 api_key: Optional[str] = None, timeout: float = 60.0, pool_size: int = 8):
+        super().__init__(model_name)
+        self.base_url = (base_url if base_url is not None else os.getenv("OPENAI_BASE_URL", "")).rstrip("/")
+        self.api_key = api_key if api_key is not None else os.getenv("OPENAI_API_KEY")
+        self.timeout = timeout
+        self.pool = HTTPConnectionPool(self.base_url, timeout=timeout, max_idle=pool_size) if self.base_url else None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.base_url)
+
+    @contextmanager
+    def _request(self, prompt: str, stream: bool, json_mode: bool = False) -> Iterator[http.client.HTTPResponse]:
+        request = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": stream,
+        }
+        if json_mode:
+            request["response_format"] = {"type": "json_object"}
+        body = json.dumps(request).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        try:
+            conn, response = self.pool.request("POST", "/chat/completions", body, headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise LLMBackendError(f"Connection failed: {e}") from e
+        completed = False
+        try:
+            if response.status >= 400:
+                raise LLMBackendError(f"HTTP {response.status}: {response.read().decode('utf-8', 'replace')[:500]}",
+                                      status=response.status)
+            yield response
+            # Drain whatever the caller left unread so the connection can carry the next request
+            response.read()
+            completed = not response.will_close
+        finally:
+            self.pool.release(conn, reusable=completed)
+
+    def generate(self, prompt: str, json_mode: bool = False) -> str:
+        with self._request(prompt, stream=False, json_mode=json_mode) as response:
+            payload = json.loads(response.read())
+        return payload["choices"][0]["message"]["content"] or ""
+
+    def generate_json(self, prompt: str, schema: Dict) -> str:
+        return self.generate(prompt, json_mode=True)
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        # Server-sent events: one "data: {json}" line per delta, terminated by "data: [DONE]"
+        with self._request(prompt, stream=True) as response:
+            for raw_line in response:
+                line = raw_line.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                delta = json.loads(data)["choices"][0].get("delta", {})
+                if delta.get("content"):
+                    yield delta["content"]
+
+
+DEFAULT_STUB_TEMPLATE = (
+    "**[offline stub response {prompt_hash}]**\n\n"
+    "1. Prompt received ({prompt_chars} characters): {summary}\n"
+    "2. This text is generated locally by the stub backend and does not come from a model.\n"
+    "3. Set LLM_BACKEND=gemini or LLM_BACKEND=openai for real answers."
+)
+
+
+class StubBackend(LLMBackend):
+    """Offline backend with configurable latency, jitter and failure rate.
+
+    Outputs are deterministic for a given prompt: either one of the canned
+    responses (picked by prompt hash) or the template filled with details
+    about the prompt.
+    """
+
+    name = "stub"
+    ready_message = "Offline stub backend active (no model calls)"
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0,
+                 responses: Optional[List[str]] = None, template: str = DEFAULT_STUB_TEMPLATE,
+                 seed: Optional[int] = None, chunk_words: int = 8):
+        super().__init__("stub")
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.responses = list(responses) if responses else []
+        self.template = template
+        self.chunk_words = chunk_words
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.calls = 0
+
+    def _simulate_call(self):
+        with self._rng_lock:
+            self.calls += 1
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            fail = self._rng.random() < self.failure_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise LLMBackendError("Stub backend simulated failure", status=503)
+
+    def render(self, prompt: str) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        if self.responses:
+            return self.responses[int(prompt_hash, 16) % len(self.responses)]
+        lines = [line.strip() for line in prompt.splitlines() if line.strip()]
+        summary = lines[0] if lines else ""
+        return self.template.format(prompt_hash=prompt_hash[:12], prompt_chars=len(prompt), summary=summary[:200])
+
+    def generate(self, prompt: str) -> str:
+        self._simulate_call()
+        return self.render(prompt)
+
+    def generate_json(self, prompt: str, schema: Dict) -> str:
+        self._simulate_call()
+        if self.responses:
+            return self.render(prompt)
+        return json.dumps(self._example(schema, self.render(prompt), "$"))
+
+    def _example(self, schema: Dict, text: str, path: str):
+        # A value of the schema's shape, with the rendered template (tagged with its path) as every string
+        kind = schema.get("type")
+        if kind == "object":
+            return {name: self._example(sub, text, f"{path}.{name}") for name, sub in schema.get("properties", {}).items()}
+        if kind == "array":
+            count = schema.get("minItems", 1)
+            return [self._example(schema.get("items", {}), text, f"{path}[{i}]") for i in range(count)]
+        if "enum" in schema:
+            return schema["enum"][0]
+        return f"{text}\n\n_({path})_"
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        self._simulate_call()
+        words = self.render(prompt).split(" ")
+        for i in range(0, len(words), self.chunk_words):
+            chunk = " ".join(words[i:i + self.chunk_words])
+            yield chunk if i + self.chunk_words >= len(words) else chunk + " "
+
+
+def _float_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def create_backend(name: Optional[str] = None) -> LLMBackend:
+    """Build the backend selected by LLM_BACKEND (gemini, openai or stub)."""
+    name = (name or os.getenv("LLM_BACKEND", "gemini")).strip().lower()
+    if name == "gemini":
+        return GeminiBackend(model_name=os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp"))
+    if name == "openai":
+        return OpenAICompatibleBackend(
+            model_name=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            timeout=_float_env("OPENAI_TIMEOUT", 60.0),
+            pool_size=int(_float_env("OPENAI_POOL_SIZE", 8)),
+        )
+    if name == "stub":
+        responses = None
+        responses_file = os.getenv("STUB_RESPONSES_FILE")
+        if responses_file:
+            with open(responses_file, encoding="utf-8") as f:
+                responses = json.load(f)
+        seed = os.getenv("STUB_SEED")
+        return StubBackend(
+            latency=_float_env("STUB_LATENCY_MS", 0.0) / 1000,
+            jitter=_float_env("STUB_JITTER_MS", 0.0) / 1000,
+            failure_rate=_float_env("STUB_FAILURE_RATE", 0.0),
+            responses=responses,
+            template=os.getenv("STUB_TEMPLATE", DEFAULT_STUB_TEMPLATE),
+            seed=int(seed) if seed else None,
+        )
+    raise ValueError(f"Unknown LLM_BACKEND '{name}'. Expected gemini, openai or stub.")
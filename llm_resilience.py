@@ -0,0 +1,364 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+from llm_backends import LLMBackend, LLMBackendError
+from metrics import get_metrics
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# google.api_core exception names raised by the Gemini SDK for transient failures
+RETRYABLE_ERROR_NAMES = {
+    "ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "DeadlineExceeded",
+    "InternalServerError", "GatewayTimeout", "ServerError",
+}
+
+
+_CALL_SECONDS = get_metrics().histogram(
+    "scrum_agent_llm_call_seconds", "Wall time of each model call attempt (streams: until the first chunk)",
+    ["backend", "kind", "outcome"])
+_BACKEND_EVENTS = get_metrics().counter(
+    "scrum_agent_llm_backend_events_total", "Model call attempts, retries, failures and locally rejected calls",
+    ["backend", "event"])
+
+
+class CircuitOpenError(LLMBackendError):
+    def __init__(self, retry_in: float):
+        super().__init__(f"Model backend temporarily unavailable, retrying in {retry_in:.0f}s", status=503)
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(LLMBackendError):
+    def __init__(self, message: str = "Model call exceeded its deadline"):
+        super().__init__(message, status=504)
+
+
+class RateLimitExceededError(LLMBackendError):
+    def __init__(self):
+        super().__init__("Local rate limit reached before the call deadline", status=429)
+
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text
+    return max(1, len(text) // 4)
+
+
+def is_retryable(error: BaseException) -> bool:
+    if isinstance(error, (CircuitOpenError, RateLimitExceededError)):
+        return False
+    if isinstance(error, (TimeoutError, FutureTimeoutError, ConnectionError, DeadlineExceededError)):
+        return True
+    status = getattr(error, "status", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES
+    if isinstance(error, LLMBackendError):
+        # Connection-level failures carry no status
+        return True
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+class TokenBucket:
+    """Thread-safe token bucket; capacity tokens refill continuously over one minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.refill_per_second = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def acquire(self, amount: float, deadline: float) -> bool:
+        # Requests larger than the bucket can never fit, so they wait for a full bucket
+        amount = min(amount, self.capacity)
+        with self._cond:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return True
+                wait_for = (amount - self.tokens) / self.refill_per_second
+                remaining = deadline - time.monotonic()
+                if wait_for > remaining:
+                    return False
+                self._cond.wait(wait_for)
+
+    def debit(self, amount: float):
+        # Charge usage after the fact; the balance may go negative and delay later callers
+        with self._cond:
+            self._refill()
+            self.tokens -= amount
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits shared by every caller in the process."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+    def acquire(self, prompt_tokens: int, deadline: float):
+        if not self.requests.acquire(1, deadline):
+            raise RateLimitExceededError()
+        if not self.tokens.acquire(prompt_tokens, deadline):
+            raise RateLimitExceededError()
+
+    def record_response(self, response_tokens: int):
+        self.tokens.debit(response_tokens)
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets a single trial call through after reset_timeout."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                elapsed = time.monotonic() - self.opened_at
+                if elapsed < self.reset_timeout:
+                    raise CircuitOpenError(self.reset_timeout - elapsed)
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    raise CircuitOpenError(self.reset_timeout)
+                self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        # The trial call never reached the backend, so let another caller try
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 8.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter: uniform between 0 and the capped exponential delay
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+# Runs backend calls so a hard deadline can be enforced on SDKs without their own timeout
+_call_executor = ThreadPoolExecutor(max_workers=int(os.getenv("LLM_CALL_THREADS", "32")), thread_name_prefix="llm-call")
+
+
+class ResilientBackend(LLMBackend):
+    """Wraps a backend with rate limiting, retries with backoff, call deadlines and a circuit breaker."""
+
+    def __init__(self, inner: LLMBackend, limiter: RateLimiter, breaker: CircuitBreaker,
+                 retry_policy: Optional[RetryPolicy] = None, call_timeout: float = 60.0):
+        super().__init__(inner.model_name)
+        self.inner = inner
+        self.limiter = limiter
+        self.breaker = breaker
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.call_timeout = call_timeout
+        self.stats = {"calls": 0, "retries": 0, "failures": 0, "rejected": 0}
+        self._stats_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    @property
+    def name(self):
+        return self.inner.name
+
+    @property
+    def ready_message(self):
+        return self.inner.ready_message
+
+    @property
+    def missing_config_message(self):
+        return self.inner.missing_config_message
+
+    @property
+    def setup_hint(self):
+        return self.inner.setup_hint
+
+    @property
+    def configured(self) -> bool:
+        return self.inner.configured
+
+    @property
+    def cache_namespace(self) -> str:
+        return self.inner.cache_namespace
+
+    def _count(self, stat: str):
+        with self._stats_lock:
+            self.stats[stat] += 1
+        _BACKEND_EVENTS.labels(self.cache_namespace, stat).inc()
+
+    def _with_retries(self, prompt: str, call: Callable[[float], T], kind: str) -> T:
+        deadline = time.monotonic() + self.call_timeout
+        prompt_tokens = estimate_tokens(prompt)
+        attempt = 0
+        while True:
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self._count("rejected")
+                raise
+            try:
+                self.limiter.acquire(prompt_tokens, deadline)
+            except RateLimitExceededError:
+                self.breaker.release_trial()
+                self._count("rejected")
+                raise
+            self._count("calls")
+            started = time.perf_counter()
+            try:
+                result = call(deadline)
+            except Exception as e:
+                _CALL_SECONDS.labels(self.cache_namespace, kind, "error").observe(time.perf_counter() - started)
+                self._record_breaker_failure(e)
+                self._count("failures")
+                attempt += 1
+                delay = self.retry_policy.backoff(attempt - 1)
+                if (not is_retryable(e) or attempt >= self.retry_policy.max_attempts
+                        or time.monotonic() + delay >= deadline):
+                    raise
+                self._count("retries")
+                time.sleep(delay)
+                continue
+            _CALL_SECONDS.labels(self.cache_namespace, kind, "ok").observe(time.perf_counter() - started)
+            self.breaker.record_success()
+            return result
+
+    def _record_breaker_failure(self, error: Exception):
+        if is_retryable(error):
+            self.breaker.record_failure()
+        else:
+            # A rejected request (400, 401, ...) says nothing about the backend's health
+            self.breaker.release_trial()
+
+    def _call_with_deadline(self, fn: Callable[[], T], deadline: float) -> T:
+        future = _call_executor.submit(fn)
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            # The worker cannot be interrupted; its late result is discarded
+            future.cancel()
+            raise DeadlineExceededError() from None
+
+    def generate(self, prompt: str) -> str:
+        text = self._with_retries(prompt, lambda deadline: self._call_with_deadline(
+            lambda: self.inner.generate(prompt), deadline), "generate")
+        self.limiter.record_response(estimate_tokens(text))
+        return text
+
+    def generate_json(self, prompt: str, schema: Dict) -> str:
+        text = self._with_retries(prompt, lambda deadline: self._call_with_deadline(
+            lambda: self.inner.generate_json(prompt, schema), deadline), "json")
+        self.limiter.record_response(estimate_tokens(text))
+        return text
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        # Retries are only possible until the first chunk has been handed to the caller
+        def first_chunk(deadline: float):
+            chunks = self.inner.generate_stream(prompt)
+            first = self._call_with_deadline(lambda: next(chunks, None), deadline)
+            return chunks, first, deadline
+
+        chunks, first, deadline = self._with_retries(prompt, first_chunk, "stream")
+        if first is None:
+            return
+        response_chars = len(first)
+        yield first
+        try:
+            while True:
+                # Each chunk is awaited with the deadline, so a stream that stalls mid-response still ends
+                chunk = self._call_with_deadline(lambda: next(chunks, None), deadline)
+                if chunk is None:
+                    break
+                response_chars += len(chunk)
+                yield chunk
+        except Exception as e:
+            self._record_breaker_failure(e)
+            self._count("failures")
+            raise
+        finally:
+            self.limiter.record_response(max(1, response_chars // 4))
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_breakers: Dict[str, CircuitBreaker] = {}
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter(namespace: str) -> RateLimiter:
+    with _shared_lock:
+        if namespace not in _shared_limiters:
+            _shared_limiters[namespace] = RateLimiter(
+                requests_per_minute=_env_number("LLM_REQUESTS_PER_MINUTE", 60),
+                tokens_per_minute=_env_number("LLM_TOKENS_PER_MINUTE", 1_000_000),
+            )
+        return _shared_limiters[namespace]
+
+
+def get_circuit_breaker(namespace: str) -> CircuitBreaker:
+    with _shared_lock:
+        if namespace not in _shared_breakers:
+            _shared_breakers[namespace] = CircuitBreaker(
+                failure_threshold=int(_env_number("LLM_BREAKER_FAILURES", 5)),
+                reset_timeout=_env_number("LLM_BREAKER_RESET_SECONDS", 30),
+            )
+        return _shared_breakers[namespace]
+
+
+def make_resilient(backend: LLMBackend) -> LLMBackend:
+    """Wrap backend with the process-wide limiter and breaker for its namespace."""
+    if isinstance(backend, ResilientBackend):
+        return backend
+    return ResilientBackend(
+        backend,
+        limiter=get_rate_limiter(backend.cache_namespace),
+        breaker=get_circuit_breaker(backend.cache_namespace),
+        retry_policy=RetryPolicy(max_attempts=int(_env_number("LLM_MAX_ATTEMPTS", 4))),
+        call_timeout=_env_number("LLM_CALL_TIMEOUT", 60),
+    )
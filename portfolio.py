@@ -0,0 +1,269 @@
+"""Nightly sprint-health pass across many teams.
+
+    python portfolio.py teams.jsonl --output health.jsonl --max-concurrency 8
+    python portfolio.py --store team_a.sqlite3 --store team_b.sqlite3 --output health.jsonl
+
+Results are appended to the output as JSONL and fsynced one team at a time,
+so an interrupted run is resumed by running the same command again.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from project_store import ProjectStore
+from scrum_master_agent import ScrumMasterAgent, SprintData
+
+_LIST_FIELDS = ("team_members", "impediments", "risks")
+
+
+@dataclass
+class PortfolioEntry:
+    team: str
+    sprint: SprintData
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        return self.team, self.sprint.sprint_number
+
+
+@dataclass
+class PortfolioReport:
+    teams: int
+    skipped: int
+    completed: int
+    failed: int
+    seconds: float
+
+    def __str__(self) -> str:
+        return (f"{self.teams} teams: {self.completed} analyzed, {self.failed} failed, "
+                f"{self.skipped} already done ({self.seconds:.1f}s)")
+
+
+def sprint_from_record(record: Dict) -> SprintData:
+    """SprintData from a JSON object or CSV row; list fields may be lists or ';'-separated strings."""
+    lists = {}
+    for name in _LIST_FIELDS:
+        value = record.get(name) or []
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(";") if item.strip()]
+        lists[name] = list(value)
+    return SprintData(
+        sprint_number=int(record["sprint_number"]),
+        start_date=datetime.fromisoformat(str(record["start_date"])),
+        end_date=datetime.fromisoformat(str(record["end_date"])),
+        total_story_points=int(record["total_story_points"]),
+        completed_story_points=int(record["completed_story_points"]),
+        **lists,
+    )
+
+
+def load_portfolio(path: str) -> List[PortfolioEntry]:
+    """Sprint records from a JSONL, JSON (list) or CSV file; each record needs a "team" field."""
+    if path.lower().endswith(".csv"):
+        records = pd.read_csv(path, dtype=str, keep_default_na=False).to_dict("records")
+    else:
+        with open(path, encoding="utf-8") as f:
+            if path.lower().endswith(".json"):
+                records = json.load(f)
+            else:
+                records = [json.loads(line) for line in f if line.strip()]
+    entries = []
+    for line, record in enumerate(records, 1):
+        try:
+            entries.append(PortfolioEntry(team=str(record["team"]), sprint=sprint_from_record(record)))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"{path}: record {line} is invalid ({type(e).__name__}: {e})") from None
+    return entries
+
+
+def load_stores(paths: List[str]) -> List[PortfolioEntry]:
+    """The latest sprint of each project database; the team is named after the file."""
+    entries = []
+    for path in paths:
+        store = ProjectStore(path)
+        number = store.latest_sprint_number() if store.persistent else None
+        if number is None:
+            raise ValueError(f"{path}: no sprints found")
+        team = os.path.splitext(os.path.basename(path))[0]
+        entries.append(PortfolioEntry(team=team, sprint=store.load_sprint(number)))
+    return entries
+
+
+def portfolio_metrics(entries: List[PortfolioEntry], now: Optional[datetime] = None) -> pd.DataFrame:
+    """Local health metrics for every team in one vectorized pass, indexed like entries.
+
+    schedule_gap is the completion rate minus the share of the sprint that has
+    elapsed; the local status is Red below -0.25 or with three or more
+    impediments, Yellow below -0.1 or with any impediment, Green otherwise.
+    """
+    now = now or datetime.now()
+    sprints = [entry.sprint for entry in entries]
+    total = np.fromiter((s.total_story_points for s in sprints), dtype=np.float64, count=len(sprints))
+    completed = np.fromiter((s.completed_story_points for s in sprints), dtype=np.float64, count=len(sprints))
+    start = pd.to_datetime([s.start_date for s in sprints]).to_numpy()
+    end = pd.to_datetime([s.end_date for s in sprints]).to_numpy()
+    day = np.timedelta64(1, "D")
+
+    sprint_days = np.maximum((end - start) / day, 1.0)
+    days_remaining = np.clip(np.floor((end - np.datetime64(now)) / day), 0, None)
+    elapsed = np.clip(1.0 - days_remaining / sprint_days, 0.0, 1.0)
+    completion = np.divide(completed, total, out=np.zeros_like(total), where=total > 0)
+    impediments = np.fromiter((len(s.impediments) for s in sprints), dtype=np.int64, count=len(sprints))
+    gap = completion - elapsed
+
+    status = np.select([(gap < -0.25) | (impediments >= 3), (gap < -0.1) | (impediments > 0)],
+                       ["Red", "Yellow"], default="Green")
+    return pd.DataFrame({
+        "team": [entry.team for entry in entries],
+        "sprint_number": [s.sprint_number for s in sprints],
+        "completion_rate": completion.round(3),
+        "days_remaining": days_remaining.astype(np.int64),
+        "sprint_days": sprint_days.astype(np.int64),
+        "schedule_gap": gap.round(3),
+        "remaining_points": total - completed,
+        "team_size": [len(s.team_members) for s in sprints],
+        "impediment_count": impediments,
+        "risk_count": [len(s.risks) for s in sprints],
+        "local_status": status,
+    })
+
+
+def _completed_keys(output_path: str) -> Set[Tuple[str, int]]:
+    """Teams already analyzed successfully; a line cut off by a crash is truncated away."""
+    if not os.path.exists(output_path):
+        return set()
+    with open(output_path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+            data = data[:data.rfind(b"\n") + 1]
+    done = set()
+    for line in data.decode("utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if not record.get("error"):
+            done.add((record["team"], int(record["sprint_number"])))
+    return done
+
+
+def _records(pending: List[int], entries: List[PortfolioEntry], metrics: pd.DataFrame, agent: ScrumMasterAgent,
+             max_concurrency: int, refresh: bool) -> Iterator[Dict]:
+    # A bounded window of futures keeps memory flat however many teams there are
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="portfolio")
+    queue = iter(pending)
+    in_flight = {}
+    try:
+        while True:
+            while len(in_flight) < max_concurrency * 2:
+                index = next(queue, None)
+                if index is None:
+                    break
+                future = executor.submit(agent.analyze_sprint_health, entries[index].sprint, refresh)
+                in_flight[future] = index
+            if not in_flight:
+                return
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    analysis = future.result()
+                except Exception as e:
+                    analysis = f"Error analyzing sprint: {str(e)}"
+                failed = analysis.startswith("Error ") or analysis == agent.not_configured_message
+                yield {
+                    **metrics.iloc[index].to_dict(),
+                    "analysis": analysis,
+                    "error": failed,
+                    "analyzed_at": datetime.now().isoformat(timespec="seconds"),
+                }
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_portfolio(entries: List[PortfolioEntry], output_path: str, agent: Optional[ScrumMasterAgent] = None,
+                  max_concurrency: int = 8, resume: bool = True, refresh: bool = False,
+                  on_result: Optional[Callable[[Dict], None]] = None) -> PortfolioReport:
+    """Analyze every team's sprint, appending one fsynced JSONL line per team as it finishes.
+
+    With resume, teams that already have a successful line in the output are
+    skipped; failed ones are retried. Without it the output is overwritten.
+    """
+    started = time.perf_counter()
+    agent = agent or ScrumMasterAgent()
+    if not resume and os.path.exists(output_path):
+        os.remove(output_path)
+    done = _completed_keys(output_path)
+    pending = [i for i, entry in enumerate(entries) if entry.key not in done]
+    metrics = portfolio_metrics(entries)
+    completed = failed = 0
+
+    with open(output_path, "a", encoding="utf-8") as out:
+        for record in _records(pending, entries, metrics, agent, max_concurrency, refresh):
+            out.write(json.dumps(record, default=_json_default) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+            failed += record["error"]
+            completed += not record["error"]
+            if on_result is not None:
+                on_result(record)
+    return PortfolioReport(teams=len(entries), skipped=len(entries) - len(pending), completed=completed,
+                           failed=failed, seconds=time.perf_counter() - started)
+
+
+def _json_default(value):
+    # numpy scalars from the metrics frame
+    return value.item() if isinstance(value, np.generic) else str(value)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sprint-health analysis across many teams.")
+    parser.add_argument("input", nargs="?", help="JSONL, JSON or CSV of sprint records with a 'team' field")
+    parser.add_argument("--store", action="append", default=[], metavar="PATH",
+                        help="project database to include (its latest sprint); repeatable")
+    parser.add_argument("--output", default="portfolio_health.jsonl")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="sprint analyses running at once")
+    parser.add_argument("--no-resume", action="store_true", help="start over instead of skipping teams already done")
+    parser.add_argument("--refresh", action="store_true", help="bypass the response cache")
+    parser.add_argument("--metrics-only", action="store_true", help="print the local metrics without calling the model")
+    args = parser.parse_args(argv)
+
+    if not args.input and not args.store:
+        parser.error("pass an input file or at least one --store")
+    try:
+        entries = (load_portfolio(args.input) if args.input else []) + load_stores(args.store)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if args.metrics_only:
+        metrics = portfolio_metrics(entries)
+        # Worst first: Red before Yellow before Green, then by how far behind schedule
+        severity = metrics["local_status"].map({"Red": 0, "Yellow": 1, "Green": 2})
+        print(metrics.iloc[np.lexsort((metrics["schedule_gap"], severity))].to_string(index=False))
+        return 0
+
+    agent = ScrumMasterAgent()
+    if not agent.api_configured:
+        print(agent.not_configured_message, file=sys.stderr)
+        return 1
+    report = run_portfolio(entries, args.output, agent=agent, max_concurrency=args.max_concurrency,
+                           resume=not args.no_resume, refresh=args.refresh,
+                           on_result=lambda record: print(f"{record['team']}: {record['local_status']}"
+                                                          f"{' (failed)' if record['error'] else ''}", file=sys.stderr))
+    print(report)
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+from scrum_master_agent import SprintData
+
+DEFAULT_PROJECT_PATH = os.path.join(os.path.expanduser("~"), ".scrum_agent", "project.sqlite3")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sprints ("
+    "sprint_number INTEGER PRIMARY KEY, start_date TEXT NOT NULL, end_date TEXT NOT NULL, "
+    "total_story_points INTEGER NOT NULL, completed_story_points INTEGER NOT NULL, risks TEXT NOT NULL DEFAULT '')",
+    "CREATE TABLE IF NOT EXISTS members (name TEXT PRIMARY KEY, position INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS tasks ("
+    "task_id TEXT PRIMARY KEY, description TEXT NOT NULL DEFAULT '', status TEXT, assignee TEXT, "
+    "story_points INTEGER, updated_at REAL NOT NULL, rev INTEGER NOT NULL DEFAULT 0)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks (assignee)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks (updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_rev ON tasks (rev)",
+    # Per-table write counters; they never go back, even when rows are deleted
+    "CREATE TABLE IF NOT EXISTS revisions (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS backlog ("
+    "story_id TEXT PRIMARY KEY, description TEXT NOT NULL DEFAULT '', priority TEXT, story_points INTEGER)",
+    "CREATE INDEX IF NOT EXISTS idx_backlog_priority ON backlog (priority)",
+    "CREATE TABLE IF NOT EXISTS updates ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, member TEXT NOT NULL, content TEXT NOT NULL, created_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_updates_created ON updates (created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_updates_member ON updates (member, created_at)",
+    "CREATE TABLE IF NOT EXISTS feedback ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, sprint_number INTEGER NOT NULL, content TEXT NOT NULL, created_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_feedback_sprint ON feedback (sprint_number)",
+    "CREATE TABLE IF NOT EXISTS impediments ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, sprint_number INTEGER NOT NULL, description TEXT NOT NULL, "
+    "created_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_impediments_sprint ON impediments (sprint_number)",
+    "CREATE TABLE IF NOT EXISTS time_logs ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, task_id TEXT, member TEXT NOT NULL, hours REAL NOT NULL, logged_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_time_logs_member ON time_logs (member, logged_at)",
+)
+# Columns added after a table was first released: table -> (column, definition)
+_MIGRATIONS = (
+    ("tasks", "story_points", "INTEGER"),
+    ("tasks", "rev", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+# Tracker tables exposed as DataFrames: database column -> column name shown in the app
+TABLE_COLUMNS: Dict[str, Dict[str, str]] = {
+    "tasks": {"task_id": "Task ID", "description": "Description", "status": "Status", "assignee": "Assignee",
+              "story_points": "Story Points"},
+    "backlog": {"story_id": "Story ID", "description": "Description", "priority": "Priority", "story_points": "Story Points"},
+    "updates": {"member": "Team Member", "content": "Update", "created_at": "Timestamp"},
+    "time_logs": {"task_id": "Task ID", "member": "Team Member", "hours": "Hours", "logged_at": "Logged At"},
+}
+# Stored columns that are not shown in the app
+_EXTRA_COLUMNS = {"tasks": ("updated_at",)}
+# Columns stored as epoch seconds and exposed as datetimes; missing ones default to the insert time.
+# Datetimes are naive local wall-clock times, stored as if they were UTC (_epoch), which is how
+# pandas converts naive datetimes both ways, so every write path and query agree in any time zone
+_TIMESTAMP_COLUMNS = {"updates": "created_at", "time_logs": "logged_at"}
+# Free-text column matched by the search box of each table
+_SEARCH_COLUMNS = {"tasks": "description", "backlog": "description", "updates": "content", "time_logs": "task_id"}
+# Rows per executemany batch for bulk inserts
+_INSERT_BATCH = 10_000
+
+
+def _epoch(value: Optional[datetime] = None) -> float:
+    """Seconds since 1970 of a naive datetime (default: now) read as UTC."""
+    return pd.Timestamp(value or datetime.now()).timestamp()
+
+
+class ProjectStore:
+    """Sprint, team and tracker data persisted in SQLite and shared by every session.
+
+    The database runs in WAL mode, so sessions read concurrently while a
+    write is in progress. Connections come from a small pool because
+    Streamlit runs each script rerun on a new thread. Writes go through one
+    lock so they queue here instead of failing with "database is locked".
+    When the file cannot be opened, the store falls back to a single
+    in-memory connection for the lifetime of the process.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_PROJECT_PATH, pool_size: int = 8):
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=pool_size)
+        self._write_lock = threading.Lock()
+        self._path = path
+        # Single connection (and lock) used instead of the pool when running in memory
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        self._memory_lock = threading.Lock()
+        self.persistent = False
+        if path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self._init_schema()
+                self.persistent = True
+            except (sqlite3.Error, OSError):
+                pass
+        if not self.persistent:
+            self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._init_schema()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, check_same_thread=False, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_schema(self):
+        with self._write_lock, self._connection() as conn:
+            for table, column, definition in _MIGRATIONS:
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if existing and column not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if self._memory_conn is not None:
+            with self._memory_lock:
+                yield self._memory_conn
+            return
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def _read(self, sql: str, params=()) -> List[tuple]:
+        with self._connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def _write(self, sql: str, params=()) -> int:
+        with self._write_lock, self._connection() as conn:
+            cursor = conn.execute(sql, params)
+            conn.commit()
+            return cursor.lastrowid
+
+    @staticmethod
+    def _next_revision(conn: sqlite3.Connection, table: str) -> int:
+        # Called with the write lock held, so revisions follow commit order
+        conn.execute("INSERT INTO revisions (name, value) VALUES (?, 1) "
+                     "ON CONFLICT (name) DO UPDATE SET value = value + 1", (table,))
+        return conn.execute("SELECT value FROM revisions WHERE name = ?", (table,)).fetchone()[0]
+
+    def is_empty(self) -> bool:
+        return not self._read("SELECT 1 FROM sprints LIMIT 1")
+
+    # Sprints, members, impediments and feedback
+
+    def save_sprint(self, sprint_data: SprintData):
+        self._write(
+            "INSERT INTO sprints (sprint_number, start_date, end_date, total_story_points, completed_story_points, risks) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (sprint_number) DO UPDATE SET "
+            "start_date = excluded.start_date, end_date = excluded.end_date, total_story_points = excluded.total_story_points, "
+            "completed_story_points = excluded.completed_story_points, risks = excluded.risks",
+            (sprint_data.sprint_number, sprint_data.start_date.isoformat(), sprint_data.end_date.isoformat(),
+             sprint_data.total_story_points, sprint_data.completed_story_points, "\n".join(sprint_data.risks)),
+        )
+
+    def latest_sprint_number(self) -> Optional[int]:
+        return self._read("SELECT MAX(sprint_number) FROM sprints")[0][0]
+
+    def load_sprint(self, sprint_number: int) -> Optional[SprintData]:
+        rows = self._read(
+            "SELECT start_date, end_date, total_story_points, completed_story_points, risks FROM sprints WHERE sprint_number = ?",
+            (sprint_number,),
+        )
+        if not rows:
+            return None
+        start_date, end_date, total, completed, risks = rows[0]
+        return SprintData(
+            sprint_number=sprint_number,
+            start_date=datetime.fromisoformat(start_date),
+            end_date=datetime.fromisoformat(end_date),
+            total_story_points=total,
+            completed_story_points=completed,
+            team_members=self.members(),
+            impediments=self.impediments(sprint_number),
+            risks=[risk for risk in risks.split("\n") if risk],
+        )
+
+    def set_members(self, names: List[str]):
+        with self._write_lock, self._connection() as conn:
+            conn.execute("DELETE FROM members")
+            conn.executemany("INSERT INTO members (name, position) VALUES (?, ?)", [(n, i) for i, n in enumerate(names)])
+            conn.commit()
+
+    def members(self) -> List[str]:
+        return [row[0] for row in self._read("SELECT name FROM members ORDER BY position")]
+
+    def add_impediment(self, sprint_number: int, description: str):
+        self._write("INSERT INTO impediments (sprint_number, description, created_at) VALUES (?, ?, ?)",
+                    (sprint_number, description, time.time()))
+
+    def impediments(self, sprint_number: int) -> List[str]:
+        return [row[0] for row in self._read(
+            "SELECT description FROM impediments WHERE sprint_number = ? ORDER BY id", (sprint_number,))]
+
+    def add_feedback(self, sprint_number: int, content: str):
+        self._write("INSERT INTO feedback (sprint_number, content, created_at) VALUES (?, ?, ?)",
+                    (sprint_number, content, time.time()))
+
+    def feedback(self, sprint_number: int) -> List[str]:
+        return [row[0] for row in self._read(
+            "SELECT content FROM feedback WHERE sprint_number = ? ORDER BY id", (sprint_number,))]
+
+    def add_update(self, member: str, content: str, timestamp: Optional[datetime] = None):
+        self._write("INSERT INTO updates (member, content, created_at) VALUES (?, ?, ?)",
+                    (member, content, _epoch(timestamp)))
+
+    def set_task_status(self, task_id: str, status: str):
+        with self._write_lock, self._connection() as conn:
+            conn.execute("UPDATE tasks SET status = ?, updated_at = ?, rev = ? WHERE task_id = ?",
+                         (status, time.time(), self._next_revision(conn, "tasks"), task_id))
+            conn.commit()
+
+    def log_time(self, member: str, hours: float, task_id: Optional[str] = None, logged_at: Optional[datetime] = None):
+        self._write("INSERT INTO time_logs (task_id, member, hours, logged_at) VALUES (?, ?, ?, ?)",
+                    (task_id, member, hours, _epoch(logged_at)))
+
+    # Incremental reads: rows written since a watermark, with database column names
+
+    def tasks_changed_since(self, rev: int) -> pd.DataFrame:
+        """Tasks written after revision rev; pass -1 to include rows older than the rev column."""
+        # Revisions are assigned under the write lock in the writing transaction, so a
+        # change committed after a reader's watermark always carries a later revision
+        rows = self._read("SELECT task_id, assignee, status, story_points, rev FROM tasks WHERE rev > ?", (rev,))
+        return pd.DataFrame(rows, columns=["task_id", "assignee", "status", "story_points", "rev"])
+
+    def time_logs_since(self, log_id: int) -> pd.DataFrame:
+        rows = self._read("SELECT id, task_id, member, hours, logged_at FROM time_logs WHERE id > ? ORDER BY id", (log_id,))
+        return pd.DataFrame(rows, columns=["id", "task_id", "member", "hours", "logged_at"])
+
+    # Tracker tables
+
+    def bulk_insert(self, table: str, frame: pd.DataFrame) -> int:
+        """Insert (or replace, for keyed tables) rows given with either database or display column names."""
+        columns = self._columns(table)
+        display_to_db = {display: column for column, display in columns.items()}
+        frame = frame.rename(columns=display_to_db)
+        frame = frame[[c for c in (*columns, *_EXTRA_COLUMNS.get(table, ())) if c in frame.columns]]
+        if table == "tasks" and "updated_at" not in frame.columns:
+            frame = frame.assign(updated_at=time.time())
+        timestamp = _TIMESTAMP_COLUMNS.get(table)
+        if timestamp is not None and timestamp not in frame.columns:
+            frame = frame.assign(**{timestamp: _epoch()})
+        elif timestamp is not None:
+            frame = frame.assign(**{timestamp: pd.to_datetime(frame[timestamp]).map(pd.Timestamp.timestamp)})
+        # Plain Python objects so compact dtypes (categoricals, int8) bind as SQLite values
+        values = frame.astype(object).where(frame.notna(), None)
+        names = [*values.columns, "rev"] if table == "tasks" else list(values.columns)
+        sql = (f"INSERT OR REPLACE INTO {table} ({', '.join(names)}) "
+               f"VALUES ({', '.join('?' for _ in names)})")
+        rows = values.itertuples(index=False, name=None)
+        with self._write_lock, self._connection() as conn:
+            if table == "tasks":
+                # One revision for the whole insert; it commits as one transaction
+                rev = (self._next_revision(conn, "tasks"),)
+                rows = (row + rev for row in rows)
+            while True:
+                batch = list(itertools.islice(rows, _INSERT_BATCH))
+                if not batch:
+                    break
+                conn.executemany(sql, batch)
+            conn.commit()
+        return len(values)
+
+    def clear(self, table: str):
+        self._columns(table)
+        self._write(f"DELETE FROM {table}")
+
+    @staticmethod
+    def _columns(table: str) -> Dict[str, str]:
+        if table not in TABLE_COLUMNS:
+            raise ValueError(f"Unknown tracker table '{table}'. Expected one of {sorted(TABLE_COLUMNS)}.")
+        return TABLE_COLUMNS[table]
+
+    def _where(self, table: str, filters: Optional[Dict[str, object]], search: Optional[str],
+               exclude: Optional[Dict[str, Sequence]] = None):
+        columns = self._columns(table)
+        clauses, params = [], []
+        for column in [*(filters or {}), *(exclude or {})]:
+            if column not in columns:
+                raise ValueError(f"Unknown column '{column}' for table '{table}'")
+        for column, value in (filters or {}).items():
+            if value is None:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        for column, values in (exclude or {}).items():
+            clauses.append(f"({column} IS NULL OR {column} NOT IN ({', '.join('?' for _ in values)}))")
+            params.extend(values)
+        if search:
+            clauses.append(f"{_SEARCH_COLUMNS[table]} LIKE ?")
+            params.append(f"%{search}%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, table: str, filters: Optional[Dict[str, object]] = None, search: Optional[str] = None,
+              order_by: Optional[str] = None, descending: bool = False, limit: int = 50, offset: int = 0,
+              exclude: Optional[Dict[str, Sequence]] = None) -> pd.DataFrame:
+        """One page of a tracker table with display column names; only that page is read."""
+        columns = self._columns(table)
+        where, params = self._where(table, filters, search, exclude)
+        if order_by is not None and order_by not in columns:
+            raise ValueError(f"Unknown column '{order_by}' for table '{table}'")
+        order = f"{order_by or 'rowid'} {'DESC' if descending else 'ASC'}"
+        rows = self._read(f"SELECT {', '.join(columns)} FROM {table}{where} ORDER BY {order} LIMIT ? OFFSET ?",
+                          (*params, limit, offset))
+        frame = pd.DataFrame(rows, columns=list(columns))
+        if table in _TIMESTAMP_COLUMNS:
+            frame[_TIMESTAMP_COLUMNS[table]] = pd.to_datetime(frame[_TIMESTAMP_COLUMNS[table]], unit="s").dt.floor("s")
+        return frame.rename(columns=columns)
+
+    def top_rows(self, table: str, column: str, order: Dict[str, int], limit: int) -> pd.DataFrame:
+        """The first limit rows ranked by order on column, read one indexed category at a time."""
+        frames, remaining = [], limit
+        for value in sorted(order, key=order.get):
+            if remaining <= 0:
+                break
+            frames.append(self.query(table, filters={column: value}, limit=remaining))
+            remaining -= len(frames[-1])
+        if remaining > 0:
+            # Values missing from order rank last
+            frames.append(self.query(table, exclude={column: list(order)}, limit=remaining))
+        return pd.concat(frames, ignore_index=True)
+
+    def count(self, table: str, filters: Optional[Dict[str, object]] = None, search: Optional[str] = None) -> int:
+        where, params = self._where(table, filters, search)
+        return self._read(f"SELECT COUNT(*) FROM {table}{where}", params)[0][0]
+
+    def distinct(self, table: str, column: str) -> List[str]:
+        if column not in self._columns(table):
+            raise ValueError(f"Unknown column '{column}' for table '{table}'")
+        return [row[0] for row in self._read(f"SELECT DISTINCT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY {column}")]
+
+    def total(self, table: str, column: str) -> float:
+        if column not in self._columns(table):
+            raise ValueError(f"Unknown column '{column}' for table '{table}'")
+        return self._read(f"SELECT COALESCE(SUM({column}), 0) FROM {table}")[0][0]
+
+
+_shared_store: Optional[ProjectStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_project_store() -> ProjectStore:
+    """Process-wide store shared by every Streamlit session."""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            path = os.getenv("SCRUM_AGENT_PROJECT_PATH", DEFAULT_PROJECT_PATH)
+            _shared_store = ProjectStore(path=path or None)
+        return _shared_store
@@ -0,0 +1,184 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".scrum_agent", "response_cache.sqlite3")
+
+# Seconds a cached response stays valid, per ScrumMasterAgent method.
+# None means never expire, 0 disables caching for that method.
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    "generate_daily_standup_questions": 12 * 3600,
+    "analyze_sprint_health": 15 * 60,
+    "generate_retrospective_insights": 24 * 3600,
+    "suggest_impediment_resolution": 7 * 24 * 3600,
+    "generate_scrum_master_recommendations": 3600,
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    # Prompts are indented f-strings, so collapse whitespace before hashing
+    return _WHITESPACE_RE.sub(" ", prompt).strip()
+
+
+def make_cache_key(model_name: str, prompt: str) -> str:
+    digest = hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+    return f"{model_name}:{digest}"
+
+
+class ResponseCache:
+    """Bounded in-memory LRU of LLM responses backed by an on-disk SQLite store."""
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH, max_entries: int = 512,
+                 ttls: Optional[Dict[str, Optional[float]]] = None, default_ttl: Optional[float] = 3600):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._memory: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+        self._conn = self._connect(path) if path else None
+
+    def _connect(self, path: str) -> Optional[sqlite3.Connection]:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, method TEXT NOT NULL, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_method_created ON responses (method, created_at)")
+            conn.commit()
+        except (sqlite3.Error, OSError):
+            # Fall back to a memory-only cache when the store is unavailable
+            return None
+        self._conn = conn
+        self.purge_expired()
+        return conn
+
+    def ttl_for(self, method: str) -> Optional[float]:
+        return self.ttls.get(method, self.default_ttl)
+
+    def _is_fresh(self, method: str, created_at: float) -> bool:
+        ttl = self.ttl_for(method)
+        return ttl is None or time.time() - created_at < ttl
+
+    def get(self, key: str, method: str) -> Optional[str]:
+        if self.ttl_for(method) == 0:
+            return None
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(method, entry[2]):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry[0]
+                del self._memory[key]
+
+            row = None
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+            if row is not None and self._is_fresh(method, row[1]):
+                self._remember(key, (row[0], method, row[1]))
+                self._stats["disk_hits"] += 1
+                return row[0]
+
+            self._stats["misses"] += 1
+            return None
+
+    def get_stale(self, key: str) -> Optional[str]:
+        # Ignores TTLs; used to serve something while the model backend is unhealthy
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                return entry[0]
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+            return row[0] if row else None
+
+    def set(self, key: str, method: str, response: str):
+        if self.ttl_for(method) == 0:
+            return
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, (response, method, created_at))
+            self._stats["writes"] += 1
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, method, response, created_at) VALUES (?, ?, ?, ?)",
+                        (key, method, response, created_at),
+                    )
+                    self._conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def _remember(self, key: str, entry: Tuple[str, str, float]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def purge_expired(self):
+        if self._conn is None:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                for method, ttl in self.ttls.items():
+                    if ttl is not None:
+                        self._conn.execute(
+                            "DELETE FROM responses WHERE method = ? AND created_at < ?", (method, now - ttl)
+                        )
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM responses")
+                    self._conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide cache shared by every Streamlit session."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            path = os.getenv("SCRUM_AGENT_CACHE_PATH", DEFAULT_CACHE_PATH)
+            max_entries = int(os.getenv("SCRUM_AGENT_CACHE_SIZE", "512"))
+            _shared_cache = ResponseCache(path=path or None, max_entries=max_entries)
+        return _shared_cache
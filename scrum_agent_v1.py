@@ -1,16 +1,26 @@
 import streamlit as st
-import google.generativeai as genai
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import functools
 import json
-import re
 import os
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import re
+from typing import Dict, Iterator, Optional, Union
+import threading
 import time
 
+from backlog_import import import_file
+from burndown import BurndownEngine, ideal_burndown_line, sample_burndown_events
+from chart_data import MAX_BARS, line_trace
+from context_builder import build_tracker_context
+from feedback_clustering import cluster_feedback
+from figure_cache import data_fingerprint, get_figure_cache
+from forecasting import BacklogForecast, SprintForecast, forecast_backlog, forecast_sprint
+from metrics import get_metrics, start_metrics_server
+from project_store import TABLE_COLUMNS, ProjectStore, get_project_store
+from scrum_master_agent import ScrumMasterAgent, SprintBriefing, SprintData
+from workload import flag_workload, get_workload_engine, workload_thresholds
+
 # Configure page
 st.set_page_config(
     page_title="AI Scrum Master Agent",
@@ -74,224 +84,155 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@dataclass
-class SprintData:
-    sprint_number: int
-    start_date: datetime
-    end_date: datetime
-    total_story_points: int
-    completed_story_points: int
-    team_members: List[str]
-    impediments: List[str]
-    risks: List[str]
-
-class ScrumMasterAgent:
-    def __init__(self):
-        api_key = os.getenv('GEMINI_API_KEY')
-        if api_key:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
-            self.api_configured = True
-        else:
-            self.model = None
-            self.api_configured = False
-    
-    def generate_daily_standup_questions(self, team_member: str, previous_work: str) -> str:
-        if not self.api_configured:
-            return "❌ Gemini API key not found. Please set the GEMINI_API_KEY environment variable."
-        
-        prompt = f"""
-        As an AI Scrum Master, generate personalized daily standup questions for {team_member}.
-        
-        Previous work context: {previous_work}
-        
-        Generate 3-4 thoughtful questions that will help uncover:
-        1. Progress updates
-        2. Potential blockers
-        3. Plans for today
-        4. Any support needed
-        
-        Make the questions conversational and team-member specific.
-        """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error generating questions: {str(e)}"
-    
-    def analyze_sprint_health(self, sprint_data: SprintData) -> str:
-        if not self.api_configured:
-            return "❌ Gemini API key not found. Please set the GEMINI_API_KEY environment variable."
-        
-        completion_rate = (sprint_data.completed_story_points / sprint_data.total_story_points) * 100
-        days_remaining = (sprint_data.end_date - datetime.now()).days
-        
-        prompt = f"""
-        As an AI Scrum Master, analyze the current sprint health:
-        
-        Sprint {sprint_data.sprint_number} Details:
-        - Completion Rate: {completion_rate:.1f}%
-        - Days Remaining: {days_remaining}
-        - Total Story Points: {sprint_data.total_story_points}
-        - Completed Story Points: {sprint_data.completed_story_points}
-        - Team Size: {len(sprint_data.team_members)}
-        - Active Impediments: {len(sprint_data.impediments)}
-        - Identified Risks: {len(sprint_data.risks)}
-        
-        Provide:
-        1. Sprint health assessment (Red/Yellow/Green)
-        2. Key concerns and recommendations
-        3. Actions for the Scrum Master to take
-        4. Team motivation suggestions
-        
-        Be concise but actionable.
-        """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error analyzing sprint: {str(e)}"
-    
-    def generate_retrospective_insights(self, feedback_data: List[str]) -> str:
-        if not self.api_configured:
-            return "❌ Gemini API key not found. Please set the GEMINI_API_KEY environment variable."
-        
-        prompt = f"""
-        As an AI Scrum Master, analyze this retrospective feedback and generate insights:
-        
-        Team Feedback:
-        {chr(10).join([f"- {feedback}" for feedback in feedback_data])}
-        
-        Provide:
-        1. Key themes and patterns
-        2. Top 3 improvement opportunities
-        3. Specific action items with owners
-        4. Team strengths to celebrate
-        5. Suggested retrospective activities for next time
-        
-        Focus on actionable insights that drive continuous improvement.
-        """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error generating insights: {str(e)}"
-    
-    def suggest_impediment_resolution(self, impediment: str, context: str) -> str:
-        if not self.api_configured:
-            return "❌ Gemini API key not found. Please set the GEMINI_API_KEY environment variable."
-        
-        prompt = f"""
-        As an AI Scrum Master, suggest resolution strategies for this impediment:
-        
-        Impediment: {impediment}
-        Context: {context}
-        
-        Provide:
-        1. Root cause analysis
-        2. 2-3 specific resolution strategies
-        3. Who should be involved in resolution
-        4. Timeline for resolution
-        5. How to prevent similar issues
-        
-        Be practical and consider typical organizational constraints.
-        """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error generating suggestions: {str(e)}"
-
-    def generate_scrum_master_recommendations(self, context: str) -> str:
-        if not self.api_configured:
-            return "❌ Gemini API key not found. Please set the GEMINI_API_KEY environment variable."
-        
-        prompt = f"""
-        As an AI Scrum Master, analyze the following data and provide recommendations:
-
-        {context}
+_seed_lock = threading.Lock()
+TRACKER_PAGE_SIZE = 50
+RENDER_SECONDS = get_metrics().histogram("scrum_agent_render_seconds", "Wall time of each dashboard section render, across sessions", ["section"])
 
-        Based on the provided data, please provide recommendations on:
-        1. What to focus on in the next daily standup.
-        2. What to discuss with the product owner.
-        3. What to bring up in the next sprint planning.
-        4. Any potential risks to the sprint.
-        """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error generating recommendations: {str(e)}"
+def seed_sample_project(store: ProjectStore):
+    # A new store starts with the sample sprint and tracker data
+    team_members = ["Alice", "Bob", "Charlie", "Diana", "Eve"]
+    store.set_members(team_members)
+    store.save_sprint(SprintData(
+        sprint_number=1,
+        start_date=datetime.now() - timedelta(days=7),
+        end_date=datetime.now() + timedelta(days=7),
+        total_story_points=50,
+        completed_story_points=30,
+        team_members=team_members,
+        impediments=[],
+        risks=["Key developer on vacation next week", "Unclear requirements for user story #23"]
+    ))
+    for impediment in ["API dependency blocking feature", "Test environment unavailable"]:
+        store.add_impediment(1, impediment)
+    
+    store.bulk_insert("updates", pd.DataFrame({
+        "Team Member": ["Alice", "Bob", "Charlie", "Diana", "Eve"],
+        "Update": ["Working on feature #123", "Fixing bug #456", "Refactoring the auth module", "Blocked by API dependency", "Writing documentation for new endpoint"]
+    }))
+    store.bulk_insert("tasks", pd.DataFrame({
+        "Task ID": ["FEAT-123", "BUG-456", "REFC-789", "DOC-101"],
+        "Description": ["Implement new user profile page", "Fix login button alignment", "Refactor database connection logic", "Document the new API endpoints"],
+        "Status": ["In Progress", "In Progress", "In Review", "Done"],
+        "Assignee": ["Alice", "Bob", "Charlie", "Eve"],
+        "Story Points": [8, 3, 5, 2]
+    }))
+    # A week of logged hours, one entry per member and working day
+    days = pd.bdate_range(end=datetime.now() - timedelta(days=1), periods=5).normalize() + pd.Timedelta(hours=17)
+    hours = {"Alice": 8, "Bob": 6, "Charlie": 9, "Diana": 7, "Eve": 5}
+    store.bulk_insert("time_logs", pd.DataFrame({
+        "Team Member": [member for member in hours for _ in days],
+        "Hours": [h for h in hours.values() for _ in days],
+        "Logged At": list(days) * len(hours)
+    }))
+    store.bulk_insert("backlog", pd.DataFrame({
+        "Story ID": ["ST-101", "ST-102", "ST-103", "ST-104"],
+        "Description": ["As a user, I want to be able to reset my password", "As an admin, I want to be able to view all users", "As a user, I want to be able to upload a profile picture", "As a user, I want to receive an email notification when my order is shipped"],
+        "Priority": ["High", "Medium", "Low", "High"],
+        "Story Points": [5, 3, 2, 5]
+    }))
 
 def initialize_session_state():
-    if 'sprint_data' not in st.session_state:
-        st.session_state.sprint_data = SprintData(
-            sprint_number=1,
-            start_date=datetime.now() - timedelta(days=7),
-            end_date=datetime.now() + timedelta(days=7),
-            total_story_points=50,
-            completed_story_points=30,
-            team_members=["Alice", "Bob", "Charlie", "Diana", "Eve"],
-            impediments=["API dependency blocking feature", "Test environment unavailable"],
-            risks=["Key developer on vacation next week", "Unclear requirements for user story #23"]
-        )
+    store = get_project_store()
+    with _seed_lock:
+        if store.is_empty():
+            seed_sample_project(store)
     
-    if 'daily_updates' not in st.session_state:
-        st.session_state.daily_updates = []
+    if 'sprint_data' not in st.session_state:
+        sprint_data = store.load_sprint(store.latest_sprint_number())
+        st.session_state.sprint_data = sprint_data
+        st.session_state.sprint_number = sprint_data.sprint_number
+        st.session_state.total_story_points = sprint_data.total_story_points
+        st.session_state.completed_story_points = sprint_data.completed_story_points
+    else:
+        # Other sessions may have changed the team or added impediments
+        sprint_data = st.session_state.sprint_data
+        sprint_data.team_members = store.members()
+        sprint_data.impediments = store.impediments(sprint_data.sprint_number)
 
-    if 'team_updates' not in st.session_state:
-        st.session_state.team_updates = pd.DataFrame({
-            "Team Member": ["Alice", "Bob", "Charlie", "Diana", "Eve"],
-            "Update": ["Working on feature #123", "Fixing bug #456", "Refactoring the auth module", "Blocked by API dependency", "Writing documentation for new endpoint"]
+    if 'velocity_history' not in st.session_state:
+        st.session_state.velocity_history = pd.DataFrame({
+            "Sprint": ['Sprint 1', 'Sprint 2', 'Sprint 3', 'Sprint 4', 'Sprint 5'],
+            "Planned": [45, 50, 48, 52, 50],
+            "Completed": [42, 47, 45, 50, 48]
         })
+    
+    if 'burndown' not in st.session_state:
+        st.session_state.burndown = BurndownEngine()
+        st.session_state.burndown.append(sample_burndown_events(st.session_state.sprint_data))
+    
+    if 'render_timings' not in st.session_state:
+        st.session_state.render_timings = {}
 
-    if 'current_implementations' not in st.session_state:
-        st.session_state.current_implementations = pd.DataFrame({
-            "Task ID": ["FEAT-123", "BUG-456", "REFC-789", "DOC-101"],
-            "Description": ["Implement new user profile page", "Fix login button alignment", "Refactor database connection logic", "Document the new API endpoints"],
-            "Status": ["In Progress", "In Progress", "In Review", "Done"]
-        })
+def switch_sprint():
+    store = get_project_store()
+    sprint_data = store.load_sprint(st.session_state.sprint_number)
+    if sprint_data is None:
+        # A new sprint starts when the current one ends and keeps its length
+        current = st.session_state.sprint_data
+        sprint_data = SprintData(
+            sprint_number=st.session_state.sprint_number,
+            start_date=current.end_date,
+            end_date=current.end_date + (current.end_date - current.start_date),
+            total_story_points=current.total_story_points,
+            completed_story_points=0,
+            team_members=store.members(),
+            impediments=[],
+            risks=[]
+        )
+        store.save_sprint(sprint_data)
+    st.session_state.sprint_data = sprint_data
+    st.session_state.total_story_points = sprint_data.total_story_points
+    st.session_state.completed_story_points = sprint_data.completed_story_points
 
-    if 'product_backlog' not in st.session_state:
-        st.session_state.product_backlog = pd.DataFrame({
-            "Story ID": ["ST-101", "ST-102", "ST-103", "ST-104"],
-            "Description": ["As a user, I want to be able to reset my password", "As an admin, I want to be able to view all users", "As a user, I want to be able to upload a profile picture", "As a user, I want to receive an email notification when my order is shipped"],
-            "Priority": ["High", "Medium", "Low", "High"],
-            "Story Points": [5, 3, 2, 5]
-        })
-    
-    if 'retrospective_feedback' not in st.session_state:
-        st.session_state.retrospective_feedback = []
+def save_sprint_settings():
+    sprint_data = st.session_state.sprint_data
+    sprint_data.total_story_points = st.session_state.total_story_points
+    sprint_data.completed_story_points = min(st.session_state.completed_story_points, sprint_data.total_story_points)
+    st.session_state.completed_story_points = sprint_data.completed_story_points
+    get_project_store().save_sprint(sprint_data)
 
-def create_burndown_chart(sprint_data: SprintData):
-    # Sample burndown data
-    days = list(range(15))  # 2-week sprint
-    ideal_burndown = [sprint_data.total_story_points - (i * sprint_data.total_story_points / 14) for i in days]
-    actual_burndown = [50, 48, 45, 42, 38, 35, 32, 30, 30, 28, 25, 22, 20, 18, 15]  # Sample data
+def create_burndown_chart(sprint_data: SprintData, burndown: BurndownEngine):
+    # Plotly is imported on first use so the header and sidebar render before it loads
+    import plotly.graph_objects as go
+    
+    series = burndown.daily_series(sprint_data.sprint_number, sprint_data.start_date, sprint_data.end_date)
+    days = list(range(len(series)))
+    has_events = bool(series["scope"].any())
+    # Ideal line runs from the scope at the start of the sprint down to zero
+    start_scope = series["scope"].iloc[0] if has_events else sprint_data.total_story_points
+    ideal_burndown = ideal_burndown_line(start_scope, len(days))
     
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        x=days, 
-        y=ideal_burndown,
+    fig.add_trace(line_trace(
+        days, 
+        ideal_burndown,
         mode='lines',
         name='Ideal Burndown',
         line=dict(color='#28a745', width=3, dash='dash')
     ))
     
-    fig.add_trace(go.Scatter(
-        x=days[:len(actual_burndown)], 
-        y=actual_burndown,
-        mode='lines+markers',
-        name='Actual Burndown',
-        line=dict(color='#dc3545', width=3),
-        marker=dict(size=8)
-    ))
+    if has_events:
+        # Only days that have already happened have an actual value
+        elapsed = int((series.index <= pd.Timestamp(datetime.now()).normalize()).sum())
+        
+        # Long histories are downsampled server-side and drawn with WebGL (chart_data)
+        fig.add_trace(line_trace(
+            days[:elapsed], 
+            series["remaining"].iloc[:elapsed],
+            mode='lines+markers',
+            name='Actual Burndown',
+            line=dict(color='#dc3545', width=3),
+            marker=dict(size=8)
+        ))
+        
+        fig.add_trace(line_trace(
+            days[:elapsed],
+            series["scope"].iloc[:elapsed],
+            mode='lines',
+            name='Scope',
+            line=dict(color='#667eea', width=2, shape='hv')
+        ))
     
     fig.update_layout(
         title="Sprint Burndown Chart",
@@ -303,16 +244,45 @@ def create_burndown_chart(sprint_data: SprintData):
     
     return fig
 
-def create_velocity_chart():
-    # Sample velocity data
-    sprints = ['Sprint 1', 'Sprint 2', 'Sprint 3', 'Sprint 4', 'Sprint 5']
-    planned = [45, 50, 48, 52, 50]
-    completed = [42, 47, 45, 50, 48]
-    
-    fig = go.Figure(data=[
-        go.Bar(name='Planned', x=sprints, y=planned, marker_color='#667eea'),
-        go.Bar(name='Completed', x=sprints, y=completed, marker_color='#28a745')
-    ])
+def create_velocity_chart(velocity_history: pd.DataFrame, sprint_forecast: Optional[SprintForecast] = None,
+                          backlog_forecast: Optional[BacklogForecast] = None):
+    import plotly.graph_objects as go
+    
+    sprints = list(velocity_history["Sprint"])
+    planned = list(velocity_history["Planned"])
+    completed = list(velocity_history["Completed"])
+    
+    if len(sprints) <= MAX_BARS:
+        fig = go.Figure(data=[
+            go.Bar(name='Planned', x=sprints, y=planned, marker_color='#667eea'),
+            go.Bar(name='Completed', x=sprints, y=completed, marker_color='#28a745')
+        ])
+    else:
+        # Too many sprints for readable bars: downsampled trend lines instead
+        fig = go.Figure(data=[
+            line_trace(sprints, planned, name='Planned', mode='lines', line=dict(color='#667eea')),
+            line_trace(sprints, completed, name='Completed', mode='lines', line=dict(color='#28a745'))
+        ])
+    
+    if sprint_forecast is not None:
+        # Current sprint: P50 forecast with a P10-P90 error bar
+        p10, p50, p90 = (sprint_forecast.points_percentiles[p] for p in (10, 50, 90))
+        fig.add_trace(go.Scatter(
+            name=f'Current Sprint Forecast ({sprint_forecast.completion_probability:.0%} to finish)',
+            x=['Current'],
+            y=[p50],
+            mode='markers',
+            marker=dict(color='#ffc107', size=14, symbol='diamond'),
+            error_y=dict(type='data', symmetric=False, array=[p90 - p50], arrayminus=[p50 - p10])
+        ))
+    
+    if backlog_forecast is not None and backlog_forecast.backlog_points > 0:
+        dates = backlog_forecast.date_percentiles
+        fig.add_annotation(
+            text=f"Backlog ({backlog_forecast.backlog_points:.0f} SP) done by: "
+                 f"P50 {dates[50]:%b %d} · P85 {dates[85]:%b %d} · P95 {dates[95]:%b %d}",
+            xref='paper', yref='paper', x=0, y=1.08, showarrow=False, align='left'
+        )
     
     fig.update_layout(
         title="Team Velocity Trend",
@@ -325,269 +295,593 @@ def create_velocity_chart():
     
     return fig
 
-def create_team_workload_chart(team_members: List[str]):
-    # Sample workload data
-    workload = [8, 6, 9, 7, 5]  # Hours per day
-    colors = ['#ff6b6b' if w > 8 else '#4ecdc4' if w < 6 else '#45b7d1' for w in workload]
+def create_team_workload_chart(summary: pd.DataFrame):
+    import plotly.graph_objects as go
+    
+    flagged = flag_workload(summary)
+    thresholds = workload_thresholds(summary)
+    # Before anyone logs time, points in progress stand in for hours
+    metric, axis_title = ("hours_per_day", "Hours/Day") if flagged["hours_per_day"].any() else ("points_in_progress", "Story Points In Progress")
+    colors = ['#ff6b6b' if over else '#4ecdc4' if under else '#45b7d1'
+              for over, under in zip(flagged["overloaded"], flagged["underloaded"])]
     
     fig = go.Figure(data=[
-        go.Bar(x=team_members, y=workload, marker_color=colors)
+        go.Bar(
+            x=flagged.index,
+            y=flagged[metric],
+            marker_color=colors,
+            customdata=flagged[["wip", "points_in_progress", "overloaded_on"]].to_numpy(),
+            hovertemplate="%{x}: %{y}<br>WIP: %{customdata[0]} tasks<br>Points in progress: %{customdata[1]}"
+                          "<br>Over threshold: %{customdata[2]}<extra></extra>"
+        )
     ])
+    if len(flagged) > 1:
+        fig.add_hline(y=thresholds[metric], line_dash="dash", line_color="#ff6b6b",
+                      annotation_text=f"Overload threshold ({thresholds[metric]:.1f})")
     
     fig.update_layout(
         title="Team Workload Distribution",
         xaxis_title="Team Members",
-        yaxis_title="Hours/Day",
+        yaxis_title=axis_title,
         template="plotly_white",
         height=300
     )
     
     return fig
 
-def main():
-    initialize_session_state()
+def create_story_points_chart(completed_points: int, total_points: int):
+    import plotly.graph_objects as go
     
-    # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🚀 AI Scrum Master Agent</h1>
-        <p>Automating Scrum processes with Intelligent Insights</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Sidebar configuration
+    fig = go.Figure(data=go.Pie(
+        labels=['Completed', 'Remaining'],
+        values=[completed_points, total_points - completed_points],
+        hole=0.3
+    ))
+    fig.update_layout(title="Story Points Progress", height=300)
+    return fig
+
+def create_risk_assessment_chart():
+    import plotly.graph_objects as go
+    
+    # Risk assessment chart
+    risk_levels = ['Low', 'Medium', 'High']
+    risk_counts = [3, 2, 1]  # Sample data
+    fig = go.Figure(data=[go.Bar(x=risk_levels, y=risk_counts, marker_color=['#28a745', '#ffc107', '#dc3545'])])
+    fig.update_layout(title="Risk Assessment", height=300)
+    return fig
+
+def create_team_satisfaction_chart():
+    import plotly.graph_objects as go
+    
+    # Team satisfaction (sample data)
+    satisfaction = ['Very Satisfied', 'Satisfied', 'Neutral', 'Dissatisfied']
+    counts = [2, 2, 1, 0]
+    fig = go.Figure(data=[go.Bar(x=satisfaction, y=counts, marker_color='#667eea')])
+    fig.update_layout(title="Team Satisfaction", height=300)
+    return fig
+
+def render_agent_response(response: Union[str, Iterator[str]]) -> str:
+    # Streamed responses render chunk by chunk; write_stream returns the full text
+    if isinstance(response, str):
+        st.write(response)
+        return response
+    return st.write_stream(response)
+
+def current_briefing() -> Optional[SprintBriefing]:
+    # A briefing only applies to the sprint it was generated for
+    if st.session_state.get("briefing_sprint") != st.session_state.sprint_data.sprint_number:
+        return None
+    return st.session_state.get("briefing")
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_sprint_forecast(velocities: tuple, total_points: int, completed_points: int, days_remaining: int,
+                           sprint_length_days: int) -> SprintForecast:
+    # The simulations are seeded, so identical inputs give identical forecasts; only recompute when one changes
+    return forecast_sprint(velocities, total_points, completed_points, days_remaining, sprint_length_days)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_backlog_forecast(velocities: tuple, backlog_points: float, start: datetime, sprint_length_days: int) -> BacklogForecast:
+    return forecast_backlog(velocities, backlog_points, start, sprint_length_days)
+
+@st.cache_resource(show_spinner=False)
+def get_agent() -> ScrumMasterAgent:
+    # One agent per process: the backend client, caches and index are shared by every session
+    return ScrumMasterAgent()
+
+def record_render_time(section: str):
+    # Keeps the wall time of each render so full and fragment reruns can be compared
+    def decorator(render):
+        @functools.wraps(render)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return render(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                timing = st.session_state.render_timings.setdefault(section, {"last_ms": 0.0, "renders": 0})
+                timing["last_ms"] = elapsed * 1000
+                timing["renders"] += 1
+                RENDER_SECONDS.labels(section).observe(elapsed)
+        return wrapper
+    return decorator
+
+@record_render_time("Sidebar")
+def render_sidebar():
     with st.sidebar:
         st.header("⚙️ Configuration")
         
         # Check if API key is configured
-        agent = ScrumMasterAgent()
+        agent = get_agent()
         if agent.api_configured:
-            st.success("✅ Gemini API Key loaded from environment")
+            st.success(f"✅ {agent.backend.ready_message}")
         else:
-            st.error("❌ GEMINI_API_KEY environment variable not found")
-            st.info("💡 Set your API key: `export GEMINI_API_KEY=your_key_here`")
+            st.error(f"❌ {agent.backend.missing_config_message}")
+            st.info(f"💡 {agent.backend.setup_hint}")
+        breaker = getattr(agent.backend, 'breaker', None)
+        if breaker is not None and breaker.state != breaker.CLOSED:
+            st.warning("⚠️ Model backend is unhealthy; serving cached responses where possible")
+        
+        stream_responses = st.checkbox("⚡ Stream responses", value=True, help="Show the AI response as it is generated instead of waiting for the full answer")
+        bypass_cache = st.checkbox("🔄 Bypass response cache", value=False, help="Request a fresh response from the model and refresh the cached copy")
+        cache_stats = agent.cache.stats()
+        flight_stats = agent.single_flight.stats()
+        st.caption(f"Response cache: {cache_stats['hit_ratio'] * 100:.0f}% hit ratio, {cache_stats['memory_entries']} entries in memory. "
+                   f"{flight_stats['coalesced']} duplicate in-flight requests coalesced.")
         
         st.header("📋 Sprint Settings")
-        sprint_num = st.number_input("Sprint Number", value=1, min_value=1)
-        total_points = st.number_input("Total Story Points", value=50, min_value=1)
-        completed_points = st.slider("Completed Story Points", 0, total_points, 30)
-        
-        # Update sprint data
-        st.session_state.sprint_data.sprint_number = sprint_num
-        st.session_state.sprint_data.total_story_points = total_points
-        st.session_state.sprint_data.completed_story_points = completed_points
+        # Changes are saved to the project store, so every session sees the same sprint
+        st.number_input("Sprint Number", min_value=1, key="sprint_number", on_change=switch_sprint)
+        total_points = st.number_input("Total Story Points", min_value=1, key="total_story_points", on_change=save_sprint_settings)
+        st.slider("Completed Story Points", 0, total_points, key="completed_story_points", on_change=save_sprint_settings)
     
-    # Main dashboard
+    return agent, stream_responses, bypass_cache
+
+@st.fragment
+@record_render_time("Metrics")
+def render_metrics_header(days_remaining: int):
+    sprint_data = st.session_state.sprint_data
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        completion_rate = (completed_points / total_points) * 100
-        st.metric("Sprint Progress", f"{completion_rate:.1f}%", f"{completed_points}/{total_points} SP")
+        completion_rate = (sprint_data.completed_story_points / sprint_data.total_story_points) * 100
+        st.metric("Sprint Progress", f"{completion_rate:.1f}%", f"{sprint_data.completed_story_points}/{sprint_data.total_story_points} SP")
     
     with col2:
-        days_remaining = (st.session_state.sprint_data.end_date - datetime.now()).days
         st.metric("Days Remaining", days_remaining, "days")
     
     with col3:
-        st.metric("Team Size", len(st.session_state.sprint_data.team_members), "members")
+        st.metric("Team Size", len(sprint_data.team_members), "members")
     
     with col4:
-        st.metric("Active Impediments", len(st.session_state.sprint_data.impediments), "blockers")
-    
-    # Charts section
+        st.metric("Active Impediments", len(sprint_data.impediments), "blockers")
+
+@st.fragment
+@record_render_time("Analytics")
+def render_sprint_analytics(sprint_forecast: SprintForecast, backlog_forecast: BacklogForecast):
+    sprint_data = st.session_state.sprint_data
     st.header("📊 Sprint Analytics")
     
+    # Figures are rebuilt only when the data they are drawn from changes
+    figures = get_figure_cache()
     col1, col2 = st.columns(2)
     
     with col1:
-        st.plotly_chart(create_burndown_chart(st.session_state.sprint_data), use_container_width=True)
+        # The actual line depends on today's date as well as the event log
+        burndown_key = data_fingerprint(sprint_data, st.session_state.burndown, datetime.now().date())
+        st.plotly_chart(figures.get_or_build("burndown", burndown_key,
+                                             lambda: create_burndown_chart(sprint_data, st.session_state.burndown)),
+                        use_container_width=True)
     
     with col2:
-        st.plotly_chart(create_velocity_chart(), use_container_width=True)
+        velocity_key = data_fingerprint(st.session_state.velocity_history, sprint_forecast, backlog_forecast)
+        st.plotly_chart(figures.get_or_build("velocity", velocity_key,
+                                             lambda: create_velocity_chart(st.session_state.velocity_history, sprint_forecast, backlog_forecast)),
+                        use_container_width=True)
+    
+    # Incremental: only tasks and time logs changed since the last render are folded in
+    workload = get_workload_engine(get_project_store())
+    workload_key = data_fingerprint(workload.fingerprint(), sprint_data, datetime.now().date())
+    st.plotly_chart(figures.get_or_build("team_workload", workload_key,
+                                         lambda: create_team_workload_chart(
+                                             workload.summary(sprint_data.team_members, sprint_data.start_date, datetime.now()))),
+                    use_container_width=True)
+
+@st.fragment
+@record_render_time("AI Sprint Analysis")
+def render_sprint_analysis_tab(agent: ScrumMasterAgent, stream_responses: bool, bypass_cache: bool,
+                               sprint_forecast: SprintForecast, backlog_forecast: BacklogForecast):
+    st.subheader("AI-Powered Sprint Health Analysis")
     
-    st.plotly_chart(create_team_workload_chart(st.session_state.sprint_data.team_members), use_container_width=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        analyze = st.button("🔍 Analyze Current Sprint", type="primary")
+    with col2:
+        brief = st.button("📋 Full Sprint Briefing", help="Sprint health, recommendations and impediment resolutions from a single model call")
+    
+    if analyze:
+        with st.spinner("Analyzing sprint health..."):
+            analysis = agent.analyze_sprint_health(st.session_state.sprint_data, refresh=bypass_cache, stream=stream_responses,
+                                                   forecast=sprint_forecast, backlog_forecast=backlog_forecast)
+            st.markdown("### Analysis Results")
+            render_agent_response(analysis)
+    
+    if brief:
+        with st.spinner("Preparing the sprint briefing..."):
+            # Same tracker context as the Tracker tab, so its recommendations are served from the cache afterwards
+            context, _ = build_tracker_context(get_project_store(), st.session_state.sprint_data,
+                                               st.session_state.get("context_budget", 3000))
+            st.session_state.briefing = agent.generate_sprint_briefing(st.session_state.sprint_data, context, refresh=bypass_cache,
+                                                                       forecast=sprint_forecast, backlog_forecast=backlog_forecast)
+            st.session_state.briefing_sprint = st.session_state.sprint_data.sprint_number
+        # The briefing also fills the Impediments and Tracker tabs, which live outside this fragment
+        st.rerun(scope="app")
+    
+    briefing = current_briefing()
+    if briefing is not None and not analyze:
+        sources = {"cache": "from the response cache", "batched": "from one model call", "per-section": "from per-section model calls",
+                   "unconfigured": "no model backend configured"}
+        st.markdown(f"### Sprint Briefing ({sources[briefing.source]})")
+        st.write(briefing.sprint_health)
+
+@st.fragment
+@record_render_time("Daily Standup")
+def render_standup_tab(agent: ScrumMasterAgent, stream_responses: bool, bypass_cache: bool):
+    st.subheader("Daily Standup Assistant")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selected_member = st.selectbox("Select Team Member", st.session_state.sprint_data.team_members)
+        previous_work = st.selectbox("Previous Work Context", ["Finished feature X", "Working on bug Y", "Starting new task Z"])
+        
+        if st.button("Generate Standup Questions"):
+            with st.spinner("Generating personalized questions..."):
+                questions = agent.generate_daily_standup_questions(selected_member, previous_work, refresh=bypass_cache, stream=stream_responses)
+                st.markdown("### Suggested Questions")
+                render_agent_response(questions)
+        
+        st.markdown("### Whole Team")
+        max_concurrency = st.slider("Parallel requests", 1, 8, 4, help="Maximum number of team members processed at the same time")
+        if st.button("Generate for All Members"):
+            team_members = st.session_state.sprint_data.team_members
+            placeholders = {member: st.empty() for member in team_members}
+            for member in team_members:
+                placeholders[member].info(f"⏳ {member}: waiting for questions...")
+            # Each member's questions replace its placeholder as soon as they arrive
+            for member, questions in agent.generate_team_standup_questions(team_members, previous_work, max_concurrency=max_concurrency, refresh=bypass_cache):
+                with placeholders[member].container():
+                    st.markdown(f"#### {member}")
+                    st.write(questions)
+    
+    with col2:
+        st.markdown("### Today's Updates")
+        new_update = st.selectbox("Add daily update", ["Making good progress", "Blocked by an issue", "Need help with a task"])
+        if st.button("Add Update"):
+            if new_update:
+                get_project_store().add_update(selected_member, new_update)
+                st.success("Update added!")
+        
+        recent_updates = get_project_store().query("updates", order_by="created_at", descending=True, limit=5)
+        for update in recent_updates.itertuples(index=False):  # Show last 5 updates
+            st.markdown(f"""
+            <div class="task-card">
+                <strong>{update[0]}</strong> - {update[2].strftime('%H:%M')}
+                <br>{update[1]}
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("### Log Time")
+        open_tasks = get_project_store().query("tasks", filters={"assignee": selected_member}, exclude={"status": ["Done"]}, limit=TRACKER_PAGE_SIZE)
+        task_id = st.selectbox("Task", [None] + open_tasks["Task ID"].tolist(), format_func=lambda task: task or "No task")
+        hours = st.number_input("Hours", min_value=0.25, max_value=24.0, value=1.0, step=0.25)
+        new_status = st.selectbox("Move task to", [None, "In Progress", "In Review", "Blocked", "Done"],
+                                  format_func=lambda status: status or "Keep current status", disabled=task_id is None)
+        if st.button("Log Time"):
+            store = get_project_store()
+            store.log_time(selected_member, hours, task_id)
+            if task_id is not None and new_status is not None:
+                store.set_task_status(task_id, new_status)
+            st.toast(f"Logged {hours:g}h for {selected_member}")
+            # The workload chart lives in the analytics fragment
+            st.rerun(scope="app")
+
+@st.fragment
+@record_render_time("Retrospective")
+def render_retrospective_tab(agent: ScrumMasterAgent, stream_responses: bool, bypass_cache: bool):
+    st.subheader("Retrospective Insights")
+    store = get_project_store()
+    sprint_number = st.session_state.sprint_data.sprint_number
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Add Feedback")
+        feedback_text = st.selectbox("Team Feedback", ["The daily standups are effective", "We need to improve our code review process", "The sprint planning was accurate"])
+        if st.button("Add Feedback"):
+            if feedback_text:
+                store.add_feedback(sprint_number, feedback_text)
+                st.success("Feedback added!")
+        
+        retrospective_feedback = store.feedback(sprint_number)
+        if retrospective_feedback:
+            st.markdown("### Current Feedback")
+            feedback_summary = cluster_feedback(retrospective_feedback)
+            st.caption(f"{feedback_summary.total_items} comments, {len(feedback_summary.themes)} distinct themes")
+            for i, theme in enumerate(feedback_summary.themes):
+                st.write(f"{i+1}. {theme.representative}" + (f" (×{theme.count})" if theme.count > 1 else ""))
+    
+    with col2:
+        if retrospective_feedback and st.button("🧠 Generate AI Insights"):
+            with st.spinner("Analyzing retrospective feedback..."):
+                insights = agent.generate_retrospective_insights(retrospective_feedback, refresh=bypass_cache, stream=stream_responses)
+                st.markdown("### AI-Generated Insights")
+                render_agent_response(insights)
+
+@st.fragment
+@record_render_time("Impediments")
+def render_impediments_tab(agent: ScrumMasterAgent, stream_responses: bool, bypass_cache: bool):
+    st.subheader("Impediment Management")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Current Impediments")
+        for i, impediment in enumerate(st.session_state.sprint_data.impediments):
+            st.markdown(f"""
+            <div class="impediment-card">
+                <strong>Impediment {i+1}:</strong> {impediment}
+            </div>
+            """, unsafe_allow_html=True)
+        
+        new_impediment = st.selectbox("Add New Impediment", ["Technical debt is slowing us down", "The staging environment is unstable", "We have a new dependency on another team"])
+        if st.button("Add Impediment"):
+            if new_impediment:
+                get_project_store().add_impediment(st.session_state.sprint_data.sprint_number, new_impediment)
+                st.session_state.sprint_data.impediments.append(new_impediment)
+                st.success("Impediment added!")
+                # The impediment count in the metrics header lives outside this fragment
+                st.rerun(scope="app")
+    
+    with col2:
+        st.markdown("### AI Resolution Suggestions")
+        if st.session_state.sprint_data.impediments:
+            selected_impediment = st.selectbox("Select Impediment", st.session_state.sprint_data.impediments)
+            context = st.selectbox("Additional Context", ["This is a high priority issue", "This is blocking multiple team members", "We need a decision from the product owner"])
+            
+            similar = agent.find_similar_impediments(selected_impediment, context)
+            if similar:
+                with st.expander(f"♻️ Similar past impediments ({similar[0].similarity:.0%} best match)"):
+                    for match in similar:
+                        st.markdown(f"**{match.impediment}** – {match.context} ({match.similarity:.0%} match)")
+                        st.write(match.resolution)
+            
+            if st.button("🔧 Get Resolution Suggestions"):
+                with st.spinner("Generating resolution strategies..."):
+                    suggestions = agent.suggest_impediment_resolution(selected_impediment, context, refresh=bypass_cache, stream=stream_responses)
+                    render_agent_response(suggestions)
+            
+            briefing = current_briefing()
+            if briefing is not None and selected_impediment in briefing.impediment_resolutions:
+                with st.expander("📋 From the sprint briefing"):
+                    st.write(briefing.impediment_resolutions[selected_impediment])
+
+@st.fragment
+@record_render_time("Reports")
+def render_reports_tab(days_remaining: int):
+    sprint_data = st.session_state.sprint_data
+    completed_points = sprint_data.completed_story_points
+    total_points = sprint_data.total_story_points
+    completion_rate = (completed_points / total_points) * 100
+    figures = get_figure_cache()
+    st.subheader("Sprint Reports")
+    
+    # Sprint summary
+    st.markdown("### Sprint Summary")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.plotly_chart(figures.get_or_build("story_points", data_fingerprint(completed_points, total_points),
+                                             lambda: create_story_points_chart(completed_points, total_points)),
+                        use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(figures.get_or_build("risk_assessment", data_fingerprint(), create_risk_assessment_chart),
+                        use_container_width=True)
+    
+    with col3:
+        st.plotly_chart(figures.get_or_build("team_satisfaction", data_fingerprint(), create_team_satisfaction_chart),
+                        use_container_width=True)
+    
+    # Download report
+    if st.button("📥 Generate Sprint Report"):
+        report_data = {
+            'sprint_number': sprint_data.sprint_number,
+            'completion_rate': f"{completion_rate:.1f}%",
+            'total_points': total_points,
+            'completed_points': completed_points,
+            'impediments': len(sprint_data.impediments),
+            'team_size': len(sprint_data.team_members),
+            'days_remaining': days_remaining
+        }
+        
+        st.json(report_data)
+        st.success("Report generated! You can copy the JSON data above.")
+
+def render_tracker_table(title: str, table: str, filter_column: Optional[str] = None,
+                         order_by: Optional[str] = None, descending: bool = False):
+    # Only the visible page is read from the store, so table size does not affect the session
+    store = get_project_store()
+    st.subheader(title)
+    col1, col2, col3 = st.columns([2, 3, 1])
+    filters = {}
+    if filter_column:
+        column_title = TABLE_COLUMNS[table][filter_column]
+        choice = col1.selectbox(column_title, ["All"] + store.distinct(table, filter_column), key=f"{table}_filter")
+        if choice != "All":
+            filters[filter_column] = choice
+    search = col2.text_input("Search", key=f"{table}_search", placeholder=f"Filter {title.lower()}")
+    total = store.count(table, filters, search)
+    pages = max(1, -(-total // TRACKER_PAGE_SIZE))
+    page = col3.number_input("Page", min_value=1, max_value=pages, value=1, key=f"{table}_page_{pages}")
+    st.dataframe(store.query(table, filters, search, order_by=order_by, descending=descending,
+                             limit=TRACKER_PAGE_SIZE, offset=(page - 1) * TRACKER_PAGE_SIZE),
+                 use_container_width=True, hide_index=True)
+    st.caption(f"{total} rows · page {page} of {pages}")
+
+@st.fragment
+@record_render_time("Tracker")
+def render_tracker_tab(agent: ScrumMasterAgent, stream_responses: bool, bypass_cache: bool):
+    with st.expander("📥 Import tracker export"):
+        uploaded = st.file_uploader("CSV, JSONL or Parquet export", type=["csv", "jsonl", "ndjson", "parquet"])
+        import_kind = st.selectbox("Import into", ["Product Backlog", "Current Implementations"])
+        column_map_text = st.text_area("Column mapping (optional)", placeholder="Issue key=Story ID\nSummary=Description",
+                                       help="One EXPORT COLUMN=TARGET COLUMN per line; common tracker headers are recognized automatically")
+        replace_rows = st.checkbox("Replace existing rows")
+        if uploaded is not None and st.button("Import"):
+            column_map = dict(line.split("=", 1) for line in column_map_text.splitlines() if "=" in line)
+            progress = st.empty()
+            try:
+                report = import_file(uploaded, "backlog" if import_kind == "Product Backlog" else "tasks",
+                                     column_map={k.strip(): v.strip() for k, v in column_map.items()}, replace=replace_rows,
+                                     on_progress=lambda rows: progress.caption(f"{rows:,} rows imported..."))
+            except (ValueError, ImportError) as e:
+                st.error(f"Import failed: {e}")
+            else:
+                st.session_state.last_import = str(report)
+                # The backlog feeds the forecasts outside this fragment
+                st.rerun(scope="app")
+        if st.session_state.get("last_import"):
+            st.success(st.session_state.last_import)
+    
+    render_tracker_table("Team Updates", "updates", order_by="created_at", descending=True)
+    render_tracker_table("Current Implementations", "tasks", filter_column="status")
+    render_tracker_table("Product Backlog", "backlog", filter_column="priority")
+
+    st.subheader("AI Scrum Master Recommendations")
+    context_budget = st.number_input("Context token budget", value=3000, min_value=500, step=500, key="context_budget", help="Upper bound on the tokens of tracker data sent to the model")
+    if st.button("🤖 Generate Recommendations"):
+        with st.spinner("Generating recommendations..."):
+            # Rank, truncate and summarize the tracker data to fit the token budget
+            context, context_usage = build_tracker_context(get_project_store(), st.session_state.sprint_data, context_budget)
+            
+            recommendations = agent.generate_scrum_master_recommendations(context, refresh=bypass_cache, stream=stream_responses)
+            render_agent_response(recommendations)
+        
+        with st.expander(f"Context usage: {sum(u.tokens for u in context_usage)} of {context_budget} tokens"):
+            st.dataframe(pd.DataFrame([{
+                "Section": u.title,
+                "Tokens": u.tokens,
+                "Rows": f"{u.rows_included}/{u.rows_total}" if u.rows_total else "-",
+                "Summarized": u.summarized
+            } for u in context_usage]), use_container_width=True)
+    
+    briefing = current_briefing()
+    if briefing is not None:
+        with st.expander("📋 Recommendations from the sprint briefing"):
+            st.write(briefing.recommendations)
+
+def render_diagnostics():
+    # Rendered last so the numbers include this run; fragment-only reruns show up on the next full run
+    with st.sidebar:
+        with st.expander("⏱️ Render timings"):
+            st.dataframe(pd.DataFrame([{"Section": section, "Last render (ms)": round(t["last_ms"], 1), "Renders": t["renders"]}
+                                       for section, t in st.session_state.render_timings.items()]), use_container_width=True)
+        with st.expander("📊 Chart cache"):
+            chart_stats = get_figure_cache().stats()
+            st.dataframe(pd.DataFrame([{"Chart": chart, "Rebuilds": c["builds"], "Cache hits": c["hits"],
+                                        "Payload (KB)": round(c["payload_bytes"] / 1024, 1)}
+                                       for chart, c in sorted(chart_stats.items())]), use_container_width=True)
+        if get_metrics().enabled:
+            with st.expander("📈 Instrumentation"):
+                render_instrumentation()
+
+def _quantile_ms(child, q: float) -> Optional[float]:
+    value = child.quantile(q)
+    return None if value is None else round(value * 1000, 1)
+
+def render_instrumentation():
+    # Process-wide numbers: every session and API call served by this process
+    registry = get_metrics()
+    tokens = {key: child.value for key, child in registry.get("scrum_agent_llm_tokens_total").children()}
+    errors = {key[0]: child.value for key, child in registry.get("scrum_agent_method_errors_total").children()}
+    st.markdown("**Agent methods**")
+    st.dataframe(pd.DataFrame([{
+        "Method": method,
+        "Calls": child.count,
+        "p50 (ms)": _quantile_ms(child, 0.5),
+        "p95 (ms)": _quantile_ms(child, 0.95),
+        "Errors": int(errors.get(method, 0)),
+        "Prompt tokens": int(tokens.get((method, "prompt"), 0)),
+        "Response tokens": int(tokens.get((method, "response"), 0)),
+    } for (method,), child in registry.get("scrum_agent_method_seconds").children()]), use_container_width=True)
+    
+    agent = get_agent()
+    cache_stats = agent.cache.stats()
+    flight_stats = agent.single_flight.stats()
+    events = {key[1]: int(child.value) for key, child in registry.get("scrum_agent_llm_backend_events_total").children()}
+    st.caption(f"Cache hit ratio {cache_stats['hit_ratio'] * 100:.0f}%, coalesced {flight_stats['coalesced_ratio'] * 100:.0f}% of model requests. "
+               f"Model calls: {events.get('calls', 0)}, retries: {events.get('retries', 0)}, "
+               f"failures: {events.get('failures', 0)}, rejected locally: {events.get('rejected', 0)}.")
+    
+    st.markdown("**Section renders**")
+    st.dataframe(pd.DataFrame([{"Section": section, "Renders": child.count, "p50 (ms)": _quantile_ms(child, 0.5), "p95 (ms)": _quantile_ms(child, 0.95)}
+                               for (section,), child in registry.get("scrum_agent_render_seconds").children()]), use_container_width=True)
+    st.download_button("Download Prometheus metrics", registry.render(), file_name="scrum_agent_metrics.txt", mime="text/plain")
+
+@record_render_time("Full rerun")
+def main():
+    if os.getenv("SCRUM_AGENT_METRICS_PORT"):
+        # Prometheus cannot scrape Streamlit itself; started once per process
+        start_metrics_server(int(os.environ["SCRUM_AGENT_METRICS_PORT"]))
+    initialize_session_state()
+    
+    # Header
+    st.markdown("""
+    <div class="main-header">
+        <h1>🚀 AI Scrum Master Agent</h1>
+        <p>Automating Scrum processes with Intelligent Insights</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Sidebar widgets rerun the whole app; widgets inside the fragments below only rerun their own fragment
+    agent, stream_responses, bypass_cache = render_sidebar()
+    
+    sprint_data = st.session_state.sprint_data
+    days_remaining = (sprint_data.end_date - datetime.now()).days
+    render_metrics_header(days_remaining)
+    
+    # Monte Carlo forecasts feed both the velocity chart and the sprint health analysis
+    velocities = tuple(float(v) for v in st.session_state.velocity_history["Completed"])
+    sprint_length_days = max(1, (sprint_data.end_date - sprint_data.start_date).days)
+    sprint_forecast = cached_sprint_forecast(velocities, sprint_data.total_story_points, sprint_data.completed_story_points,
+                                             days_remaining, sprint_length_days)
+    backlog_forecast = cached_backlog_forecast(velocities, float(get_project_store().total("backlog", "story_points")),
+                                               sprint_data.end_date, sprint_length_days)
+    
+    render_sprint_analytics(sprint_forecast, backlog_forecast)
     
     # Tabs for different features
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["🤖 AI Sprint Analysis", "📝 Daily Standup", "🔄 Retrospective", "⚠️ Impediments", "📈 Reports", "📊 Tracker"])
     
     with tab1:
-        st.subheader("AI-Powered Sprint Health Analysis")
-        
-        if st.button("🔍 Analyze Current Sprint", type="primary"):
-            with st.spinner("Analyzing sprint health..."):
-                analysis = agent.analyze_sprint_health(st.session_state.sprint_data)
-                st.markdown("### Analysis Results")
-                st.write(analysis)
+        render_sprint_analysis_tab(agent, stream_responses, bypass_cache, sprint_forecast, backlog_forecast)
     
     with tab2:
-        st.subheader("Daily Standup Assistant")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            selected_member = st.selectbox("Select Team Member", st.session_state.sprint_data.team_members)
-            previous_work = st.selectbox("Previous Work Context", ["Finished feature X", "Working on bug Y", "Starting new task Z"])
-            
-            if st.button("Generate Standup Questions"):
-                with st.spinner("Generating personalized questions..."):
-                    questions = agent.generate_daily_standup_questions(selected_member, previous_work)
-                    st.markdown("### Suggested Questions")
-                    st.write(questions)
-        
-        with col2:
-            st.markdown("### Today's Updates")
-            new_update = st.selectbox("Add daily update", ["Making good progress", "Blocked by an issue", "Need help with a task"])
-            if st.button("Add Update"):
-                if new_update:
-                    st.session_state.daily_updates.append({
-                        'timestamp': datetime.now(),
-                        'member': selected_member,
-                        'update': new_update
-                    })
-                    st.success("Update added!")
-            
-            for update in st.session_state.daily_updates[-5:]:  # Show last 5 updates
-                st.markdown(f"""
-                <div class="task-card">
-                    <strong>{update['member']}</strong> - {update['timestamp'].strftime('%H:%M')}
-                    <br>{update['update']}
-                </div>
-                """, unsafe_allow_html=True)
+        render_standup_tab(agent, stream_responses, bypass_cache)
     
     with tab3:
-        st.subheader("Retrospective Insights")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### Add Feedback")
-            feedback_text = st.selectbox("Team Feedback", ["The daily standups are effective", "We need to improve our code review process", "The sprint planning was accurate"])
-            if st.button("Add Feedback"):
-                if feedback_text:
-                    st.session_state.retrospective_feedback.append(feedback_text)
-                    st.success("Feedback added!")
-            
-            if st.session_state.retrospective_feedback:
-                st.markdown("### Current Feedback")
-                for i, feedback in enumerate(st.session_state.retrospective_feedback):
-                    st.write(f"{i+1}. {feedback}")
-        
-        with col2:
-            if st.session_state.retrospective_feedback and st.button("🧠 Generate AI Insights"):
-                with st.spinner("Analyzing retrospective feedback..."):
-                    insights = agent.generate_retrospective_insights(st.session_state.retrospective_feedback)
-                    st.markdown("### AI-Generated Insights")
-                    st.write(insights)
+        render_retrospective_tab(agent, stream_responses, bypass_cache)
     
     with tab4:
-        st.subheader("Impediment Management")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### Current Impediments")
-            for i, impediment in enumerate(st.session_state.sprint_data.impediments):
-                st.markdown(f"""
-                <div class="impediment-card">
-                    <strong>Impediment {i+1}:</strong> {impediment}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            new_impediment = st.selectbox("Add New Impediment", ["Technical debt is slowing us down", "The staging environment is unstable", "We have a new dependency on another team"])
-            if st.button("Add Impediment"):
-                if new_impediment:
-                    st.session_state.sprint_data.impediments.append(new_impediment)
-                    st.success("Impediment added!")
-                    st.rerun()
-        
-        with col2:
-            st.markdown("### AI Resolution Suggestions")
-            if st.session_state.sprint_data.impediments:
-                selected_impediment = st.selectbox("Select Impediment", st.session_state.sprint_data.impediments)
-                context = st.selectbox("Additional Context", ["This is a high priority issue", "This is blocking multiple team members", "We need a decision from the product owner"])
-                
-                if st.button("🔧 Get Resolution Suggestions"):
-                    with st.spinner("Generating resolution strategies..."):
-                        suggestions = agent.suggest_impediment_resolution(selected_impediment, context)
-                        st.write(suggestions)
+        render_impediments_tab(agent, stream_responses, bypass_cache)
     
     with tab5:
-        st.subheader("Sprint Reports")
-        
-        # Sprint summary
-        st.markdown("### Sprint Summary")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            fig = go.Figure(data=go.Pie(
-                labels=['Completed', 'Remaining'],
-                values=[completed_points, total_points - completed_points],
-                hole=0.3
-            ))
-            fig.update_layout(title="Story Points Progress", height=300)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Risk assessment chart
-            risk_levels = ['Low', 'Medium', 'High']
-            risk_counts = [3, 2, 1]  # Sample data
-            fig = go.Figure(data=[go.Bar(x=risk_levels, y=risk_counts, marker_color=['#28a745', '#ffc107', '#dc3545'])])
-            fig.update_layout(title="Risk Assessment", height=300)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col3:
-            # Team satisfaction (sample data)
-            satisfaction = ['Very Satisfied', 'Satisfied', 'Neutral', 'Dissatisfied']
-            counts = [2, 2, 1, 0]
-            fig = go.Figure(data=[go.Bar(x=satisfaction, y=counts, marker_color='#667eea')])
-            fig.update_layout(title="Team Satisfaction", height=300)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Download report
-        if st.button("📥 Generate Sprint Report"):
-            report_data = {
-                'sprint_number': st.session_state.sprint_data.sprint_number,
-                'completion_rate': f"{completion_rate:.1f}%",
-                'total_points': total_points,
-                'completed_points': completed_points,
-                'impediments': len(st.session_state.sprint_data.impediments),
-                'team_size': len(st.session_state.sprint_data.team_members),
-                'days_remaining': days_remaining
-            }
-            
-            st.json(report_data)
-            st.success("Report generated! You can copy the JSON data above.")
-
+        render_reports_tab(days_remaining)
+    
     with tab6:
-        st.subheader("Team Updates")
-        st.dataframe(st.session_state.team_updates, use_container_width=True)
-
-        st.subheader("Current Implementations")
-        st.dataframe(st.session_state.current_implementations, use_container_width=True)
-
-        st.subheader("Product Backlog")
-        st.dataframe(st.session_state.product_backlog, use_container_width=True)
-
-        st.subheader("AI Scrum Master Recommendations")
-        if st.button("🤖 Generate Recommendations"):
-            with st.spinner("Generating recommendations..."):
-                # Combine all data into a single context string
-                context = f"""
-                Team Updates:
-                {st.session_state.team_updates.to_string()}
-
-                Current Implementations:
-                {st.session_state.current_implementations.to_string()}
-
-                Product Backlog:
-                {st.session_state.product_backlog.to_string()}
-
-                Sprint Data:
-                {st.session_state.sprint_data}
-                """
-                # Create a new method in the agent to handle this
-                recommendations = agent.generate_scrum_master_recommendations(context)
-                st.markdown(recommendations)
+        render_tracker_tab(agent, stream_responses, bypass_cache)
+    
+    render_diagnostics()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
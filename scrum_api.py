@@ -0,0 +1,544 @@
+"""Headless JSON API and command line for the ScrumMasterAgent.
+
+    python scrum_api.py serve --port 8080
+    python scrum_api.py impediment "Test environment unavailable" --context "Blocking QA"
+    LLM_BACKEND=stub STUB_LATENCY_MS=300 python scrum_api.py loadtest --requests 2000 --concurrency 200
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from context_builder import build_tracker_context
+from forecasting import forecast_backlog, forecast_sprint
+from impediment_index import ImpedimentIndex
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, get_metrics
+from portfolio import sprint_from_record
+from project_store import ProjectStore, get_project_store
+from response_cache import ResponseCache
+from scrum_master_agent import ScrumMasterAgent, SprintData
+
+MAX_BODY_BYTES = 1 << 20
+# Seconds an idle keep-alive connection is kept open
+IDLE_TIMEOUT = 30.0
+
+_REQUEST_SECONDS = get_metrics().histogram("scrum_agent_api_request_seconds",
+                                           "API request time from dispatch to response, including the wait for a worker",
+                                           ["route", "status"])
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+            500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+class APIError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _require(payload: Dict, field: str, kind: type = str):
+    value = payload.get(field)
+    if not isinstance(value, kind) or (kind is str and not value.strip()):
+        raise APIError(400, f"'{field}' must be a non-empty {kind.__name__}")
+    return value
+
+
+def _optional_str(payload: Dict, field: str) -> str:
+    """field as a string, or "" when it is missing or null."""
+    value = payload.get(field)
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise APIError(400, f"'{field}' must be a string")
+    return value
+
+
+def _require_int(payload: Dict, field: str, default: Optional[int] = None, minimum: Optional[int] = None) -> Optional[int]:
+    """field as an int (numeric strings are accepted), or default when it is missing."""
+    value = payload.get(field)
+    if value is None:
+        return default
+    try:
+        if isinstance(value, bool):
+            raise ValueError
+        number = int(value)
+    except (TypeError, ValueError):
+        raise APIError(400, f"'{field}' must be an integer") from None
+    if minimum is not None and number < minimum:
+        raise APIError(400, f"'{field}' must be at least {minimum}")
+    return number
+
+
+def sprint_from_payload(payload: Dict, store: ProjectStore) -> SprintData:
+    """An inline "sprint" object, else the stored sprint "sprint_number" (default: the latest)."""
+    sprint = payload.get("sprint")
+    if isinstance(sprint, dict):
+        try:
+            return sprint_from_record(sprint)
+        except (KeyError, TypeError, ValueError) as e:
+            raise APIError(400, f"Invalid sprint: {e}")
+    number = _require_int(payload, "sprint_number") or store.latest_sprint_number()
+    if number is None:
+        raise APIError(404, "The project store has no sprints; pass a 'sprint' object")
+    sprint_data = store.load_sprint(number)
+    if sprint_data is None:
+        raise APIError(404, f"Sprint {number} not found")
+    return sprint_data
+
+
+class ScrumAPI:
+    """Routes JSON requests to one shared ScrumMasterAgent.
+
+    Agent calls block, so they run on a thread pool. At most max_concurrency
+    of them run at once and at most max_pending wait for a slot; beyond that
+    requests are rejected with 503 instead of queueing without bound. A
+    request that takes longer than request_timeout, including its wait,
+    gets a 504. The worker thread still finishes the call, and its response
+    is cached for the retry.
+    """
+
+    def __init__(self, agent: Optional[ScrumMasterAgent] = None, store: Optional[ProjectStore] = None,
+                 max_concurrency: int = 8, max_pending: int = 256, request_timeout: float = 60.0):
+        self.agent = agent or ScrumMasterAgent()
+        self.store = store or get_project_store()
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.request_timeout = request_timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="scrum-api")
+        # Created lazily inside the running loop (asyncio primitives bind to a loop on Python 3.9)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self.stats = {"requests": 0, "rejected": 0, "timeouts": 0, "errors": 0}
+        self.routes: Dict[Tuple[str, str], Callable[[Dict], Dict]] = {
+            ("GET", "/healthz"): self.health,
+            ("GET", "/v1/stats"): self.get_stats,
+            ("GET", "/metrics"): self.metrics,
+            ("POST", "/v1/sprint-health"): self.sprint_health,
+            ("POST", "/v1/standup-questions"): self.standup_questions,
+            ("POST", "/v1/retrospective-insights"): self.retrospective_insights,
+            ("POST", "/v1/impediment-resolution"): self.impediment_resolution,
+            ("POST", "/v1/recommendations"): self.recommendations,
+            ("POST", "/v1/sprint-briefing"): self.sprint_briefing,
+        }
+        # Cheap handlers answered on the event loop, even when every worker is busy
+        self._inline = {self.health, self.get_stats, self.metrics}
+        get_metrics().register_stats("scrum_agent_api", lambda: dict(self.stats, in_flight=self._pending), "API requests")
+
+    def _result(self, text: str) -> Dict:
+        if text == self.agent.not_configured_message:
+            raise APIError(503, text)
+        if text.startswith("Error "):
+            raise APIError(502, text)
+        return {"result": text}
+
+    # Handlers: payload dict in, JSON-serializable dict out
+
+    def health(self, payload: Dict) -> Dict:
+        breaker = getattr(self.agent.backend, "breaker", None)
+        return {
+            "status": "ok" if self.agent.api_configured else "unconfigured",
+            "backend": self.agent.backend.cache_namespace,
+            "breaker": breaker.state if breaker is not None else None,
+        }
+
+    def get_stats(self, payload: Dict) -> Dict:
+        return {
+            "api": dict(self.stats, in_flight=self._pending),
+            "cache": self.agent.cache.stats(),
+            "single_flight": self.agent.single_flight.stats(),
+            "backend": dict(getattr(self.agent.backend, "stats", {})),
+        }
+
+    def metrics(self, payload: Dict) -> str:
+        # Prometheus text rather than JSON
+        if not get_metrics().enabled:
+            raise APIError(404, "Metrics are disabled (SCRUM_AGENT_METRICS=0)")
+        return get_metrics().render()
+
+    def sprint_health(self, payload: Dict) -> Dict:
+        sprint_data = sprint_from_payload(payload, self.store)
+        forecast = backlog_forecast = None
+        velocities = payload.get("velocities")
+        if velocities is not None and (not isinstance(velocities, list) or not all(
+                isinstance(v, (int, float)) and not isinstance(v, bool) for v in velocities)):
+            raise APIError(400, "'velocities' must be a list of numbers")
+        if velocities:
+            days_remaining = (sprint_data.end_date - datetime.now()).days
+            sprint_length_days = max(1, (sprint_data.end_date - sprint_data.start_date).days)
+            forecast = forecast_sprint(velocities, sprint_data.total_story_points, sprint_data.completed_story_points,
+                                       days_remaining, sprint_length_days)
+            backlog_forecast = forecast_backlog(velocities, self.store.total("backlog", "story_points"),
+                                                sprint_data.end_date, sprint_length_days)
+        return self._result(self.agent.analyze_sprint_health(sprint_data, refresh=bool(payload.get("refresh")),
+                                                             forecast=forecast, backlog_forecast=backlog_forecast))
+
+    def standup_questions(self, payload: Dict) -> Dict:
+        previous_work = _require(payload, "previous_work")
+        refresh = bool(payload.get("refresh"))
+        if "team_members" in payload:
+            members = _require(payload, "team_members", list)
+            results = dict(self.agent.generate_team_standup_questions(members, previous_work, refresh=refresh))
+            return {"results": {member: results[member] for member in members}}
+        member = _require(payload, "team_member")
+        return self._result(self.agent.generate_daily_standup_questions(member, previous_work, refresh=refresh))
+
+    def retrospective_insights(self, payload: Dict) -> Dict:
+        feedback = payload.get("feedback")
+        if feedback is None and "sprint_number" in payload:
+            feedback = self.store.feedback(_require_int(payload, "sprint_number"))
+        if not isinstance(feedback, list) or not feedback:
+            raise APIError(400, "'feedback' must be a non-empty list (or pass a sprint_number with stored feedback)")
+        return self._result(self.agent.generate_retrospective_insights(feedback, refresh=bool(payload.get("refresh"))))
+
+    def impediment_resolution(self, payload: Dict) -> Dict:
+        impediment = _require(payload, "impediment")
+        context = _optional_str(payload, "context")
+        return self._result(self.agent.suggest_impediment_resolution(impediment, context, refresh=bool(payload.get("refresh"))))
+
+    def recommendations(self, payload: Dict) -> Dict:
+        context = _optional_str(payload, "context")
+        token_budget = _require_int(payload, "token_budget", 3000, minimum=1)
+        if not context:
+            # Same ranked, budgeted tracker context the dashboard sends
+            context, _ = build_tracker_context(self.store, sprint_from_payload(payload, self.store), token_budget)
+        return self._result(self.agent.generate_scrum_master_recommendations(context, refresh=bool(payload.get("refresh"))))
+
+    def sprint_briefing(self, payload: Dict) -> Dict:
+        token_budget = _require_int(payload, "token_budget", 3000, minimum=1)
+        context = _optional_str(payload, "context")
+        impediment_context = _optional_str(payload, "impediment_context")
+        sprint_data = sprint_from_payload(payload, self.store)
+        if not context:
+            context, _ = build_tracker_context(self.store, sprint_data, token_budget)
+        briefing = self.agent.generate_sprint_briefing(sprint_data, context, refresh=bool(payload.get("refresh")),
+                                                       impediment_context=impediment_context)
+        self._result(briefing.sprint_health)
+        return asdict(briefing)
+
+    # Dispatch
+
+    async def _run_bounded(self, handler: Callable[[Dict], Dict], payload: Dict) -> Dict:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, handler, payload)
+
+    async def dispatch(self, method: str, path: str, payload: Dict) -> Tuple[int, Union[Dict, str]]:
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                return 405, {"error": f"{method} not allowed on {path}"}
+            return 404, {"error": f"No route for {path}"}
+        started = time.perf_counter()
+        status, body = await self._dispatch_route(handler, payload)
+        _REQUEST_SECONDS.labels(path, status).observe(time.perf_counter() - started)
+        return status, body
+
+    async def _dispatch_route(self, handler: Callable[[Dict], Dict], payload: Dict) -> Tuple[int, Union[Dict, str]]:
+        self.stats["requests"] += 1
+        try:
+            if handler in self._inline:
+                return 200, handler(payload)
+            if self._pending >= self.max_pending:
+                self.stats["rejected"] += 1
+                return 503, {"error": "Too many requests in flight, retry later"}
+            self._pending += 1
+            try:
+                return 200, await asyncio.wait_for(self._run_bounded(handler, payload), self.request_timeout)
+            finally:
+                self._pending -= 1
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            return 504, {"error": f"Request timed out after {self.request_timeout:g}s"}
+        except APIError as e:
+            self.stats["errors"] += 1
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            self.stats["errors"] += 1
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    # HTTP/1.1 with keep-alive on top of asyncio streams
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+                status, body, keep_alive = await self._handle_request(request_line, reader)
+                writer.write(_encode_response(status, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, request_line: bytes, reader: asyncio.StreamReader) -> Tuple[int, Union[Dict, str], bool]:
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            return 400, {"error": "Malformed request line"}, False
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be framed, so the connection is closed after the error
+            return 400, {"error": "Malformed Content-Length header"}, False
+        if length > MAX_BODY_BYTES:
+            return 413, {"error": f"Body larger than {MAX_BODY_BYTES} bytes"}, False
+        body = await reader.readexactly(length) if length else b""
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "Body is not valid JSON"}, keep_alive
+        if not isinstance(payload, dict):
+            return 400, {"error": "Body must be a JSON object"}, keep_alive
+        status, response = await self.dispatch(method.upper(), urllib.parse.urlsplit(target).path, payload)
+        return status, response, keep_alive
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080, ready: Optional[Callable[[int], None]] = None):
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_BODY_BYTES)
+        bound_port = server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready(bound_port)
+        async with server:
+            await server.serve_forever()
+
+
+def _encode_response(status: int, body: Union[Dict, str], keep_alive: bool) -> bytes:
+    # Text bodies are the metrics exposition; everything else is JSON
+    if isinstance(body, str):
+        data, content_type = body.encode("utf-8"), METRICS_CONTENT_TYPE
+    else:
+        data, content_type = json.dumps(body, default=str).encode("utf-8"), "application/json"
+    head = (f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}\r\n"
+            f"Content-Type: {content_type}\r\nContent-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + data
+
+
+# Load testing
+
+_LOADTEST_WORDS = ("build pipeline staging database vendor credentials review backlog schema migration flaky tests "
+                   "licence laptop network firewall budget approval design spec legal sign-off mobile release "
+                   "certificate outage monitoring dashboard payments partner sandbox quota cluster upgrade data "
+                   "export security audit access token hiring onboarding").split()
+
+
+def _loadtest_impediment(i: int) -> str:
+    # Texts differing only in a number are >0.9 similar, so the impediment index would answer
+    # them without a model call; random words plus a digest keep every pair below ~0.85
+    words = random.Random(i).sample(_LOADTEST_WORDS, 4)
+    return f"{' '.join(words)} blocked ({hashlib.sha1(str(i).encode('utf-8')).hexdigest()[:12]})"
+
+
+LOADTEST_PAYLOADS: Dict[str, Callable[[int], Dict]] = {
+    "/v1/impediment-resolution": lambda i: {"impediment": _loadtest_impediment(i), "context": "Blocking QA"},
+    "/v1/standup-questions": lambda i: {"team_member": f"Member {i}", "previous_work": "Finished feature X"},
+    "/v1/retrospective-insights": lambda i: {"feedback": [f"Standups run long ({i})", "Code reviews are slow"]},
+    "/v1/recommendations": lambda i: {"context": f"Sprint {i}: 30/50 SP completed, 2 impediments"},
+    "/v1/sprint-health": lambda i: {"sprint": {
+        "sprint_number": i, "start_date": "2025-01-06", "end_date": "2025-01-20", "total_story_points": 50,
+        "completed_story_points": 30, "team_members": ["Alice", "Bob"], "impediments": [], "risks": []}},
+}
+
+
+async def _send(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str, payload: Dict) -> int:
+    data = json.dumps(payload).encode("utf-8")
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: loadtest\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def run_load_test(host: str, port: int, path: str, requests: int, concurrency: int, unique: bool = True) -> Dict:
+    """Fire requests from concurrency keep-alive clients; latency percentiles are in milliseconds."""
+    make_payload = LOADTEST_PAYLOADS[path]
+    counter = iter(range(requests))
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    async def worker():
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_BODY_BYTES)
+        try:
+            for i in counter:
+                started = time.perf_counter()
+                status = await _send(reader, writer, path, make_payload(i if unique else 0))
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {"p50": round(cuts[49], 1), "p95": round(cuts[94], 1), "p99": round(cuts[98], 1)},
+        "statuses": statuses,
+    }
+
+
+async def _load_test_in_process(args) -> Dict:
+    # Memory-only cache, index and store so the run neither reads nor pollutes the real ones
+    # The shared rate limiter would otherwise cap the run at LLM_REQUESTS_PER_MINUTE (60 by default)
+    os.environ.setdefault("LLM_REQUESTS_PER_MINUTE", "1000000")
+    os.environ.setdefault("LLM_TOKENS_PER_MINUTE", "1000000000")
+    agent = ScrumMasterAgent(cache=ResponseCache(path=None), impediment_index=ImpedimentIndex(path=None))
+    # Every request takes the model path; similarity reuse would turn the run into an index benchmark
+    agent.impediment_reuse_threshold = 1.01
+    api = ScrumAPI(agent=agent, store=ProjectStore(path=None), max_concurrency=args.max_concurrency,
+                   max_pending=args.max_pending, request_timeout=args.timeout)
+    ready = asyncio.get_running_loop().create_future()
+    server = asyncio.ensure_future(api.serve("127.0.0.1", 0, ready=ready.set_result))
+    try:
+        port = await ready
+        result = await run_load_test("127.0.0.1", port, args.endpoint, args.requests, args.concurrency, not args.repeat)
+        result["server"] = api.get_stats({})
+        return result
+    finally:
+        server.cancel()
+        api.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Command line
+
+def _print_result(result: Dict, as_json: bool):
+    if as_json:
+        print(json.dumps(result, indent=2, default=str))
+    elif "sprint_health" in result:
+        print(f"# Sprint health\n{result['sprint_health']}\n\n# Recommendations\n{result['recommendations']}")
+        for impediment, resolution in result["impediment_resolutions"].items():
+            print(f"\n# Impediment: {impediment}\n{resolution}")
+    elif "results" in result:
+        for member, text in result["results"].items():
+            print(f"## {member}\n{text}\n")
+    else:
+        print(result["result"])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless API and CLI for the AI Scrum Master agent.")
+    parser.add_argument("--json", action="store_true", help="print raw JSON responses")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run the HTTP JSON API")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    for command in (serve, commands.add_parser("loadtest", help="load test an in-process server or --url")):
+        command.add_argument("--max-concurrency", type=int, default=8, help="agent calls running at once")
+        command.add_argument("--max-pending", type=int, default=256, help="requests waiting before 503s")
+        command.add_argument("--timeout", type=float, default=60.0, help="per-request timeout in seconds")
+    loadtest = commands.choices["loadtest"]
+    loadtest.add_argument("--url", help="existing server, e.g. http://127.0.0.1:8080 (default: start one in process)")
+    loadtest.add_argument("--endpoint", default="/v1/impediment-resolution", choices=sorted(LOADTEST_PAYLOADS))
+    loadtest.add_argument("--requests", type=int, default=1000)
+    loadtest.add_argument("--concurrency", type=int, default=50, help="concurrent client connections")
+    loadtest.add_argument("--repeat", action="store_true", help="send identical payloads (cache hits) instead of unique ones")
+
+    health = commands.add_parser("sprint-health", help="analyze a stored sprint")
+    health.add_argument("--sprint", type=int, help="sprint number (default: latest)")
+    health.add_argument("--velocities", type=float, nargs="*", help="past sprint velocities for Monte Carlo forecasts")
+    standup = commands.add_parser("standup", help="daily standup questions")
+    standup.add_argument("members", nargs="*", help="team members (default: everyone in the store)")
+    standup.add_argument("--previous-work", default="Continuing sprint work")
+    retro = commands.add_parser("retro", help="retrospective insights")
+    retro.add_argument("feedback", nargs="*", help="feedback items (default: the stored feedback of --sprint)")
+    retro.add_argument("--sprint", type=int)
+    impediment = commands.add_parser("impediment", help="impediment resolution suggestions")
+    impediment.add_argument("impediment")
+    impediment.add_argument("--context", default="")
+    recommend = commands.add_parser("recommend", help="Scrum Master recommendations from the tracker data")
+    recommend.add_argument("--sprint", type=int)
+    recommend.add_argument("--token-budget", type=int, default=3000)
+    briefing = commands.add_parser("briefing", help="sprint health, recommendations and impediment resolutions in one call")
+    briefing.add_argument("--sprint", type=int)
+    briefing.add_argument("--token-budget", type=int, default=3000)
+    for command in (health, standup, retro, impediment, recommend, briefing):
+        command.add_argument("--refresh", action="store_true", help="bypass the response cache")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        api = ScrumAPI(max_concurrency=args.max_concurrency, max_pending=args.max_pending, request_timeout=args.timeout)
+        try:
+            asyncio.run(api.serve(args.host, args.port,
+                                  ready=lambda port: print(f"Serving on http://{args.host}:{port}", file=sys.stderr)))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.command == "loadtest":
+        if args.url:
+            url = urllib.parse.urlsplit(args.url)
+            result = asyncio.run(run_load_test(url.hostname, url.port or 80, args.endpoint, args.requests,
+                                               args.concurrency, not args.repeat))
+        else:
+            result = asyncio.run(_load_test_in_process(args))
+        print(json.dumps(result, indent=2))
+        return 0
+
+    api = ScrumAPI(max_concurrency=1)
+    latest = api.store.latest_sprint_number()
+    # Payloads are built lazily: each subcommand only defines its own arguments
+    requests = {
+        "sprint-health": (api.sprint_health, lambda: {"sprint_number": args.sprint, "velocities": args.velocities}),
+        "standup": (api.standup_questions, lambda: {"team_members": args.members or api.store.members(),
+                                                    "previous_work": args.previous_work}),
+        "retro": (api.retrospective_insights, lambda: {"feedback": args.feedback or None, "sprint_number": args.sprint or latest}),
+        "impediment": (api.impediment_resolution, lambda: {"impediment": args.impediment, "context": args.context}),
+        "recommend": (api.recommendations, lambda: {"sprint_number": args.sprint, "token_budget": args.token_budget}),
+        "briefing": (api.sprint_briefing, lambda: {"sprint_number": args.sprint, "token_budget": args.token_budget}),
+    }
+    handler, payload = requests[args.command]
+    try:
+        result = handler(dict(payload(), refresh=args.refresh))
+    except APIError as e:
+        print(f"Error ({e.status}): {e}", file=sys.stderr)
+        return 1
+    finally:
+        api.executor.shutdown(wait=False)
+    _print_result(result, args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,591 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+import functools
+import json
+import re
+import time
+
+from context_builder import format_sprint_summary
+from feedback_clustering import cluster_feedback
+from forecasting import BacklogForecast, SprintForecast
+from impediment_index import ImpedimentIndex, ImpedimentMatch, get_impediment_index
+from llm_backends import LLMBackend, create_backend
+from llm_resilience import estimate_tokens, make_resilient
+from metrics import get_metrics
+from response_cache import ResponseCache, get_response_cache, make_cache_key
+from single_flight import SingleFlight, get_single_flight
+
+@dataclass
+class SprintData:
+    sprint_number: int
+    start_date: datetime
+    end_date: datetime
+    total_story_points: int
+    completed_story_points: int
+    team_members: List[str]
+    impediments: List[str]
+    risks: List[str]
+
+@dataclass
+class SprintBriefing:
+    """Sections of a full sprint briefing, each the text its per-section agent method would return."""
+    sprint_health: str
+    recommendations: str
+    impediment_resolutions: Dict[str, str]
+    # Red/Yellow/Green as stated in the health section, None if it names none
+    health_status: Optional[str]
+    # "cache" (no model call), "batched" (one JSON call), "per-section" (fallback calls)
+    # or "unconfigured" (no backend; every section is the setup message)
+    source: str
+
+_HEALTH_STATUS_RE = re.compile(r"\b(Red|Yellow|Green)\b")
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+def parse_briefing_sections(text: str, impediments: List[str]) -> Dict[str, str]:
+    """Section id -> text for every well-formed section of a briefing JSON response.
+
+    Section ids are "sprint_health", "recommendations" and "impediment:<text>".
+    Raises ValueError when the response is not a JSON object at all.
+    """
+    data = json.loads(_JSON_FENCE_RE.sub("", text.strip()))
+    if not isinstance(data, dict):
+        raise ValueError("Briefing response is not a JSON object")
+    sections = {}
+    health = data.get("sprint_health")
+    if isinstance(health, dict) and isinstance(health.get("analysis"), str) and health["analysis"].strip():
+        status = health.get("status")
+        prefix = f"**Sprint health: {status}**\n\n" if status in ("Red", "Yellow", "Green") else ""
+        sections["sprint_health"] = prefix + health["analysis"].strip()
+    if isinstance(data.get("recommendations"), str) and data["recommendations"].strip():
+        sections["recommendations"] = data["recommendations"].strip()
+    resolutions = data.get("impediment_resolutions")
+    # Entries are matched to impediments by position; a wrong count means they cannot be trusted
+    if isinstance(resolutions, list) and len(resolutions) == len(impediments):
+        for impediment, resolution in zip(impediments, resolutions):
+            if isinstance(resolution, str) and resolution.strip():
+                sections[f"impediment:{impediment}"] = resolution.strip()
+    return sections
+
+_METHOD_SECONDS = get_metrics().histogram(
+    "scrum_agent_method_seconds", "Wall time of ScrumMasterAgent methods including cache hits; streams until the last chunk",
+    ["method"])
+_METHOD_ERRORS = get_metrics().counter("scrum_agent_method_errors_total", "Agent responses that are error messages", ["method"])
+_LLM_TOKENS = get_metrics().counter("scrum_agent_llm_tokens_total", "Estimated tokens sent to and received from the model",
+                                    ["method", "direction"])
+
+def _is_error(result) -> bool:
+    if isinstance(result, tuple):
+        # (team_member, questions) pairs from the team fan-out
+        result = result[-1]
+    if isinstance(result, SprintBriefing):
+        result = result.sprint_health
+    return isinstance(result, str) and result.lstrip().startswith(("Error ", "❌"))
+
+def _instrumented(method):
+    # Without metrics the method is returned as it is, so disabled instrumentation costs nothing
+    if not get_metrics().enabled:
+        return method
+    name = method.__name__
+    
+    def timed_stream(started: float, chunks: Iterator) -> Iterator:
+        try:
+            for chunk in chunks:
+                if _is_error(chunk):
+                    _METHOD_ERRORS.labels(name).inc()
+                yield chunk
+        finally:
+            _METHOD_SECONDS.labels(name).observe(time.perf_counter() - started)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        if isinstance(result, (str, SprintBriefing)):
+            _METHOD_SECONDS.labels(name).observe(time.perf_counter() - started)
+            if _is_error(result):
+                _METHOD_ERRORS.labels(name).inc()
+            return result
+        return timed_stream(started, result)
+    return wrapper
+
+class ScrumMasterAgent:
+    # Cosine similarity above which a past impediment's resolution is reused
+    impediment_reuse_threshold = 0.9
+    
+    def __init__(self, backend: Optional[LLMBackend] = None, cache: Optional[ResponseCache] = None, resilient: bool = True,
+                 single_flight: Optional[SingleFlight] = None, impediment_index: Optional[ImpedimentIndex] = None):
+        backend = backend if backend is not None else create_backend()
+        # Rate limiting, retries and the circuit breaker are shared process-wide per backend
+        self.backend = make_resilient(backend) if resilient else backend
+        self.model_name = self.backend.model_name
+        self.cache = cache if cache is not None else get_response_cache()
+        self.single_flight = single_flight if single_flight is not None else get_single_flight()
+        self.impediment_index = impediment_index if impediment_index is not None else get_impediment_index()
+        self.api_configured = self.backend.configured
+        self.not_configured_message = f"❌ {self.backend.missing_config_message}. {self.backend.setup_hint}"
+        # Counters the cache and single-flight layer already keep are read when metrics are scraped
+        get_metrics().register_stats("scrum_agent_response_cache", self.cache.stats, "Response cache")
+        get_metrics().register_stats("scrum_agent_single_flight", self.single_flight.stats, "Coalesced in-flight prompts")
+    
+    @staticmethod
+    def _record_tokens(method: str, prompt: str, response: str):
+        _LLM_TOKENS.labels(method, "prompt").inc(estimate_tokens(prompt))
+        _LLM_TOKENS.labels(method, "response").inc(estimate_tokens(response))
+
+    def _generate(self, method: str, prompt: str, refresh: bool = False,
+                  on_complete: Optional[Callable[[str], None]] = None) -> str:
+        key = make_cache_key(self.backend.cache_namespace, prompt)
+        if not refresh:
+            cached = self.cache.get(key, method)
+            if cached is not None:
+                return cached
+        
+        def call() -> str:
+            text = self.backend.generate(prompt)
+            self._record_tokens(method, prompt, text)
+            self.cache.set(key, method, text)
+            if on_complete is not None:
+                on_complete(text)
+            return text
+        
+        try:
+            # Concurrent identical prompts share one backend call
+            return self.single_flight.do(key, call)
+        except Exception:
+            # Degrade to the last known answer, however old, while the backend is unhealthy
+            stale = self.cache.get_stale(key)
+            if stale is None:
+                raise
+            return f"{stale}\n\n_⚠️ The model backend is currently unavailable; showing a previously cached response._"
+
+    def _stream(self, method: str, prompt: str, refresh: bool, error_prefix: str,
+                on_complete: Optional[Callable[[str], None]] = None) -> Iterator[str]:
+        key = make_cache_key(self.backend.cache_namespace, prompt)
+        if not refresh:
+            cached = self.cache.get(key, method)
+            if cached is not None:
+                yield cached
+                return
+        
+        future, leader = self.single_flight.join_or_lead(key)
+        if not leader:
+            # Another session is already generating this prompt; wait for its full text
+            try:
+                yield future.result()
+            except Exception as e:
+                yield f"{error_prefix}: {str(e)}"
+            return
+        
+        chunks = []
+        error = None
+        completed = False
+        try:
+            for text in self.backend.generate_stream(prompt):
+                chunks.append(text)
+                yield text
+            completed = True
+        except Exception as e:
+            error = e
+        finally:
+            # Release followers even when the consumer stops iterating early
+            if completed:
+                # Only complete responses are cached
+                response = "".join(chunks)
+                self._record_tokens(method, prompt, response)
+                self.cache.set(key, method, response)
+                if on_complete is not None:
+                    on_complete(response)
+                self.single_flight.complete(key, future, result=response)
+            else:
+                self.single_flight.complete(key, future, error=error or RuntimeError("Response stream was interrupted"))
+        
+        if error is None:
+            return
+        if chunks:
+            yield f"\n\n{error_prefix}: {str(error)}"
+            return
+        # Nothing was streamed yet, so fall back to a regular request
+        try:
+            yield self._generate(method, prompt, refresh=True, on_complete=on_complete)
+        except Exception as fallback_error:
+            yield f"{error_prefix}: {str(fallback_error)}"
+    
+    @staticmethod
+    def _standup_prompt(team_member: str, previous_work: str) -> str:
+        return f"""
+        As an AI Scrum Master, generate personalized daily standup questions for {team_member}.
+        
+        Previous work context: {previous_work}
+        
+        Generate 3-4 thoughtful questions that will help uncover:
+        1. Progress updates
+        2. Potential blockers
+        3. Plans for today
+        4. Any support needed
+        
+        Make the questions conversational and team-member specific.
+        """
+    
+    @_instrumented
+    def generate_daily_standup_questions(self, team_member: str, previous_work: str, refresh: bool = False, stream: bool = False) -> Union[str, Iterator[str]]:
+        if not self.api_configured:
+            return self.not_configured_message
+        
+        prompt = self._standup_prompt(team_member, previous_work)
+        
+        if stream:
+            return self._stream('generate_daily_standup_questions', prompt, refresh, "Error generating questions")
+        
+        try:
+            return self._generate('generate_daily_standup_questions', prompt, refresh)
+        except Exception as e:
+            return f"Error generating questions: {str(e)}"
+    
+    @_instrumented
+    def generate_team_standup_questions(self, team_members: List[str], previous_work: str, max_concurrency: int = 4,
+                                        timeout: float = 60.0, refresh: bool = False) -> Iterator[Tuple[str, str]]:
+        """Fan out standup question generation for the whole team.
+
+        Yields (team_member, questions) pairs in completion order. At most
+        max_concurrency requests run at once and a member whose request runs
+        longer than timeout seconds gets an error message instead.
+        """
+        if not team_members:
+            return
+        
+        started = {}
+        
+        def run(index: int, member: str) -> str:
+            started[index] = time.monotonic()
+            return self.generate_daily_standup_questions(member, previous_work, refresh=refresh)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(team_members))), thread_name_prefix="standup")
+        futures = {executor.submit(run, i, member): (i, member) for i, member in enumerate(team_members)}
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+                deadlines = [started[futures[f][0]] + timeout for f in pending if futures[f][0] in started]
+                wait_for = max(0.0, min(deadlines) - now) if deadlines else timeout
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures[future][1], future.result()
+                
+                now = time.monotonic()
+                for future in list(pending):
+                    index, member = futures[future]
+                    if index in started and now - started[index] >= timeout:
+                        # The worker thread cannot be interrupted; its result is dropped
+                        pending.discard(future)
+                        yield member, f"Error generating questions: timed out after {timeout:g}s"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @_instrumented
+    def analyze_sprint_health(self, sprint_data: SprintData, refresh: bool = False, stream: bool = False,
+                              forecast: Optional[SprintForecast] = None,
+                              backlog_forecast: Optional[BacklogForecast] = None) -> Union[str, Iterator[str]]:
+        if not self.api_configured:
+            return self.not_configured_message
+        
+        prompt = self._sprint_health_prompt(sprint_data, forecast, backlog_forecast)
+        
+        if stream:
+            return self._stream('analyze_sprint_health', prompt, refresh, "Error analyzing sprint")
+        
+        try:
+            return self._generate('analyze_sprint_health', prompt, refresh)
+        except Exception as e:
+            return f"Error analyzing sprint: {str(e)}"
+    
+    def _sprint_health_prompt(self, sprint_data: SprintData, forecast: Optional[SprintForecast] = None,
+                              backlog_forecast: Optional[BacklogForecast] = None) -> str:
+        completion_rate = (sprint_data.completed_story_points / sprint_data.total_story_points) * 100
+        days_remaining = (sprint_data.end_date - datetime.now()).days
+        
+        return f"""
+        As an AI Scrum Master, analyze the current sprint health:
+        
+        Sprint {sprint_data.sprint_number} Details:
+        - Completion Rate: {completion_rate:.1f}%
+        - Days Remaining: {days_remaining}
+        - Total Story Points: {sprint_data.total_story_points}
+        - Completed Story Points: {sprint_data.completed_story_points}
+        - Team Size: {len(sprint_data.team_members)}
+        - Active Impediments: {len(sprint_data.impediments)}
+        - Identified Risks: {len(sprint_data.risks)}
+        {self._forecast_lines(forecast, backlog_forecast)}
+        Provide:
+        1. Sprint health assessment (Red/Yellow/Green)
+        2. Key concerns and recommendations
+        3. Actions for the Scrum Master to take
+        4. Team motivation suggestions
+        
+        Be concise but actionable.
+        """
+    
+    @staticmethod
+    def _forecast_lines(forecast: Optional[SprintForecast], backlog_forecast: Optional[BacklogForecast]) -> str:
+        lines = []
+        if forecast is not None:
+            p10, p50, p90 = (forecast.points_percentiles[p] for p in (10, 50, 90))
+            lines.append(f"- Probability of completing all story points (Monte Carlo, {forecast.simulations:,} runs): {forecast.completion_probability:.0%}")
+            lines.append(f"- Forecast story points completed by sprint end (P10/P50/P90): {p10:.0f}/{p50:.0f}/{p90:.0f}")
+        if backlog_forecast is not None and backlog_forecast.backlog_points > 0:
+            dates = backlog_forecast.date_percentiles
+            lines.append(f"- Product backlog ({backlog_forecast.backlog_points:.0f} SP) forecast completion (P50/P85/P95): "
+                         f"{dates[50]:%Y-%m-%d}/{dates[85]:%Y-%m-%d}/{dates[95]:%Y-%m-%d}")
+        return "\n        ".join(lines) + "\n        " if lines else ""
+    
+    @staticmethod
+    def _retrospective_prompt(feedback_data: List[str]) -> str:
+        # Duplicate and near-duplicate comments are sent once, with their frequency
+        summary = cluster_feedback(feedback_data)
+        
+        return f"""
+        As an AI Scrum Master, analyze this retrospective feedback and generate insights:
+        
+        Team Feedback ({summary.total_items} comments grouped into {len(summary.themes)} themes):
+        {summary.to_prompt_lines()}
+        
+        Provide:
+        1. Key themes and patterns
+        2. Top 3 improvement opportunities
+        3. Specific action items with owners
+        4. Team strengths to celebrate
+        5. Suggested retrospective activities for next time
+        
+        Focus on actionable insights that drive continuous improvement.
+        """
+    
+    @_instrumented
+    def generate_retrospective_insights(self, feedback_data: List[str], refresh: bool = False, stream: bool = False) -> Union[str, Iterator[str]]:
+        if not self.api_configured:
+            return self.not_configured_message
+        
+        prompt = self._retrospective_prompt(feedback_data)
+        
+        if stream:
+            return self._stream('generate_retrospective_insights', prompt, refresh, "Error generating insights")
+        
+        try:
+            return self._generate('generate_retrospective_insights', prompt, refresh)
+        except Exception as e:
+            return f"Error generating insights: {str(e)}"
+    
+    def find_similar_impediments(self, impediment: str, context: str = "", k: int = 3) -> List[ImpedimentMatch]:
+        return self.impediment_index.search(impediment, context, k=k)
+    
+    @staticmethod
+    def _impediment_prompt(impediment: str, context: str) -> str:
+        return f"""
+        As an AI Scrum Master, suggest resolution strategies for this impediment:
+        
+        Impediment: {impediment}
+        Context: {context}
+        
+        Provide:
+        1. Root cause analysis
+        2. 2-3 specific resolution strategies
+        3. Who should be involved in resolution
+        4. Timeline for resolution
+        5. How to prevent similar issues
+        
+        Be practical and consider typical organizational constraints.
+        """
+    
+    @_instrumented
+    def suggest_impediment_resolution(self, impediment: str, context: str, refresh: bool = False, stream: bool = False,
+                                      reuse_threshold: Optional[float] = None) -> Union[str, Iterator[str]]:
+        # A sufficiently similar past impediment answers instantly without a model call
+        threshold = self.impediment_reuse_threshold if reuse_threshold is None else reuse_threshold
+        if not refresh:
+            matches = self.impediment_index.search(impediment, context, k=1, min_similarity=threshold)
+            if matches:
+                match = matches[0]
+                reused = (f"{match.resolution}\n\n_♻️ Reused the resolution for a similar past impediment "
+                          f"(\"{match.impediment}\", {match.similarity:.0%} match)._")
+                return iter([reused]) if stream else reused
+        
+        if not self.api_configured:
+            return self.not_configured_message
+        
+        prompt = self._impediment_prompt(impediment, context)
+        
+        def remember(resolution: str):
+            self.impediment_index.add(impediment, context, resolution)
+        
+        if stream:
+            return self._stream('suggest_impediment_resolution', prompt, refresh, "Error generating suggestions", on_complete=remember)
+        
+        try:
+            return self._generate('suggest_impediment_resolution', prompt, refresh, on_complete=remember)
+        except Exception as e:
+            return f"Error generating suggestions: {str(e)}"
+
+    @staticmethod
+    def _recommendations_prompt(context: str) -> str:
+        return f"""
+        As an AI Scrum Master, analyze the following data and provide recommendations:
+
+        {context}
+
+        Based on the provided data, please provide recommendations on:
+        1. What to focus on in the next daily standup.
+        2. What to discuss with the product owner.
+        3. What to bring up in the next sprint planning.
+        4. Any potential risks to the sprint.
+        """
+    
+    @_instrumented
+    def generate_scrum_master_recommendations(self, context: str, refresh: bool = False, stream: bool = False) -> Union[str, Iterator[str]]:
+        if not self.api_configured:
+            return self.not_configured_message
+        
+        prompt = self._recommendations_prompt(context)
+        
+        if stream:
+            return self._stream('generate_scrum_master_recommendations', prompt, refresh, "Error generating recommendations")
+        
+        try:
+            return self._generate('generate_scrum_master_recommendations', prompt, refresh)
+        except Exception as e:
+            return f"Error generating recommendations: {str(e)}"
+
+    
+    def _briefing_prompt(self, sprint_data: SprintData, tracker_context: str, sections: List[str],
+                         impediments: List[str], forecast: Optional[SprintForecast],
+                         backlog_forecast: Optional[BacklogForecast]) -> Tuple[str, Dict]:
+        # Shared context is sent once and only the sections still missing from the cache are requested
+        completion_rate = (sprint_data.completed_story_points / sprint_data.total_story_points) * 100
+        days_remaining = (sprint_data.end_date - datetime.now()).days
+        properties, instructions = {}, []
+        if "sprint_health" in sections:
+            properties["sprint_health"] = {
+                "type": "object",
+                "properties": {"status": {"type": "string", "enum": ["Red", "Yellow", "Green"]}, "analysis": {"type": "string"}},
+                "required": ["status", "analysis"],
+            }
+            instructions.append("- sprint_health: the overall health (status) and an analysis covering key concerns and "
+                                "recommendations, actions for the Scrum Master to take and team motivation suggestions")
+        if "recommendations" in sections:
+            properties["recommendations"] = {"type": "string"}
+            instructions.append("- recommendations: what to focus on in the next daily standup, what to discuss with the "
+                                "product owner, what to bring up in the next sprint planning and potential risks to the sprint")
+        if impediments:
+            properties["impediment_resolutions"] = {
+                "type": "array", "items": {"type": "string"}, "minItems": len(impediments), "maxItems": len(impediments),
+            }
+            listed = "\n".join(f"  {i}. {impediment}" for i, impediment in enumerate(impediments, 1))
+            instructions.append("- impediment_resolutions: one entry per impediment, in this order, each with root cause "
+                                "analysis, 2-3 specific resolution strategies, who should be involved, a timeline and how "
+                                f"to prevent similar issues:\n{listed}")
+        schema = {"type": "object", "properties": properties, "required": list(properties)}
+        # Tracker context from build_tracker_context already carries the sprint summary
+        summary = format_sprint_summary(sprint_data)
+        prompt = f"""
+        As an AI Scrum Master, prepare a sprint briefing from this data:
+        
+        {summary if summary not in tracker_context else f"Sprint {sprint_data.sprint_number}"}
+        Completion Rate: {completion_rate:.1f}%, Days Remaining: {days_remaining}
+        {self._forecast_lines(forecast, backlog_forecast)}
+        {tracker_context}
+        
+        Respond with a single JSON object matching this JSON schema:
+        {json.dumps(schema)}
+        
+        {chr(10).join(instructions)}
+        
+        Use Markdown inside the string values. Be concise but actionable.
+        """
+        return prompt, schema
+    
+    @_instrumented
+    def generate_sprint_briefing(self, sprint_data: SprintData, tracker_context: str, refresh: bool = False,
+                                 forecast: Optional[SprintForecast] = None,
+                                 backlog_forecast: Optional[BacklogForecast] = None,
+                                 impediment_context: str = "") -> SprintBriefing:
+        """Sprint health, recommendations and impediment resolutions from one model call.
+
+        Each section is cached under the same key as its per-section method
+        (analyze_sprint_health with the same forecasts,
+        generate_scrum_master_recommendations with tracker_context and
+        suggest_impediment_resolution with impediment_context), so those
+        calls are answered from the cache afterwards and only missing sections
+        are requested. Sections the JSON response lacks or garbles are fetched
+        with their per-section methods instead.
+        """
+        if not self.api_configured:
+            message = self.not_configured_message
+            return SprintBriefing(message, message, {i: message for i in sprint_data.impediments}, None, "unconfigured")
+        
+        # Section id -> (agent method, per-section prompt)
+        wanted = {
+            "sprint_health": ('analyze_sprint_health', self._sprint_health_prompt(sprint_data, forecast, backlog_forecast)),
+            "recommendations": ('generate_scrum_master_recommendations', self._recommendations_prompt(tracker_context)),
+        }
+        for impediment in sprint_data.impediments:
+            wanted[f"impediment:{impediment}"] = ('suggest_impediment_resolution', self._impediment_prompt(impediment, impediment_context))
+        keys = {section: make_cache_key(self.backend.cache_namespace, prompt) for section, (_, prompt) in wanted.items()}
+        
+        results = {}
+        if not refresh:
+            for section, (method, _) in wanted.items():
+                cached = self.cache.get(keys[section], method)
+                if cached is not None:
+                    results[section] = cached
+        missing = [section for section in wanted if section not in results]
+        source = "cache"
+        
+        if missing:
+            impediments = [section.split(":", 1)[1] for section in missing if section.startswith("impediment:")]
+            prompt, schema = self._briefing_prompt(sprint_data, tracker_context, missing, impediments, forecast, backlog_forecast)
+            
+            def call() -> str:
+                text = self.backend.generate_json(prompt, schema)
+                self._record_tokens('generate_sprint_briefing', prompt, text)
+                return text
+            
+            try:
+                text = self.single_flight.do(make_cache_key(self.backend.cache_namespace, prompt), call)
+                parsed = parse_briefing_sections(text, impediments)
+            except Exception:
+                parsed = {}
+            for section in missing:
+                if section in parsed:
+                    method, _ = wanted[section]
+                    self.cache.set(keys[section], method, parsed[section])
+                    if section.startswith("impediment:"):
+                        self.impediment_index.add(section.split(":", 1)[1], impediment_context, parsed[section])
+                    results[section] = parsed[section]
+            source = "batched"
+            
+            fallback = [section for section in missing if section not in parsed]
+            if fallback:
+                source = "per-section"
+                results.update(self._briefing_fallback(fallback, sprint_data, tracker_context, refresh,
+                                                       forecast, backlog_forecast, impediment_context))
+        
+        health_status = _HEALTH_STATUS_RE.search(results["sprint_health"])
+        return SprintBriefing(
+            sprint_health=results["sprint_health"],
+            recommendations=results["recommendations"],
+            impediment_resolutions={i: results[f"impediment:{i}"] for i in sprint_data.impediments},
+            health_status=health_status.group(1) if health_status else None,
+            source=source,
+        )
+    
+    def _briefing_fallback(self, sections: List[str], sprint_data: SprintData, tracker_context: str, refresh: bool,
+                           forecast: Optional[SprintForecast], backlog_forecast: Optional[BacklogForecast],
+                           impediment_context: str) -> Dict[str, str]:
+        def run(section: str) -> str:
+            if section == "sprint_health":
+                return self.analyze_sprint_health(sprint_data, refresh=refresh, forecast=forecast, backlog_forecast=backlog_forecast)
+            if section == "recommendations":
+                return self.generate_scrum_master_recommendations(tracker_context, refresh=refresh)
+            return self.suggest_impediment_resolution(section.split(":", 1)[1], impediment_context, refresh=refresh)
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(sections)), thread_name_prefix="briefing") as executor:
+            return dict(zip(sections, executor.map(run, sections)))
\ No newline at end of file
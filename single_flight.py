@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CallAbandonedError(Exception):
+    """The leader of a shared call was cancelled or interrupted before the call finished."""
+
+
+def _is_cancellation(error: BaseException) -> bool:
+    # asyncio.CancelledError, KeyboardInterrupt, GeneratorExit: the caller went away, the work did not fail
+    return not isinstance(error, Exception) or isinstance(error, CancelledError)
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one in-flight call.
+
+    The first caller for a key (the leader) does the work; callers arriving
+    while it runs wait for the leader's result instead of repeating the
+    call. Works for threads (Streamlit sessions) and asyncio callers alike
+    because followers wait on a concurrent.futures.Future. A leader's error
+    is raised in its followers too, but a cancelled leader is not: do() and
+    do_async() followers then elect a new leader and run the call again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    def join_or_lead(self, key: str) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            self._stats["leaders"] += 1
+            return future, True
+
+    def complete(self, key: str, future: Future, result: Any = None, error: Optional[BaseException] = None):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            if _is_cancellation(error):
+                # Followers must not inherit the leader's cancellation
+                error = CallAbandonedError("The shared call was cancelled before it finished")
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        future, leader = self.join_or_lead(key)
+        while not leader:
+            try:
+                return future.result()
+            except CallAbandonedError:
+                future, leader = self.join_or_lead(key)
+        try:
+            result = fn()
+        except BaseException as e:
+            self.complete(key, future, error=e)
+            raise
+        self.complete(key, future, result=result)
+        return result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        future, leader = self.join_or_lead(key)
+        while not leader:
+            try:
+                # shield: a cancelled follower must not cancel the future the others wait on
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except CallAbandonedError:
+                future, leader = self.join_or_lead(key)
+        try:
+            result = await fn()
+        except BaseException as e:
+            self.complete(key, future, error=e)
+            raise
+        self.complete(key, future, result=result)
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls)
+        total = stats["leaders"] + stats["coalesced"]
+        stats["coalesced_ratio"] = stats["coalesced"] / total if total else 0.0
+        return stats
+
+
+_shared_single_flight: Optional[SingleFlight] = None
+_shared_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide instance so identical prompts from different sessions coalesce."""
+    global _shared_single_flight
+    with _shared_lock:
+        if _shared_single_flight is None:
+            _shared_single_flight = SingleFlight()
+        return _shared_single_flight
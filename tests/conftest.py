@@ -0,0 +1,22 @@
+import os
+import sys
+import time
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Empty paths keep every process-wide store in memory, so no test touches the user's files
+for _variable in ("SCRUM_AGENT_CACHE_PATH", "SCRUM_AGENT_IMPEDIMENT_INDEX_PATH", "SCRUM_AGENT_PROJECT_PATH"):
+    os.environ[_variable] = ""
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    """Runs the test in a time zone behind UTC."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
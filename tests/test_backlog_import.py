@@ -0,0 +1,23 @@
+import io
+
+import pandas as pd
+
+from backlog_import import compact_chunk, import_file
+from project_store import ProjectStore
+
+
+def test_compact_chunk_drops_rows_without_a_key():
+    chunk = pd.DataFrame({"Key": ["S-1", "", None, "  ", " S-2 "], "Summary": ["a", "b", "c", "d", "e"]})
+    frame = compact_chunk(chunk, {"Key": "Story ID", "Summary": "Description"})
+    assert frame["Story ID"].tolist() == ["S-1", "S-2"]
+    assert frame["Description"].tolist() == ["a", "e"]
+    assert frame.attrs["skipped_rows"] == 3
+
+
+def test_import_reports_rows_skipped_for_a_missing_id():
+    store = ProjectStore("")
+    export = io.StringIO("Task ID,Summary,Status\nT-1,Write docs,Open\n,No key,Done\nT-2,Ship it,Closed\n,Also no key,Done\n")
+    report = import_file(export, "tasks", store=store, chunk_rows=2)
+    assert (report.rows, report.skipped_rows) == (2, 2)
+    assert "skipped 2 rows without an ID" in str(report)
+    assert sorted(store.query("tasks")["Task ID"]) == ["T-1", "T-2"]
@@ -0,0 +1,41 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from chart_data import lttb_indices, reduce_series, step_indices
+
+
+def test_lttb_keeps_spikes_in_the_last_bucket():
+    y = np.zeros(10_000)
+    y[[5000, 9950, 9990]] = [10.0, 12.0, -7.0]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        kept = lttb_indices(np.arange(len(y)), y, 100)
+    assert len(kept) == 100
+    assert {0, 5000, 9950, 9990, 9999} <= set(kept.tolist())
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_lttb_keeps_global_extremes_anywhere(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(10, 5000))
+    max_points = int(rng.integers(4, n))
+    y = rng.normal(size=n).cumsum() if seed % 2 else rng.normal(size=n)
+    kept = lttb_indices(np.arange(n), y, max_points)
+    assert len(kept) == max_points
+    assert np.all(np.diff(kept) > 0)
+    assert kept[0] == 0 and kept[-1] == n - 1
+    assert y.argmin() in kept and y.argmax() in kept
+
+
+def test_step_indices_keep_every_change():
+    y = np.repeat([1.0, 3.0, 2.0, 5.0], [10, 5, 7, 3])
+    assert step_indices(y).tolist() == [0, 10, 15, 22, 24]
+
+
+def test_reduce_series_drops_non_finite_and_keeps_dtype():
+    x, y = reduce_series([1, 2, 3, 4], np.array([5, 6, 7, 8]))
+    assert y.dtype == np.int64
+    x, y = reduce_series([1, 2, 3], [1.0, np.nan, 3.0])
+    assert x.tolist() == [1, 3] and y.tolist() == [1.0, 3.0]
@@ -0,0 +1,32 @@
+import pandas as pd
+
+from context_builder import STATUS_ORDER, ContextBuilder
+from llm_resilience import estimate_tokens
+
+
+def _tasks(n):
+    statuses = ["Done", "To Do", "In Progress", "Blocked"]
+    return pd.DataFrame({"Task ID": [f"T-{i}" for i in range(n)], "Status": [statuses[i % 4] for i in range(n)],
+                         "Story Points": [i % 8 for i in range(n)]})
+
+
+def test_small_table_is_sent_whole():
+    context, usage = ContextBuilder(token_budget=500).add_table("Tasks", _tasks(4)).build()
+    assert context.startswith("Tasks (4 rows, CSV):\nTask ID,Status,Story Points\nT-0,Done,0")
+    assert (usage[0].rows_included, usage[0].rows_total, usage[0].summarized) == (4, 4, False)
+
+
+def test_large_table_keeps_top_ranked_rows_within_the_budget():
+    builder = ContextBuilder(token_budget=300)
+    builder.add_text("Sprint Data", "Sprint 7")
+    builder.add_table("Tasks", _tasks(400), priority_column="Status", priority_order=STATUS_ORDER,
+                      summary_columns=["Status"])
+    context, usage = builder.build()
+    tasks = usage[1]
+    assert tasks.summarized and 0 < tasks.rows_included < 400 and tasks.rows_total == 400
+    assert estimate_tokens(context) <= 300
+    lines = context.split("\n")
+    kept = lines[lines.index("Task ID,Status,Story Points") + 1:-1]
+    # Blocked tasks rank first, and there are more of them than fit
+    assert len(kept) == tasks.rows_included and all(",Blocked," in line for line in kept)
+    assert lines[-1].startswith(f"... {400 - tasks.rows_included} more rows omitted")
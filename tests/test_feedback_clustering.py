@@ -0,0 +1,34 @@
+from feedback_clustering import cluster_feedback
+
+FEEDBACK = [
+    "Daily standups run too long",
+    "daily standups run too long!",
+    "The daily standups run way too long",
+    "CI pipeline is flaky",
+    "The CI pipeline is flaky again",
+    "Great pairing sessions with the design team",
+]
+
+
+def test_separable_feedback_forms_one_theme_per_topic():
+    summary = cluster_feedback(FEEDBACK)
+    assert (summary.total_items, summary.unique_items) == (6, 5)
+    themes = {theme.representative: theme for theme in summary.themes}
+    assert [theme.count for theme in summary.themes] == [3, 2, 1]
+    standups = summary.themes[0]
+    # Exact duplicates after normalizing case and punctuation fold into the representative
+    assert standups.representative == "Daily standups run too long"
+    assert standups.examples == ["The daily standups run way too long"]
+    assert "CI" in summary.themes[1].representative
+    assert themes["Great pairing sessions with the design team"].examples == []
+
+
+def test_clustering_is_independent_of_block_size():
+    whole = cluster_feedback(FEEDBACK)
+    blocked = cluster_feedback(FEEDBACK, block_size=2)
+    assert [(t.representative, t.count) for t in whole.themes] == [(t.representative, t.count) for t in blocked.themes]
+
+
+def test_blank_feedback_is_ignored():
+    summary = cluster_feedback(["", "   "])
+    assert (summary.themes, summary.total_items) == ([], 0)
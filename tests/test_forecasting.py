@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+from forecasting import forecast_backlog, forecast_sprint
+
+
+def test_constant_velocity_gives_exact_sprint_percentiles():
+    # 14 points per 14-day sprint is one point a day
+    forecast = forecast_sprint([14, 14, 14], total_points=50, completed_points=30, days_remaining=5, simulations=1000)
+    assert forecast.points_percentiles == {10: 35.0, 50: 35.0, 90: 35.0}
+    assert forecast.completion_probability == 0.0
+
+    finishing = forecast_sprint([14, 14, 14], total_points=50, completed_points=30, days_remaining=25, simulations=1000)
+    assert finishing.points_percentiles == {10: 50.0, 50: 50.0, 90: 50.0}
+    assert finishing.completion_probability == 1.0
+
+
+def test_seeded_sprint_forecast_is_reproducible_and_ordered():
+    args = dict(velocities=[10, 20, 30, 40], total_points=55, completed_points=40, days_remaining=7, simulations=5000)
+    first, second = forecast_sprint(**args, seed=7), forecast_sprint(**args, seed=7)
+    assert first == second
+    low, mid, high = (first.points_percentiles[p] for p in (10, 50, 90))
+    # Seven days at 10/14 to 40/14 points a day deliver 5 to 20 of the 15 points left
+    assert 40 + 5 <= low < mid < high <= 55
+    assert 0.0 < first.completion_probability < 1.0
+
+
+def test_constant_velocity_gives_exact_backlog_percentiles():
+    start = datetime(2025, 1, 6)
+    forecast = forecast_backlog([10, 10], backlog_points=35, start=start, simulations=1000)
+    assert forecast.sprints_percentiles == {50: 4, 85: 4, 95: 4}
+    assert forecast.date_percentiles == {p: start + timedelta(days=56) for p in (50, 85, 95)}
+
+
+def test_seeded_backlog_forecast_is_reproducible_and_bounded():
+    args = dict(velocities=[5, 15, 0], backlog_points=60, start=datetime(2025, 1, 6), simulations=5000)
+    first, second = forecast_backlog(**args, seed=3), forecast_backlog(**args, seed=3)
+    assert first == second
+    sprints = [first.sprints_percentiles[p] for p in (50, 85, 95)]
+    # Zero-velocity sprints are ignored, so between 60/15 and 60/5 sprints
+    assert 4 <= sprints[0] <= sprints[1] <= sprints[2] <= 12
@@ -0,0 +1,62 @@
+import sqlite3
+
+from impediment_index import ImpedimentIndex
+from llm_backends import StubBackend
+from response_cache import ResponseCache
+from scrum_master_agent import ScrumMasterAgent
+
+
+def test_adding_a_known_impediment_replaces_its_resolution(tmp_path):
+    path = str(tmp_path / "impediments.sqlite3")
+    index = ImpedimentIndex(path)
+    index.add("Test environment unavailable", "Blocking QA", "Old resolution")
+    index.add("test environment unavailable!", "blocking QA", "New resolution")
+    index.add("API dependency blocking feature", "", "Another resolution")
+    assert len(index) == 2
+    matches = index.search("Test environment unavailable", "Blocking QA", k=3)
+    assert [m.resolution for m in matches] == ["New resolution", "Another resolution"]
+    # The replacement is persisted, not appended
+    assert len(ImpedimentIndex(path)) == 2
+
+
+def test_duplicates_written_before_upserts_collapse_on_load(tmp_path):
+    path = str(tmp_path / "impediments.sqlite3")
+    index = ImpedimentIndex(path)
+    index.add("Flaky CI", "", "First")
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO impediment_resolutions (impediment, context, resolution, created_at, embedding) "
+                 "SELECT impediment, context, 'Second', created_at + 1, embedding FROM impediment_resolutions")
+    conn.commit()
+    reloaded = ImpedimentIndex(path)
+    assert len(reloaded) == 1
+    assert reloaded.search("Flaky CI")[0].resolution == "Second"
+    assert conn.execute("SELECT COUNT(*) FROM impediment_resolutions").fetchone()[0] == 1
+
+
+def test_search_with_non_positive_k_returns_nothing():
+    index = ImpedimentIndex(None)
+    index.add("Flaky CI", "", "Retry")
+    assert index.search("Flaky CI", k=0) == []
+    assert index.search("Flaky CI", k=-1) == []
+    index.add("flaky ci", "", "Quarantine")
+    assert len(index) == 1 and index.search("Flaky CI")[0].resolution == "Quarantine"
+
+
+def test_search_threshold_separates_rephrasings_from_unrelated_impediments():
+    index = ImpedimentIndex(None)
+    index.add("Test environment is unavailable", "Blocking QA", "Book the staging slot")
+    hit = index.search("The test environment is unavailable", "Blocking QA", k=1, min_similarity=0.9)
+    assert [m.resolution for m in hit] == ["Book the staging slot"] and hit[0].similarity >= 0.9
+    assert index.search("Product owner on vacation", "", k=1, min_similarity=0.9) == []
+
+
+def test_agent_reuses_a_resolution_only_above_the_threshold():
+    backend = StubBackend()
+    agent = ScrumMasterAgent(backend=backend, cache=ResponseCache(path=None), resilient=False,
+                             impediment_index=ImpedimentIndex(None))
+    agent.suggest_impediment_resolution("Test environment is unavailable", "Blocking QA")
+    assert backend.calls == 1
+    reused = agent.suggest_impediment_resolution("The test environment is unavailable", "Blocking QA")
+    assert "Reused the resolution" in reused and backend.calls == 1
+    fresh = agent.suggest_impediment_resolution("Product owner on vacation", "")
+    assert "Reused the resolution" not in fresh and backend.calls == 2
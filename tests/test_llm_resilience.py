@@ -0,0 +1,56 @@
+import time
+
+import pytest
+
+from llm_backends import LLMBackendError, StubBackend
+from llm_resilience import CircuitBreaker, DeadlineExceededError, RateLimiter, ResilientBackend
+
+
+def _resilient(inner, call_timeout=5.0):
+    return ResilientBackend(inner, RateLimiter(6000, 1e9), CircuitBreaker(), call_timeout=call_timeout)
+
+
+class _StallingBackend(StubBackend):
+    def generate_stream(self, prompt):
+        yield "first "
+        yield "second "
+        time.sleep(2)
+        yield "never read"
+
+
+def test_stream_stalled_mid_response_hits_the_deadline():
+    backend = _resilient(_StallingBackend(), call_timeout=0.3)
+    received = []
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        for chunk in backend.generate_stream("prompt"):
+            received.append(chunk)
+    assert received == ["first ", "second "]
+    assert time.monotonic() - started < 1.0
+
+
+class _StatusBackend(StubBackend):
+    def __init__(self, status):
+        super().__init__()
+        self.status = status
+
+    def generate(self, prompt):
+        raise LLMBackendError("rejected", status=self.status)
+
+
+def test_client_errors_do_not_open_the_circuit():
+    backend = _resilient(_StatusBackend(400))
+    for _ in range(backend.breaker.failure_threshold + 2):
+        with pytest.raises(LLMBackendError):
+            backend.generate("bad prompt")
+    assert backend.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_server_errors_open_the_circuit():
+    backend = _resilient(_StatusBackend(503))
+    backend.retry_policy.base_delay = 0.0
+    with pytest.raises(LLMBackendError):
+        backend.generate("prompt")
+    with pytest.raises(LLMBackendError):
+        backend.generate("prompt")
+    assert backend.breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,71 @@
+import urllib.request
+
+import metrics
+from metrics import MetricsRegistry
+
+
+def test_counter_exposition():
+    registry = MetricsRegistry()
+    calls = registry.counter("widget_calls_total", "Widget calls", ["kind"])
+    calls.labels("fast").inc()
+    calls.labels("fast").inc(2)
+    calls.labels('sl"ow').inc()
+    assert registry.render() == (
+        "# HELP widget_calls_total Widget calls\n"
+        "# TYPE widget_calls_total counter\n"
+        'widget_calls_total{kind="fast"} 3\n'
+        'widget_calls_total{kind="sl\\"ow"} 1\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative_and_end_at_inf():
+    registry = MetricsRegistry()
+    latency = registry.histogram("widget_seconds", "Widget latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+    assert registry.render().splitlines()[2:] == [
+        'widget_seconds_bucket{le="0.1"} 2',
+        'widget_seconds_bucket{le="1"} 3',
+        'widget_seconds_bucket{le="+Inf"} 4',
+        "widget_seconds_sum 3.65",
+        "widget_seconds_count 4",
+    ]
+
+
+def test_register_stats_exports_numeric_entries_as_gauges():
+    registry = MetricsRegistry()
+    registry.register_stats("cache", lambda: {"hits": 5, "ratio": 0.5, "flag": True, "name": "lru"}, "Cache stats")
+    assert registry.render() == (
+        "# HELP cache_hits Cache stats: hits\n"
+        "# TYPE cache_hits gauge\n"
+        "cache_hits 5\n"
+        "# HELP cache_ratio Cache stats: ratio\n"
+        "# TYPE cache_ratio gauge\n"
+        "cache_ratio 0.5\n"
+    )
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    counter = registry.counter("widget_calls_total", "Widget calls", ["kind"])
+    histogram = registry.histogram("widget_seconds", "Widget latency")
+    assert counter is histogram is metrics._NOOP
+    counter.labels("fast").inc()
+    with histogram.time():
+        pass
+    registry.register_stats("cache", lambda: {"hits": 1}, "Cache stats")
+    assert registry.render() == "\n"
+
+
+def test_metrics_server_listens_on_localhost_by_default(monkeypatch):
+    monkeypatch.delenv("SCRUM_AGENT_METRICS_HOST", raising=False)
+    monkeypatch.setattr(metrics, "_server", None)
+    server = metrics.start_metrics_server(0)
+    try:
+        host, port = server.server_address[:2]
+        assert host == "127.0.0.1"
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.headers["Content-Type"] == metrics.CONTENT_TYPE
+    finally:
+        server.shutdown()
+        server.server_close()
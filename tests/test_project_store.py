@@ -0,0 +1,24 @@
+from datetime import datetime
+
+import pandas as pd
+
+from project_store import ProjectStore
+
+
+def test_updates_read_back_the_same_wall_clock_time_from_every_write_path(new_york):
+    store = ProjectStore("")
+    moment = datetime(2025, 1, 13, 23, 30)
+    store.add_update("Alice", "From the UI", timestamp=moment)
+    store.bulk_insert("updates", pd.DataFrame({"Team Member": ["Bob"], "Update": ["Imported"], "Timestamp": [moment]}))
+    frame = store.query("updates")
+    assert frame["Timestamp"].tolist() == [pd.Timestamp(moment)] * 2
+
+
+def test_updates_without_a_timestamp_are_stamped_with_local_now(new_york):
+    store = ProjectStore("")
+    before = pd.Timestamp(datetime.now()).floor("s")
+    store.add_update("Alice", "Now")
+    store.bulk_insert("updates", pd.DataFrame({"Team Member": ["Bob"], "Update": ["Now too"]}))
+    after = pd.Timestamp(datetime.now())
+    for stamp in store.query("updates")["Timestamp"]:
+        assert before <= stamp <= after
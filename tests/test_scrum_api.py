@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from impediment_index import ImpedimentIndex
+from llm_backends import StubBackend
+from project_store import ProjectStore
+from response_cache import ResponseCache
+from scrum_api import ScrumAPI
+from scrum_master_agent import ScrumMasterAgent
+
+
+@pytest.fixture
+def api():
+    agent = ScrumMasterAgent(backend=StubBackend(), cache=ResponseCache(path=None), resilient=False,
+                             impediment_index=ImpedimentIndex(path=None))
+    api = ScrumAPI(agent=agent, store=ProjectStore(""))
+    yield api
+    api.executor.shutdown(wait=False)
+
+
+@pytest.mark.parametrize("path, payload", [
+    ("/v1/sprint-health", {"sprint_number": "seven"}),
+    ("/v1/sprint-health", {"sprint_number": [7]}),
+    ("/v1/sprint-health", {"sprint": {"sprint_number": 1, "start_date": "2025-01-06", "end_date": "2025-01-20",
+                                      "total_story_points": 50, "completed_story_points": 30},
+                           "velocities": ["fast"]}),
+    ("/v1/recommendations", {"token_budget": "lots"}),
+    ("/v1/recommendations", {"token_budget": 0}),
+    ("/v1/sprint-briefing", {"token_budget": {"n": 1}}),
+    ("/v1/retrospective-insights", {"sprint_number": "latest"}),
+])
+def test_non_numeric_fields_are_rejected_with_400(api, path, payload):
+    status, body = asyncio.run(api.dispatch("POST", path, payload))
+    assert status == 400, body
+
+
+@pytest.mark.parametrize("path, payload", [
+    ("/v1/impediment-resolution", {"impediment": "CI is down", "context": {"team": "A"}}),
+    ("/v1/impediment-resolution", {"impediment": "CI is down", "context": 42}),
+    ("/v1/recommendations", {"context": ["backlog"]}),
+    ("/v1/sprint-briefing", {"context": 1}),
+    ("/v1/sprint-briefing", {"context": "Sprint 7", "impediment_context": ["CI is down"]}),
+])
+def test_non_string_context_fields_are_rejected_with_400(api, path, payload):
+    status, body = asyncio.run(api.dispatch("POST", path, payload))
+    assert status == 400, body
+
+
+@pytest.mark.parametrize("context", ["", None])
+def test_empty_context_is_accepted(api, context):
+    status, body = asyncio.run(api.dispatch("POST", "/v1/impediment-resolution", {"impediment": "CI is down", "context": context}))
+    assert status == 200, body
+
+
+def test_malformed_content_length_gets_a_400_response(api):
+    async def exchange():
+        server = await asyncio.start_server(api.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /v1/recommendations HTTP/1.1\r\nHost: test\r\nContent-Length: ten\r\n\r\n")
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return response
+
+    response = asyncio.run(exchange())
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert b"Content-Length" in response and b"Connection: close" in response
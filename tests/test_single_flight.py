@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from single_flight import SingleFlight
+
+CALLERS = 8
+
+
+def test_concurrent_threads_share_one_call():
+    flight = SingleFlight()
+    calls = []
+    started = threading.Barrier(CALLERS)
+
+    def work():
+        calls.append(1)
+        time.sleep(0.2)
+        return "answer"
+
+    def caller(_):
+        started.wait()
+        return flight.do("key", work)
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        results = list(pool.map(caller, range(CALLERS)))
+    assert results == ["answer"] * CALLERS
+    assert len(calls) == 1
+    stats = flight.stats()
+    assert (stats["leaders"], stats["coalesced"], stats["in_flight"]) == (1, CALLERS - 1, 0)
+
+
+def test_leader_error_reaches_every_thread():
+    flight = SingleFlight()
+    started = threading.Barrier(CALLERS)
+
+    def work():
+        time.sleep(0.2)
+        raise ValueError("backend down")
+
+    def caller(_):
+        started.wait()
+        with pytest.raises(ValueError, match="backend down"):
+            flight.do("key", work)
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        list(pool.map(caller, range(CALLERS)))
+    assert flight.stats()["leaders"] == 1
+
+
+def test_concurrent_coroutines_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "answer"
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("key", work) for _ in range(CALLERS)))
+
+    assert asyncio.run(main()) == ["answer"] * CALLERS
+    assert len(calls) == 1
+    assert flight.stats()["coalesced"] == CALLERS - 1
+
+
+def test_leader_error_reaches_every_coroutine():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        raise ValueError("backend down")
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("key", work) for _ in range(CALLERS)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelled_leader_hands_the_call_to_a_follower():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "answer"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do_async("key", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do_async("key", work)) for _ in range(CALLERS - 1)]
+        await asyncio.sleep(0.02)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled()
+        return results
+
+    assert asyncio.run(main()) == ["answer"] * (CALLERS - 1)
+    # One call by the cancelled leader, one by the follower elected after it
+    assert len(calls) == 2
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_cancelled_follower_does_not_affect_the_others():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.1)
+        return "answer"
+
+    async def main():
+        tasks = [asyncio.ensure_future(flight.do_async("key", work)) for _ in range(3)]
+        await asyncio.sleep(0.02)
+        tasks[1].cancel()
+        return await asyncio.gather(tasks[0], tasks[2])
+
+    assert asyncio.run(main()) == ["answer", "answer"]
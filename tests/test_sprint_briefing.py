@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from impediment_index import ImpedimentIndex
+from llm_backends import OpenAICompatibleBackend, StubBackend
+from response_cache import ResponseCache
+from scrum_master_agent import ScrumMasterAgent, SprintData
+
+SPRINT = SprintData(7, datetime(2025, 1, 6), datetime(2025, 1, 20), 50, 30, ["Alice"], ["CI is down"], [])
+
+
+def _agent(backend):
+    return ScrumMasterAgent(backend=backend, cache=ResponseCache(path=None), resilient=False,
+                            impediment_index=ImpedimentIndex(path=None))
+
+
+def test_unconfigured_briefing_is_not_reported_as_cached():
+    agent = _agent(OpenAICompatibleBackend(base_url=""))
+    briefing = agent.generate_sprint_briefing(SPRINT, "tracker context")
+    assert briefing.source == "unconfigured"
+    assert briefing.sprint_health == agent.not_configured_message
+
+
+def test_repeated_briefing_comes_from_the_cache():
+    agent = _agent(StubBackend())
+    assert agent.generate_sprint_briefing(SPRINT, "tracker context").source != "cache"
+    assert agent.generate_sprint_briefing(SPRINT, "tracker context").source == "cache"
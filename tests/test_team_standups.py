@@ -0,0 +1,27 @@
+import math
+import time
+
+import pytest
+
+from impediment_index import ImpedimentIndex
+from llm_backends import StubBackend
+from response_cache import ResponseCache
+from scrum_master_agent import ScrumMasterAgent
+
+LATENCY = 0.2
+
+
+@pytest.mark.parametrize("team_size, max_concurrency", [(5, 8), (8, 4), (16, 4), (16, 8)])
+def test_wall_clock_scales_with_concurrency_limit_not_team_size(team_size, max_concurrency):
+    agent = ScrumMasterAgent(backend=StubBackend(latency=LATENCY), cache=ResponseCache(path=None), resilient=False,
+                             impediment_index=ImpedimentIndex(path=None))
+    members = [f"Member {i}" for i in range(team_size)]
+    started = time.perf_counter()
+    results = dict(agent.generate_team_standup_questions(members, "API work", max_concurrency=max_concurrency))
+    elapsed = time.perf_counter() - started
+
+    assert sorted(results) == sorted(members)
+    assert not any(text.startswith("Error") for text in results.values())
+    waves = math.ceil(team_size / max_concurrency)
+    # Every wave of max_concurrency calls takes one latency; less than one extra wave of slack
+    assert waves * LATENCY * 0.95 <= elapsed < (waves + 0.8) * LATENCY
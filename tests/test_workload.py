@@ -0,0 +1,52 @@
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+
+from project_store import ProjectStore
+from workload import WorkloadEngine
+
+
+def _tasks(status):
+    return pd.DataFrame({"task_id": ["T-1", "T-2"], "assignee": ["Alice", "Bob"], "status": status,
+                         "story_points": [3, 5]})
+
+
+def test_sync_sees_replaced_rows_whatever_their_timestamps():
+    store = ProjectStore("")
+    engine = WorkloadEngine()
+    store.bulk_insert("tasks", _tasks("In Progress").assign(updated_at=2_000_000_000.0))
+    engine.sync(store)
+    # Same ids (the row count does not change) with an earlier wall-clock stamp
+    store.bulk_insert("tasks", _tasks("Done").assign(updated_at=1_000_000_000.0))
+    engine.sync(store)
+    assert engine.summary(["Alice", "Bob"], pd.Timestamp("2025-01-06"), pd.Timestamp("2025-01-10"))["wip"].sum() == 0
+    store.set_task_status("T-1", "In Review")
+    engine.sync(store)
+    assert engine.summary(["Alice", "Bob"], pd.Timestamp("2025-01-06"), pd.Timestamp("2025-01-10"))["wip"].to_dict() == {
+        "Alice": 1, "Bob": 0}
+
+
+def test_rows_from_before_the_rev_column_are_synced(tmp_path):
+    path = str(tmp_path / "project.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE tasks (task_id TEXT PRIMARY KEY, description TEXT NOT NULL DEFAULT '', status TEXT, "
+                 "assignee TEXT, updated_at REAL NOT NULL)")
+    conn.execute("INSERT INTO tasks (task_id, status, assignee, updated_at) VALUES ('T-1', 'In Progress', 'Alice', 1.0)")
+    conn.commit()
+    conn.close()
+    engine = WorkloadEngine()
+    engine.sync(ProjectStore(path))
+    assert engine.task_count == 1
+
+
+def test_time_logged_near_midnight_counts_on_its_local_day(new_york):
+    store = ProjectStore("")
+    store.bulk_insert("tasks", _tasks("In Progress"))
+    # 23:30 local on Friday is already Saturday in UTC
+    store.log_time("Alice", 6.0, "T-1", logged_at=datetime(2025, 1, 10, 23, 30))
+    store.log_time("Bob", 2.0, "T-2", logged_at=datetime(2025, 1, 10, 0, 30))
+    engine = WorkloadEngine()
+    engine.sync(store)
+    summary = engine.summary(["Alice", "Bob"], datetime(2025, 1, 10), datetime(2025, 1, 10, 23, 59))
+    assert summary["hours_per_day"].to_dict() == {"Alice": 6.0, "Bob": 2.0}
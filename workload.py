@@ -0,0 +1,171 @@
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Started but not finished; Blocked work still occupies its assignee
+WIP_STATUSES = ("In Progress", "In Review", "Blocked")
+WORKLOAD_METRICS = ("hours_per_day", "wip", "points_in_progress")
+TASK_COLUMNS = ["task_id", "assignee", "status", "story_points"]
+
+
+class WorkloadEngine:
+    """Per-member workload from task assignments and time logs.
+
+    Tasks are (task_id, assignee, status, story_points) rows; upserting a
+    batch subtracts the previous state of the changed tasks from the
+    per-member WIP and points totals and adds the new state, with grouped
+    sums over the batch only. Time logs are (member, hours, logged_at) rows
+    folded into per-member daily totals the same way. sync() pulls only the
+    rows written to a ProjectStore since the last call, so a status change
+    costs a couple of indexed queries, not a rescan of every task.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._digest = hashlib.blake2b(digest_size=16)
+        self._clear()
+
+    def _clear(self):
+        self._tasks = pd.DataFrame(columns=TASK_COLUMNS[1:]).rename_axis("task_id")
+        self._wip = pd.Series(dtype="float64")
+        self._points = pd.Series(dtype="float64")
+        # Hours per (member, day)
+        self._hours = pd.Series(dtype="float64", index=pd.MultiIndex.from_arrays([[], []], names=["member", "day"]))
+        # Store watermarks for sync()
+        self._tasks_rev = -1
+        self._last_log_id = 0
+
+    def fingerprint(self) -> str:
+        return self._digest.hexdigest()
+
+    def _update_digest(self, frame: pd.DataFrame):
+        self._digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+
+    @property
+    def task_count(self) -> int:
+        return len(self._tasks)
+
+    def upsert_tasks(self, tasks: pd.DataFrame):
+        if tasks.empty:
+            return
+        batch = tasks[TASK_COLUMNS].drop_duplicates("task_id", keep="last").set_index("task_id")
+        batch["assignee"] = batch["assignee"].astype(object).where(batch["assignee"].notna(), None)
+        batch["story_points"] = pd.to_numeric(batch["story_points"], errors="coerce").fillna(0.0).astype("float64")
+        with self._lock:
+            # Hash lookup of the batch ids; Index.isin() on string ids is a Python loop
+            positions = self._tasks.index.get_indexer(batch.index)
+            positions = positions[positions >= 0]
+            self._apply(self._tasks.iloc[positions], -1.0)
+            self._apply(batch, 1.0)
+            kept = np.ones(len(self._tasks), dtype=bool)
+            kept[positions] = False
+            self._tasks = pd.concat([self._tasks[kept], batch])
+            self._update_digest(batch.reset_index())
+
+    def _apply(self, tasks: pd.DataFrame, sign: float):
+        active = tasks[tasks["status"].isin(WIP_STATUSES) & tasks["assignee"].notna()]
+        if active.empty:
+            return
+        grouped = active.groupby("assignee")
+        self._wip = self._wip.add(grouped.size().astype("float64") * sign, fill_value=0.0)
+        self._points = self._points.add(grouped["story_points"].sum() * sign, fill_value=0.0)
+
+    def add_time_logs(self, logs: pd.DataFrame):
+        if logs.empty:
+            return
+        days = pd.to_datetime(logs["logged_at"]).dt.normalize()
+        hours = pd.to_numeric(logs["hours"], errors="coerce").fillna(0.0)
+        daily = hours.groupby([logs["member"].to_numpy(), days.to_numpy()]).sum().rename_axis(["member", "day"])
+        with self._lock:
+            self._hours = daily.add(self._hours, fill_value=0.0) if len(self._hours) else daily
+            self._update_digest(logs[["member", "hours", "logged_at"]])
+
+    def reset(self):
+        with self._lock:
+            self._clear()
+            # Keeps the fingerprint moving so figures of the old state are never reused
+            self._digest.update(b"reset")
+
+    def sync(self, store):
+        """Apply the tasks and time logs written to store since the previous sync."""
+        self._pull(store)
+        if self.task_count != store.count("tasks"):
+            # Tasks were deleted (e.g. a replacing import); deletions are not incremental, so rebuild
+            self.reset()
+            self._pull(store)
+
+    def _pull(self, store):
+        tasks = store.tasks_changed_since(self._tasks_rev)
+        if not tasks.empty:
+            self.upsert_tasks(tasks)
+            self._tasks_rev = int(tasks["rev"].max())
+        logs = store.time_logs_since(self._last_log_id)
+        if not logs.empty:
+            self.add_time_logs(logs.assign(logged_at=pd.to_datetime(logs["logged_at"], unit="s")))
+            self._last_log_id = int(logs["id"].max())
+
+    def summary(self, members: List[str], start: datetime, end: datetime) -> pd.DataFrame:
+        """One row per member: hours/day over [start, end], WIP count and points in progress.
+
+        Rows follow members, then any other assignee or logger with work.
+        Hours/day divides the logged hours by the working days in the window
+        up to the last day anyone logged time.
+        """
+        start_day, end_day = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        with self._lock:
+            days = self._hours.index.get_level_values("day")
+            in_window = self._hours[(days >= start_day) & (days <= end_day)]
+            logged = in_window.groupby(level="member").sum()
+            wip, points = self._wip.copy(), self._points.copy()
+            # A day nobody has logged on yet (usually today) is not counted
+            last_day = in_window.index.get_level_values("day").max() if len(in_window) else end_day
+        working_days = max(1, int(np.busday_count(start_day.date(), (min(end_day, last_day) + pd.Timedelta(days=1)).date())))
+
+        others = sorted(set(wip[wip > 0].index) | set(points[points > 0].index) | set(logged.index))
+        index = pd.Index(list(members) + [name for name in others if name not in members], name="member")
+        return pd.DataFrame({
+            "hours_per_day": (logged / working_days).reindex(index, fill_value=0.0).round(2),
+            "wip": wip.reindex(index, fill_value=0.0).round().astype("int64"),
+            "points_in_progress": points.reindex(index, fill_value=0.0),
+        })
+
+
+def workload_thresholds(summary: pd.DataFrame, k: float = 1.0) -> Dict[str, float]:
+    """Overload threshold per metric: the team mean plus k standard deviations."""
+    values = summary[list(WORKLOAD_METRICS)]
+    return (values.mean() + k * values.std(ddof=0)).to_dict()
+
+
+def flag_workload(summary: pd.DataFrame, k: float = 1.0) -> pd.DataFrame:
+    """Adds overloaded (any metric above its threshold) and underloaded (hours below mean - k std) columns.
+
+    Thresholds come from the team's own spread, so nobody is flagged when
+    everyone carries the same load.
+    """
+    values = summary[list(WORKLOAD_METRICS)]
+    spread = values.std(ddof=0)
+    above = values.gt(values.mean() + k * spread) & spread.gt(0)
+    hours = values["hours_per_day"]
+    return summary.assign(
+        overloaded=above.any(axis=1),
+        overloaded_on=[", ".join(m for m in WORKLOAD_METRICS if row[m]) for row in above.to_dict("records")],
+        underloaded=hours.lt(hours.mean() - k * spread["hours_per_day"]) & (spread["hours_per_day"] > 0),
+    )
+
+
+_shared_engine: Optional[WorkloadEngine] = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_workload_engine(store) -> WorkloadEngine:
+    """Process-wide engine over the shared project store, synced on every call."""
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = WorkloadEngine()
+        _shared_engine.sync(store)
+        return _shared_engine